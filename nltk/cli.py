@@ -43,7 +43,7 @@ def tokenize_file(language, preserve_line, processes, encoding, delimiter):
     """This command tokenizes text stream using nltk.word_tokenize"""
     with click.get_text_stream("stdin", encoding=encoding) as fin:
         with click.get_text_stream("stdout", encoding=encoding) as fout:
-            # If it's single process, joblib parallelization is slower,
+            # If it's single process, parallelization is slower,
             # so just process line by line normally.
             if processes == 1:
                 for line in tqdm(fin.readlines()):
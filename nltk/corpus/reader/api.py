@@ -10,8 +10,10 @@
 API for corpus readers.
 """
 
+import hashlib
 import os
 import re
+import types
 from collections import defaultdict
 from itertools import chain
 
@@ -38,7 +40,7 @@ class CorpusReader:
     be used to select which portion of the corpus should be returned.
     """
 
-    def __init__(self, root, fileids, encoding="utf8", tagset=None):
+    def __init__(self, root, fileids, encoding="utf8", tagset=None, index_dir=None):
         """
         :type root: PathPointer or str
         :param root: A path pointer identifying the root directory for
@@ -69,6 +71,10 @@ class CorpusReader:
         :param tagset: The name of the tagset used by this corpus, to be used
               for normalizing or converting the POS tags returned by the
               ``tagged_...()`` methods.
+        :param index_dir: A directory in which the corpus views of this
+              reader keep their toknum/filepos mappings (see the
+              ``index_file`` parameter of ``StreamBackedCorpusView``), or
+              None.  Readers pass ``index_file()`` to their views to use it.
         """
         # Convert the root to a path pointer, if necessary.
         if isinstance(root, str) and not isinstance(root, PathPointer):
@@ -113,6 +119,7 @@ class CorpusReader:
            this corpus.  If ``encoding`` is None, then the file
            contents are processed using byte strings."""
         self._tagset = tagset
+        self._index_dir = index_dir
 
     def __repr__(self):
         if isinstance(self._root, ZipFilePathPointer):
@@ -242,6 +249,30 @@ class CorpusReader:
         else:
             return self._encoding
 
+    def index_file(self, fileid, view, *config):
+        """
+        Return the index file for the corpus view ``view`` of the given
+        file, or None if this reader has no ``index_dir``.  Each kind of
+        view of a file (e.g. ``"words"`` or ``"sents"``) reads it with a
+        different block reader, and so needs its own index file; and so do
+        views whose block readers are configured differently, e.g. with
+        other tokenizers.
+
+        :type fileid: str
+        :param fileid: The file identifier of the file read by the view.
+        :type view: str
+        :param view: The name of the kind of view.
+        :param config: The objects that the view's block reader depends
+            on, such as tokenizers.
+        :rtype: str or None
+        """
+        if self._index_dir is None:
+            return None
+        key = [repr(self.abspath(fileid))] + [_index_key(obj) for obj in config]
+        digest = hashlib.sha1(repr(key).encode("utf8")).hexdigest()[:16]
+        name = re.sub(r"[^\w.-]", "_", os.path.basename(fileid))
+        return os.path.join(self._index_dir, f"{name}.{view}.{digest}.idx")
+
     def _get_root(self):
         return self._root
 
@@ -254,6 +285,27 @@ class CorpusReader:
     )
 
 
+def _index_key(obj):
+    """
+    Describe ``obj`` by a string that is the same in every process: the
+    qualified name of functions, and the ``repr`` of other objects, or if
+    that is the default ``repr``, their class and simple attributes.
+    """
+    if isinstance(obj, types.MethodType):
+        return f"{_index_key(obj.__self__)}.{obj.__name__}"
+    if isinstance(obj, (types.FunctionType, types.BuiltinFunctionType, type)):
+        return f"{obj.__module__}.{obj.__qualname__}"
+    cls = type(obj)
+    if cls.__repr__ is not object.__repr__:
+        return repr(obj)
+    attrs = sorted(
+        (name, value)
+        for name, value in getattr(obj, "__dict__", {}).items()
+        if isinstance(value, (str, int, float, bool, type(None)))
+    )
+    return f"{cls.__module__}.{cls.__qualname__}{attrs!r}"
+
+
 ######################################################################
 # { Corpora containing categorized items
 ######################################################################
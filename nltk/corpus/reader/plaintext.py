@@ -42,6 +42,7 @@ class PlaintextCorpusReader(CorpusReader):
         sent_tokenizer=None,
         para_block_reader=read_blankline_block,
         encoding="utf8",
+        index_dir=None,
     ):
         r"""
         Construct a new plaintext corpus reader for a set of documents
@@ -58,8 +59,11 @@ class PlaintextCorpusReader(CorpusReader):
             into words.
         :param para_block_reader: The block reader used to divide the
             corpus into paragraph blocks.
+        :param index_dir: A directory in which to keep an index of each
+            file, so that its length and tokens can later be found without
+            reading the file first.
         """
-        CorpusReader.__init__(self, root, fileids, encoding)
+        CorpusReader.__init__(self, root, fileids, encoding, index_dir=index_dir)
         self._word_tokenizer = word_tokenizer
         self._sent_tokenizer = sent_tokenizer
         self._para_block_reader = para_block_reader
@@ -72,7 +76,12 @@ class PlaintextCorpusReader(CorpusReader):
         """
         return concat(
             [
-                self.CorpusView(path, self._read_word_block, encoding=enc)
+                self.CorpusView(
+                    path,
+                    self._read_word_block,
+                    encoding=enc,
+                    index_file=self._index_file(fileid, "words"),
+                )
                 for (path, enc, fileid) in self.abspaths(fileids, True, True)
             ]
         )
@@ -92,7 +101,12 @@ class PlaintextCorpusReader(CorpusReader):
 
         return concat(
             [
-                self.CorpusView(path, self._read_sent_block, encoding=enc)
+                self.CorpusView(
+                    path,
+                    self._read_sent_block,
+                    encoding=enc,
+                    index_file=self._index_file(fileid, "sents"),
+                )
                 for (path, enc, fileid) in self.abspaths(fileids, True, True)
             ]
         )
@@ -112,11 +126,25 @@ class PlaintextCorpusReader(CorpusReader):
 
         return concat(
             [
-                self.CorpusView(path, self._read_para_block, encoding=enc)
+                self.CorpusView(
+                    path,
+                    self._read_para_block,
+                    encoding=enc,
+                    index_file=self._index_file(fileid, "paras"),
+                )
                 for (path, enc, fileid) in self.abspaths(fileids, True, True)
             ]
         )
 
+    def _index_file(self, fileid, view):
+        return self.index_file(
+            fileid,
+            view,
+            self._word_tokenizer,
+            self._sent_tokenizer,
+            self._para_block_reader,
+        )
+
     def _read_word_block(self, stream):
         words = []
         for i in range(20):  # Read 20 lines at a time.
@@ -218,8 +246,13 @@ class EuroparlCorpusReader(PlaintextCorpusReader):
         """
         return concat(
             [
-                self.CorpusView(fileid, self._read_para_block, encoding=enc)
-                for (fileid, enc) in self.abspaths(fileids, True)
+                self.CorpusView(
+                    path,
+                    self._read_para_block,
+                    encoding=enc,
+                    index_file=self._index_file(fileid, "chapters"),
+                )
+                for (path, enc, fileid) in self.abspaths(fileids, True, True)
             ]
         )
 
@@ -10,7 +10,12 @@ import bisect
 import os
 import pickle
 import re
+import sys
 import tempfile
+import threading
+import warnings
+from array import array
+from collections import OrderedDict
 from functools import reduce
 from xml.etree import ElementTree
 
@@ -20,7 +25,7 @@ from nltk.data import (
     SeekableUnicodeStreamReader,
     ZipFilePathPointer,
 )
-from nltk.internals import slice_bounds
+from nltk.internals import read_binary_header, slice_bounds, write_binary_header
 from nltk.tokenize import wordpunct_tokenize
 from nltk.util import AbstractLazySequence, LazyConcatenation, LazySubsequence
 
@@ -79,8 +84,18 @@ class StreamBackedCorpusView(AbstractLazySequence):
     have high degrees of locality, the corpus view may cache one or
     more blocks.
 
+    The toknum/filepos mapping can be kept in an index file (see
+    ``index_file``), so that later corpus views of the same file can find
+    its length and jump to any token without reading the file first.
+
+    A corpus view may be read by several threads at once.  Each thread
+    reads the file through its own file object, and updates of the
+    toknum/filepos mapping are serialized, so that the mapping can be
+    searched without locking.
+
     :note: Each ``CorpusView`` object internally maintains an open file
-        object for its underlying corpus file.  This file should be
+        object for its underlying corpus file (one per thread that reads
+        from it).  This file should be
         automatically closed when the ``CorpusView`` is garbage collected,
         but if you wish to close it manually, use the ``close()``
         method.  If you access a ``CorpusView``'s items after it has been
@@ -109,20 +124,39 @@ class StreamBackedCorpusView(AbstractLazySequence):
         file position of the first character in block ``i``.  Together
         with ``_toknum``, this forms a partial mapping between token
         indices and file positions.
-    :ivar _stream: The stream used to access the underlying corpus file.
+    :ivar _stream: The stream used by the current thread to access the
+        underlying corpus file.
     :ivar _len: The total number of tokens in the corpus, if known;
         or None, if the number of tokens is not yet known.
     :ivar _eofpos: The character position of the last character in the
         file.  This is calculated when the corpus view is initialized,
         and is used to decide when the end of file has been reached.
-    :ivar _cache: A cache of the most recently read block.  It
+    :ivar _cache: The most recently read or accessed block.  It
        is encoded as a tuple (start_toknum, end_toknum, tokens), where
        start_toknum is the token index of the first token in the block;
        end_toknum is the token index of the first token not in the
        block; and tokens is a list of the tokens in the block.
+    :ivar _block_cache: An LRU cache of the ``cache_size`` most recently
+       used blocks, mapping the start_toknum of each block to its
+       ``_cache`` tuple.  Only used if ``cache_size`` is greater than 1.
+    :ivar _index_file: The file in which the toknum/filepos mapping is
+       kept, or None.
     """
 
-    def __init__(self, fileid, block_reader=None, startpos=0, encoding="utf8"):
+    # Index files start with the header written by `write_binary_header`,
+    # followed by the toknum and filepos arrays.
+    _INDEX_MAGIC = b"NLTK-CVI"
+    _INDEX_VERSION = 2
+
+    def __init__(
+        self,
+        fileid,
+        block_reader=None,
+        startpos=0,
+        encoding="utf8",
+        cache_size=1,
+        index_file=None,
+    ):
         """
         Create a new corpus view, based on the file ``fileid``, and
         read with ``block_reader``.  See the class documentation
@@ -140,9 +174,25 @@ class StreamBackedCorpusView(AbstractLazySequence):
             read the file's contents.  If no encoding is specified,
             then the file's contents will be read as a non-unicode
             string (i.e., a str).
+
+        :param cache_size: The number of blocks to keep in memory.  A
+            larger cache speeds up random access that jumps between
+            blocks, e.g. from several threads.
+
+        :param index_file: A file in which to keep the toknum/filepos
+            mapping.  If it holds a mapping saved for the current state of
+            ``fileid`` (by size and modification time) with the same block
+            reader, then that mapping is loaded; and once the view reaches
+            the end of the file, the complete mapping is saved to it.  An
+            index file must not be shared by views that read the same file
+            with differently configured block readers.
         """
         if block_reader:
             self.read_block = block_reader
+        # The stream and current block of each thread.
+        self._local = _ThreadState()
+        # Serializes updates of the toknum/filepos mapping and the cache.
+        self._lock = threading.Lock()
         # Initialize our toknum/filepos mapping.
         self._toknum = [0]
         self._filepos = [startpos]
@@ -151,21 +201,6 @@ class StreamBackedCorpusView(AbstractLazySequence):
         self._len = None
 
         self._fileid = fileid
-        self._stream = None
-
-        self._current_toknum = None
-        """This variable is set to the index of the next token that
-           will be read, immediately before ``self.read_block()`` is
-           called.  This is provided for the benefit of the block
-           reader, which under rare circumstances may need to know
-           the current token number."""
-
-        self._current_blocknum = None
-        """This variable is set to the index of the next block that
-           will be read, immediately before ``self.read_block()`` is
-           called.  This is provided for the benefit of the block
-           reader, which under rare circumstances may need to know
-           the current block number."""
 
         # Find the length of the file.
         try:
@@ -176,9 +211,16 @@ class StreamBackedCorpusView(AbstractLazySequence):
         except Exception as exc:
             raise ValueError(f"Unable to open or access {fileid!r} -- {exc}") from exc
 
-        # Maintain a cache of the most recently read block, to
+        # Maintain a cache of the most recently read blocks, to
         # increase efficiency of random access.
         self._cache = (-1, -1, None)
+        self._cache_size = cache_size
+        self._block_cache = OrderedDict()
+
+        self._index_file = index_file
+        self._index_saved = False
+        if index_file is not None:
+            self._load_index()
 
     fileid = property(
         lambda self: self._fileid,
@@ -188,6 +230,31 @@ class StreamBackedCorpusView(AbstractLazySequence):
         :type: str or PathPointer""",
     )
 
+    _stream = property(
+        lambda self: self._local.stream,
+        lambda self, stream: setattr(self._local, "stream", stream),
+    )
+
+    _current_toknum = property(
+        lambda self: self._local.current_toknum,
+        lambda self, toknum: setattr(self._local, "current_toknum", toknum),
+        doc="""
+        The index of the next token that will be read, set immediately
+        before ``self.read_block()`` is called.  This is provided for the
+        benefit of the block reader, which under rare circumstances may
+        need to know the current token number.""",
+    )
+
+    _current_blocknum = property(
+        lambda self: self._local.current_blocknum,
+        lambda self, blocknum: setattr(self._local, "current_blocknum", blocknum),
+        doc="""
+        The index of the next block that will be read, set immediately
+        before ``self.read_block()`` is called.  This is provided for the
+        benefit of the block reader, which under rare circumstances may
+        need to know the current block number.""",
+    )
+
     def read_block(self, stream):
         """
         Read a block from the input stream.
@@ -221,12 +288,28 @@ class StreamBackedCorpusView(AbstractLazySequence):
         handles (although the stream should automatically be closed
         upon garbage collection of the corpus view).  If the corpus
         view is accessed after it is closed, it will be automatically
-        re-opened.
+        re-opened.  Only the stream of the calling thread is closed;
+        the streams of other threads are closed when those threads end.
         """
         if self._stream is not None:
             self._stream.close()
         self._stream = None
 
+    def __getstate__(self):
+        # Streams, locks and cached blocks are not copied; the copy
+        # opens its own streams and reads its blocks again.
+        state = self.__dict__.copy()
+        for name in ("_local", "_lock", "_cache", "_block_cache"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = _ThreadState()
+        self._lock = threading.Lock()
+        self._cache = (-1, -1, None)
+        self._block_cache = OrderedDict()
+
     def __enter__(self):
         return self
 
@@ -245,9 +328,9 @@ class StreamBackedCorpusView(AbstractLazySequence):
         if isinstance(i, slice):
             start, stop = slice_bounds(self, i)
             # Check if it's in the cache.
-            offset = self._cache[0]
-            if offset <= start and stop <= self._cache[1]:
-                return self._cache[2][start - offset : stop - offset]
+            offset, end, tokens = self._cached_block(start)
+            if offset <= start and stop <= end:
+                return tokens[start - offset : stop - offset]
             # Construct & return the result.
             return LazySubsequence(self, start, stop)
         else:
@@ -257,35 +340,68 @@ class StreamBackedCorpusView(AbstractLazySequence):
             if i < 0:
                 raise IndexError("index out of range")
             # Check if it's in the cache.
-            offset = self._cache[0]
-            if offset <= i < self._cache[1]:
-                return self._cache[2][i - offset]
+            offset, end, tokens = self._cached_block(i)
+            if offset <= i < end:
+                return tokens[i - offset]
             # Use iterate_from to extract it.
             try:
                 return next(self.iterate_from(i))
             except StopIteration as e:
                 raise IndexError("index out of range") from e
 
-    # If we wanted to be thread-safe, then this method would need to
-    # do some locking.
+    def _cached_block(self, index):
+        """
+        Return the cached block that contains the token at ``index``, as a
+        tuple (start_toknum, end_toknum, tokens); or ``(-1, -1, None)`` if
+        that block is not cached.
+        """
+        block = self._cache
+        if block[0] <= index < block[1] or self._cache_size <= 1:
+            return block
+        toknum = self._toknum
+        if index >= toknum[-1]:
+            return (-1, -1, None)
+        start = toknum[bisect.bisect_right(toknum, index) - 1]
+        with self._lock:
+            block = self._block_cache.get(start)
+            if block is None:
+                return (-1, -1, None)
+            self._block_cache.move_to_end(start)
+        self._cache = block
+        return block
+
+    def _cache_block(self, block):
+        """
+        Add ``block``, a tuple (start_toknum, end_toknum, tokens), to the
+        cache.
+        """
+        self._cache = block
+        if self._cache_size > 1 and block[0] < block[1]:
+            with self._lock:
+                self._block_cache[block[0]] = block
+                self._block_cache.move_to_end(block[0])
+                if len(self._block_cache) > self._cache_size:
+                    self._block_cache.popitem(last=False)
+
     def iterate_from(self, start_tok):
         # Start by feeding from the cache, if possible.
-        if self._cache[0] <= start_tok < self._cache[1]:
-            for tok in self._cache[2][start_tok - self._cache[0] :]:
+        cache_start, cache_end, cached_tokens = self._cached_block(start_tok)
+        if cache_start <= start_tok < cache_end:
+            for tok in cached_tokens[start_tok - cache_start :]:
                 yield tok
                 start_tok += 1
 
         # Decide where in the file we should start.  If `start` is in
         # our mapping, then we can jump straight to the correct block;
-        # otherwise, start at the last block we've processed.
+        # otherwise, start at the last block we've processed.  Other
+        # threads may extend the mapping at any time, but they add the
+        # file position of a block before its token index.
         if start_tok < self._toknum[-1]:
             block_index = bisect.bisect_right(self._toknum, start_tok) - 1
-            toknum = self._toknum[block_index]
-            filepos = self._filepos[block_index]
         else:
             block_index = len(self._toknum) - 1
-            toknum = self._toknum[-1]
-            filepos = self._filepos[-1]
+        toknum = self._toknum[block_index]
+        filepos = self._filepos[block_index]
 
         # Open the stream, if it's not open already.
         if self._stream is None:
@@ -318,28 +434,32 @@ class StreamBackedCorpusView(AbstractLazySequence):
             )
 
             # Update our cache.
-            self._cache = (toknum, toknum + num_toks, list(tokens))
+            self._cache_block((toknum, toknum + num_toks, list(tokens)))
 
             # Update our mapping.
             assert toknum <= self._toknum[-1]
             if num_toks > 0:
                 block_index += 1
-                if toknum == self._toknum[-1]:
-                    assert new_filepos > self._filepos[-1]  # monotonic!
-                    self._filepos.append(new_filepos)
-                    self._toknum.append(toknum + num_toks)
-                else:
-                    # Check for consistency:
-                    assert (
-                        new_filepos == self._filepos[block_index]
-                    ), "inconsistent block reader (num chars read)"
-                    assert (
-                        toknum + num_toks == self._toknum[block_index]
-                    ), "inconsistent block reader (num tokens returned)"
+                with self._lock:
+                    if toknum == self._toknum[-1]:
+                        assert new_filepos > self._filepos[-1]  # monotonic!
+                        self._filepos.append(new_filepos)
+                        self._toknum.append(toknum + num_toks)
+                    else:
+                        # Check for consistency:
+                        assert (
+                            new_filepos == self._filepos[block_index]
+                        ), "inconsistent block reader (num chars read)"
+                        assert (
+                            toknum + num_toks == self._toknum[block_index]
+                        ), "inconsistent block reader (num tokens returned)"
 
             # If we reached the end of the file, then update self._len
             if new_filepos == self._eofpos:
                 self._len = toknum + num_toks
+                if self._index_file is not None and not self._index_saved:
+                    self._index_saved = True
+                    self.save_index()
             # Generate the tokens in this block (but skip any tokens
             # before start_tok).  Note that between yields, our state
             # may be modified.
@@ -359,6 +479,112 @@ class StreamBackedCorpusView(AbstractLazySequence):
         # We should have reached EOF once we're out of the while loop.
         self.close()
 
+    def _index_signature(self):
+        """
+        Identify the state of the file and the settings that the
+        toknum/filepos mapping depends on.  The file's state is given by
+        the size and modification time of the file (or of the zip archive
+        it is stored in).  Return None if that state cannot be determined.
+        """
+        if isinstance(self._fileid, ZipFilePathPointer):
+            filename = self._fileid.zipfile.filename
+        elif isinstance(self._fileid, FileSystemPathPointer):
+            filename = self._fileid.path
+        elif isinstance(self._fileid, PathPointer):
+            return None
+        else:
+            filename = self._fileid
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        reader = self.read_block
+        return {
+            "file": [stat.st_size, stat.st_mtime_ns],
+            "eofpos": self._eofpos,
+            "startpos": self._filepos[0],
+            "encoding": self._encoding,
+            "block_reader": "%s.%s"
+            % (
+                getattr(reader, "__module__", None),
+                getattr(reader, "__qualname__", type(reader).__qualname__),
+            ),
+        }
+
+    def _load_index(self):
+        """
+        Load the toknum/filepos mapping from ``self._index_file``, unless
+        there is no such file, or it was saved for a different state of
+        the file or different settings.
+        """
+        signature = self._index_signature()
+        if signature is None or not os.path.isfile(self._index_file):
+            return
+        try:
+            with open(self._index_file, "rb") as fp:
+                version, header, data_start = read_binary_header(
+                    fp, self._INDEX_MAGIC, self._INDEX_VERSION
+                )
+                if version != self._INDEX_VERSION:
+                    return
+                if header["signature"] != signature:
+                    return
+                fp.seek(data_start)
+                toknum, filepos = array("q"), array("q")
+                toknum.fromfile(fp, header["blocks"])
+                filepos.fromfile(fp, header["blocks"])
+        except (OSError, ValueError, KeyError, EOFError):
+            # An unreadable index is rebuilt like a stale one.
+            return
+        if sys.byteorder != "little":
+            toknum.byteswap()
+            filepos.byteswap()
+        with self._lock:
+            if len(toknum) > len(self._toknum):
+                self._filepos = filepos.tolist()
+                self._toknum = toknum.tolist()
+            self._len = header["len"]
+        self._index_saved = self._len is not None
+
+    def save_index(self, index_file=None):
+        """
+        Save the toknum/filepos mapping built so far, so that later corpus
+        views can load it (see the ``index_file`` parameter).  This is done
+        automatically when a view with an index file reaches the end of the
+        file; calling it earlier saves a partial mapping.
+
+        :param index_file: The file to save to; by default, the view's
+            ``index_file``.
+        """
+        path = index_file or self._index_file
+        if path is None:
+            raise ValueError("No index file given.")
+        signature = self._index_signature()
+        if signature is None:
+            warnings.warn(f"Cannot index {self._fileid!r}: unknown file state.")
+            return
+        with self._lock:
+            toknum = array("q", self._toknum)
+            filepos = array("q", self._filepos)
+            length = self._len
+        if sys.byteorder != "little":
+            toknum.byteswap()
+            filepos.byteswap()
+        header = {"signature": signature, "blocks": len(toknum), "len": length}
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(tmp_path, "wb") as fp:
+                write_binary_header(fp, self._INDEX_MAGIC, self._INDEX_VERSION, header)
+                toknum.tofile(fp)
+                filepos.tofile(fp)
+            # Views in other processes only ever see a complete file.
+            os.replace(tmp_path, path)
+        except OSError as e:
+            warnings.warn(f"Could not write the corpus view index {path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     # Use concat for these, so we can use a ConcatenatedCorpusView
     # when possible.
     def __add__(self, other):
@@ -374,6 +600,14 @@ class StreamBackedCorpusView(AbstractLazySequence):
         return concat([self] * count)
 
 
+class _ThreadState(threading.local):
+    """The per-thread state of a ``StreamBackedCorpusView``."""
+
+    stream = None
+    current_toknum = None
+    current_blocknum = None
+
+
 class ConcatenatedCorpusView(AbstractLazySequence):
     """
     A 'view' of a corpus file that joins together one or more
@@ -395,11 +629,17 @@ class ConcatenatedCorpusView(AbstractLazySequence):
         """The most recently accessed corpus subview (or None).
         Before a new subview is accessed, this subview will be closed."""
 
+        self._lock = threading.Lock()
+        """Serializes updates of the offset table."""
+
     def __len__(self):
         if len(self._offsets) <= len(self._pieces):
-            # Iterate to the end of the corpus.
-            for tok in self.iterate_from(self._offsets[-1]):
-                pass
+            # Fill in the offset table from the lengths of the pieces, so
+            # that pieces whose length is known (e.g. from an index file)
+            # are not read.
+            with self._lock:
+                for piece in self._pieces[len(self._offsets) - 1 :]:
+                    self._offsets.append(self._offsets[-1] + len(piece))
 
         return self._offsets[-1]
 
@@ -407,6 +647,16 @@ class ConcatenatedCorpusView(AbstractLazySequence):
         for piece in self._pieces:
             piece.close()
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_open_piece"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
     def iterate_from(self, start_tok):
         piecenum = bisect.bisect_right(self._offsets, start_tok) - 1
 
@@ -424,8 +674,9 @@ class ConcatenatedCorpusView(AbstractLazySequence):
             yield from piece.iterate_from(max(0, start_tok - offset))
 
             # Update the offset table.
-            if piecenum + 1 == len(self._offsets):
-                self._offsets.append(self._offsets[-1] + len(piece))
+            with self._lock:
+                if piecenum + 1 == len(self._offsets):
+                    self._offsets.append(self._offsets[-1] + len(piece))
 
             # Move on to the next piece.
             piecenum += 1
@@ -30,19 +30,35 @@ https://omwn.org/
 
 """
 
+import hashlib
+import json
 import math
+import mmap
 import os
 import re
+import threading
 import warnings
-from collections import defaultdict, deque
-from functools import total_ordering
+from collections import OrderedDict, defaultdict, deque
+from functools import partial, total_ordering
 from itertools import chain, islice
 from operator import itemgetter
 
 from nltk.corpus.reader import CorpusReader
-from nltk.internals import deprecated
+from nltk.data import (
+    FileSystemPathPointer,
+    GzipFileSystemPathPointer,
+    ZipFilePathPointer,
+)
+from nltk.internals import deprecated, read_binary_header, write_binary_header
 from nltk.probability import FreqDist
+from nltk.util import _fork_context
 from nltk.util import binary_search_file as _binary_search_file
+from nltk.util import parallel_imap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 ######################################################################
 # Table of Contents
@@ -52,6 +68,7 @@ from nltk.util import binary_search_file as _binary_search_file
 #   - WordNetError
 #   - Lemma
 #   - Synset
+#   - WordNetGraph
 # - WordNet Corpus Reader
 # - WordNet Information Content Corpus Reader
 # - Similarity Metrics
@@ -64,6 +81,9 @@ from nltk.util import binary_search_file as _binary_search_file
 #: Positive infinity (for similarity functions)
 _INF = 1e300
 
+#: Marks a missing entry in the similarity cache, where None is a valid value.
+_MISSING = object()
+
 # { Part-of-speech constants
 ADJ, ADJ_SAT, ADV, NOUN, VERB = "a", "s", "r", "n", "v"
 # }
@@ -431,7 +451,6 @@ class Synset(_WordNetObject):
         self._definition = None
         self._examples = []
         self._lexname = None  # lexicographer name
-        self._all_hypernyms = None
 
         self._pointers = defaultdict(set)
         self._lemma_pointers = defaultdict(list)
@@ -548,7 +567,10 @@ class Synset(_WordNetObject):
             synset to the root.
         """
 
-        if "_max_depth" not in self.__dict__:
+        # _max_depth is a slot, so it never shows up in self.__dict__
+        try:
+            return self._max_depth
+        except AttributeError:
             hypernyms = self.hypernyms() + self.instance_hypernyms()
             if not hypernyms:
                 self._max_depth = 0
@@ -562,7 +584,10 @@ class Synset(_WordNetObject):
             synset to the root.
         """
 
-        if "_min_depth" not in self.__dict__:
+        # _min_depth is a slot, so it never shows up in self.__dict__
+        try:
+            return self._min_depth
+        except AttributeError:
             hypernyms = self.hypernyms() + self.instance_hypernyms()
             if not hypernyms:
                 self._min_depth = 0
@@ -666,17 +691,20 @@ class Synset(_WordNetObject):
         :return: A list of lists, where each list gives the node sequence
            connecting the initial ``Synset`` node and a root node.
         """
-        paths = []
+        return [list(path) for path in self._hypernym_paths()]
 
-        hypernyms = self.hypernyms() + self.instance_hypernyms()
-        if len(hypernyms) == 0:
-            paths = [[self]]
+    def _hypernym_paths(self):
+        def compute():
+            hypernyms = self.hypernyms() + self.instance_hypernyms()
+            if len(hypernyms) == 0:
+                return ((self,),)
+            return tuple(
+                ancestors + (self,)
+                for hypernym in hypernyms
+                for ancestors in hypernym._hypernym_paths()
+            )
 
-        for hypernym in hypernyms:
-            for ancestor_list in hypernym.hypernym_paths():
-                ancestor_list.append(self)
-                paths.append(ancestor_list)
-        return paths
+        return self._cached(("hypernym_paths", self), compute)
 
     def common_hypernyms(self, other):
         """
@@ -687,19 +715,17 @@ class Synset(_WordNetObject):
         :param other: other input synset.
         :return: The synsets that are hypernyms of both synsets.
         """
-        if not self._all_hypernyms:
-            self._all_hypernyms = {
+        return list(self._all_hypernyms().intersection(other._all_hypernyms()))
+
+    def _all_hypernyms(self):
+        return self._cached(
+            ("all_hypernyms", self),
+            lambda: frozenset(
                 self_synset
                 for self_synsets in self._iter_hypernym_lists()
                 for self_synset in self_synsets
-            }
-        if not other._all_hypernyms:
-            other._all_hypernyms = {
-                other_synset
-                for other_synsets in other._iter_hypernym_lists()
-                for other_synset in other_synsets
-            }
-        return list(self._all_hypernyms.intersection(other._all_hypernyms))
+            ),
+        )
 
     def lowest_common_hypernyms(self, other, simulate_root=False, use_min_depth=False):
         """
@@ -741,6 +767,16 @@ class Synset(_WordNetObject):
         :return: The synsets that are the lowest common hypernyms of both
             synsets
         """
+        return list(
+            self._cached(
+                ("lowest_common_hypernyms", self, other, simulate_root, use_min_depth),
+                lambda: tuple(
+                    self._lowest_common_hypernyms(other, simulate_root, use_min_depth)
+                ),
+            )
+        )
+
+    def _lowest_common_hypernyms(self, other, simulate_root, use_min_depth):
         synsets = self.common_hypernyms(other)
         if simulate_root:
             fake_synset = Synset(None)
@@ -785,7 +821,14 @@ class Synset(_WordNetObject):
     def _shortest_hypernym_paths(self, simulate_root):
         if self._name == "*ROOT*":
             return {self: 0}
+        # The returned dict is shared through the cache: callers must not
+        # modify it.
+        return self._cached(
+            ("shortest_hypernym_paths", self, simulate_root),
+            lambda: self._compute_shortest_hypernym_paths(simulate_root),
+        )
 
+    def _compute_shortest_hypernym_paths(self, simulate_root):
         queue = deque([(self, 0)])
         path = {}
 
@@ -824,19 +867,25 @@ class Synset(_WordNetObject):
         if self == other:
             return 0
 
+        return self._cached(
+            ("shortest_path_distance", self, other, simulate_root),
+            lambda: self._shortest_path_distance(other, simulate_root),
+        )
+
+    def _shortest_path_distance(self, other, simulate_root):
         dist_dict1 = self._shortest_hypernym_paths(simulate_root)
         dist_dict2 = other._shortest_hypernym_paths(simulate_root)
 
         # For each ancestor synset common to both subject synsets, find the
         # connecting path length. Return the shortest of these.
-
-        inf = float("inf")
-        path_distance = inf
-        for synset, d1 in dist_dict1.items():
-            d2 = dist_dict2.get(synset, inf)
-            path_distance = min(path_distance, d1 + d2)
-
-        return None if math.isinf(path_distance) else path_distance
+        return min(
+            (
+                d1 + dist_dict2[synset]
+                for synset, d1 in dist_dict1.items()
+                if synset in dist_dict2
+            ),
+            default=None,
+        )
 
     # interface to similarity methods
     def path_similarity(self, other, verbose=False, simulate_root=True):
@@ -1091,6 +1140,19 @@ class Synset(_WordNetObject):
                 if hypernym not in seen
             ]
 
+    def _cached(self, key, compute):
+        """
+        Look ``key`` up in the similarity cache of this synset's corpus
+        reader, calling ``compute()`` to fill it in on a miss.
+        """
+        if self._wordnet_corpus_reader is None:
+            return compute()
+        cache = self._wordnet_corpus_reader._similarity_cache
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = cache[key] = compute()
+        return value
+
     def __repr__(self):
         return f"{type(self).__name__}('{self._name}')"
 
@@ -1103,6 +1165,336 @@ class Synset(_WordNetObject):
         return r
 
 
+class WordNetGraph:
+    """
+    The hypernym hierarchy of one part of speech, read from its data file
+    in a single pass into integer-indexed NumPy arrays.  Node ``i`` is the
+    synset at byte offset ``offsets[i]``, and its hypernyms and instance
+    hypernyms are the nodes
+    ``hypernym_indices[hypernym_indptr[i]:hypernym_indptr[i + 1]]``, in
+    compressed sparse row (CSR) form.
+
+    The depths of all nodes and their hypernym closures are computed up
+    front, one level of the hierarchy at a time.  The closure of node
+    ``i`` consists of the node itself and all its ancestors,
+    ``ancestor_indices[ancestor_indptr[i]:ancestor_indptr[i + 1]]``; for
+    each ancestor, ``ancestor_distances`` holds the length of the shortest
+    path to it, and ``ancestor_paths`` the number of such shortest paths.
+
+    Use ``WordNetCorpusReader.hypernym_graph()`` to get the graph of a
+    part of speech.  Requires NumPy.
+    """
+
+    def __init__(
+        self, wordnet_corpus_reader, pos, offsets, hypernym_indptr, hypernym_indices
+    ):
+        self._wordnet_corpus_reader = wordnet_corpus_reader
+        self.pos = pos
+        self.offsets = offsets
+        self.hypernym_indptr = hypernym_indptr
+        self.hypernym_indices = hypernym_indices
+        self._compute_depths()
+        self._compute_closures()
+
+    @classmethod
+    def from_data_file(cls, wordnet_corpus_reader, pos):
+        """
+        Read the graph of the given part of speech from the data file of
+        ``wordnet_corpus_reader``, without creating any ``Synset`` objects.
+        """
+        data = bytes(wordnet_corpus_reader._data_buffer(pos))
+        offsets = []
+        hypernym_indptr = [0]
+        hypernym_offsets = []
+        offset = 0
+        for line in data.split(b"\n"):
+            line_offset, offset = offset, offset + len(line) + 1
+            if not line or line[:1].isspace():
+                continue
+            columns = line.split(b"|", 1)[0].split()
+            n_lemmas = int(columns[3], 16)
+            pointers_start = 5 + 2 * n_lemmas
+            pointers_end = pointers_start + 4 * int(columns[pointers_start - 1])
+            # A synset's pointers are kept in a set per symbol, see
+            # WordNetCorpusReader._synset_from_pos_and_line(); pointers with
+            # a source/target other than "0000" are between lemmas.
+            hypernyms = {
+                (columns[i], int(columns[i + 1]))
+                for i in range(pointers_start, pointers_end, 4)
+                if columns[i] in (b"@", b"@i") and columns[i + 3] == b"0000"
+            }
+            offsets.append(line_offset)
+            hypernym_offsets.extend(target for _, target in hypernyms)
+            hypernym_indptr.append(len(hypernym_offsets))
+
+        offsets = np.array(offsets, dtype=np.int64)
+        hypernym_offsets = np.array(hypernym_offsets, dtype=np.int64)
+        hypernym_indices = np.searchsorted(offsets, hypernym_offsets)
+        if len(hypernym_offsets) and not np.array_equal(
+            offsets[np.minimum(hypernym_indices, len(offsets) - 1)], hypernym_offsets
+        ):
+            raise WordNetError(f"Hypernym pointers to missing synsets for pos={pos}")
+        return cls(
+            wordnet_corpus_reader,
+            pos,
+            offsets,
+            np.array(hypernym_indptr, dtype=np.int64),
+            hypernym_indices,
+        )
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} pos={self.pos!r} with {len(self)} synsets>"
+
+    def _compute_depths(self):
+        n = len(self.offsets)
+        n_hypernyms = np.diff(self.hypernym_indptr)
+        children = np.repeat(np.arange(n), n_hypernyms)[
+            np.argsort(self.hypernym_indices, kind="stable")
+        ]
+        children_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(self.hypernym_indices, minlength=n), out=children_indptr[1:]
+        )
+
+        # A node's longest path to a root is one more than the longest of
+        # its hypernyms', so taking nodes in order of max_depth visits all
+        # hypernyms of a node before the node itself.
+        self._levels = []
+        max_depth = np.full(n, -1, dtype=np.int64)
+        waiting = n_hypernyms.copy()
+        level = np.flatnonzero(waiting == 0)
+        while level.size:
+            max_depth[level] = len(self._levels)
+            self._levels.append(level)
+            below = children[
+                _segments(children_indptr[level], np.diff(children_indptr)[level])
+            ]
+            np.subtract.at(waiting, below, 1)
+            level = np.unique(below[waiting[below] == 0])
+        if (max_depth < 0).any():
+            raise WordNetError(f"Cycle in the hypernym hierarchy for pos={self.pos}")
+        self.max_depth = max_depth
+
+        self.min_depth = np.zeros(n, dtype=np.int64)
+        for level in self._levels[1:]:
+            lengths = n_hypernyms[level]
+            hypernyms = self.hypernym_indices[
+                _segments(self.hypernym_indptr[level], lengths)
+            ]
+            self.min_depth[level] = 1 + np.minimum.reduceat(
+                self.min_depth[hypernyms], np.cumsum(lengths) - lengths
+            )
+
+    def _compute_closures(self):
+        n = len(self.offsets)
+        n_hypernyms = np.diff(self.hypernym_indptr)
+        starts = np.zeros(n, dtype=np.int64)
+        lengths = np.zeros(n, dtype=np.int64)
+        ancestors = distances = paths = np.zeros(0, dtype=np.int64)
+        for level in self._levels:
+            # The closure of a node is the node itself, plus the closures
+            # of its hypernyms one step further away.
+            edge_lengths = n_hypernyms[level]
+            hypernyms = self.hypernym_indices[
+                _segments(self.hypernym_indptr[level], edge_lengths)
+            ]
+            inherited = _segments(starts[hypernyms], lengths[hypernyms])
+            node = np.concatenate(
+                [level, np.repeat(np.repeat(level, edge_lengths), lengths[hypernyms])]
+            )
+            ancestor = np.concatenate([level, ancestors[inherited]])
+            distance = np.concatenate([np.zeros_like(level), distances[inherited] + 1])
+            count = np.concatenate([np.ones_like(level), paths[inherited]])
+
+            # Merge the copies of each (node, ancestor) pair, keeping the
+            # shortest distance and the number of paths of that length.
+            pair = node * n + ancestor
+            order = np.argsort(pair * (distance.max() + 1) + distance)
+            pair, distance, count = pair[order], distance[order], count[order]
+            first = np.ones(len(pair), dtype=bool)
+            first[1:] = pair[1:] != pair[:-1]
+            group_starts = np.flatnonzero(first)
+            shortest = distance[group_starts]
+            count = np.add.reduceat(
+                np.where(distance == shortest[np.cumsum(first) - 1], count, 0),
+                group_starts,
+            )
+            node, ancestor = np.divmod(pair[group_starts], n)
+
+            _, node_starts, node_lengths = np.unique(
+                node, return_index=True, return_counts=True
+            )
+            starts[level] = len(ancestors) + node_starts
+            lengths[level] = node_lengths
+            ancestors = np.concatenate([ancestors, ancestor])
+            distances = np.concatenate([distances, shortest])
+            paths = np.concatenate([paths, count])
+
+        # Store the closures in node order
+        closures = _segments(starts, lengths)
+        self.ancestor_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.ancestor_indptr[1:])
+        self.ancestor_indices = ancestors[closures]
+        self.ancestor_distances = distances[closures]
+        self.ancestor_paths = paths[closures]
+        del self._levels
+
+    def node(self, synset):
+        """
+        :return: The node of the given synset.
+        """
+        return int(self.nodes([synset])[0])
+
+    def nodes(self, synsets):
+        """
+        :return: An array of the nodes of the given synsets.
+        """
+        return self._offset_nodes([synset._offset for synset in synsets])
+
+    def _offset_nodes(self, offsets):
+        offsets = np.asarray(offsets, dtype=np.int64)
+        nodes = np.searchsorted(self.offsets, offsets)
+        if len(offsets) and not np.array_equal(
+            self.offsets[np.minimum(nodes, len(self) - 1)], offsets
+        ):
+            raise WordNetError(f"No synsets with pos={self.pos} at some offsets")
+        return nodes
+
+    def synset(self, node):
+        """
+        :return: The ``Synset`` of the given node.
+        """
+        return self._wordnet_corpus_reader.synset_from_pos_and_offset(
+            self.pos, int(self.offsets[node])
+        )
+
+    def ancestors(self, node):
+        """
+        :return: An array of the nodes of the synset of the given node and
+            all its hypernyms and instance hypernyms, transitively.
+        """
+        return self.ancestor_indices[
+            self.ancestor_indptr[node] : self.ancestor_indptr[node + 1]
+        ]
+
+    def information_content(self, ic, nodes=None):
+        """
+        Compute the information content of the synsets of the given nodes
+        (by default, all nodes), as ``information_content()`` does.
+
+        :param ic: an information content object (as returned by
+            ``nltk.corpus.wordnet_ic.ic()``).
+        :return: An array with the information content of each node;
+            entries for nodes that were not asked for are undefined.
+        """
+        pos = ADJ if self.pos == ADJ_SAT else self.pos
+        try:
+            icpos = ic[pos]
+        except KeyError as e:
+            msg = "Information content file has no entries for part-of-speech: %s"
+            raise WordNetError(msg % pos) from e
+        values = np.zeros(len(self))
+        if nodes is None:
+            nodes = range(len(self))
+        root_count = icpos[0]
+        offsets = self.offsets.tolist()
+        for node in nodes:
+            counts = icpos.get(offsets[node], 0)
+            values[node] = _INF if counts == 0 else -math.log(counts / root_count)
+        return values
+
+    def subsumer_ic(self, nodes1, nodes2, ic_values):
+        """
+        Find the highest information content among the common subsumers of
+        each node in ``nodes1`` and each node in ``nodes2``, as used by the
+        ``res``, ``jcn`` and ``lin`` similarities.
+
+        :param ic_values: the information content of each node, see
+            ``information_content()``.
+        :return: A pair of arrays of shape ``(len(nodes1), len(nodes2))``:
+            the highest information content of a common subsumer, and
+            whether there is any common subsumer.
+        """
+        if len(nodes1) == 0 or len(nodes2) == 0:
+            result = np.empty((len(nodes1), len(nodes2)))
+            return result, result != -np.inf
+        lengths2 = np.diff(self.ancestor_indptr)[nodes2]
+        ancestors2 = self.ancestor_indices[
+            _segments(self.ancestor_indptr[nodes2], lengths2)
+        ]
+        starts2 = np.cumsum(lengths2) - lengths2
+        row_values = np.full(len(self), -np.inf)
+        result = np.empty((len(nodes1), len(nodes2)))
+        for i, node in enumerate(nodes1):
+            ancestors1 = self.ancestors(node)
+            row_values[ancestors1] = ic_values[ancestors1]
+            result[i] = np.maximum.reduceat(row_values[ancestors2], starts2)
+            row_values[ancestors1] = -np.inf
+        return result, result != -np.inf
+
+
+def _segments(starts, lengths):
+    """
+    :return: The indices of the concatenated ranges
+        ``range(start, start + length)``.
+    """
+    ends = np.cumsum(lengths)
+    return np.arange(ends[-1] if len(ends) else 0) + np.repeat(
+        starts - ends + lengths, lengths
+    )
+
+
+class _LRUCache:
+    """
+    A mapping that holds at most ``maxsize`` entries, evicting the least
+    recently used entry when a new one would exceed that size.  A
+    ``maxsize`` of None leaves the cache unbounded, and 0 disables it.
+    """
+
+    def __init__(self, maxsize=None):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            if maxsize is not None:
+                while len(self._data) > maxsize:
+                    self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
 ######################################################################
 # WordNet Corpus Reader
 ######################################################################
@@ -1128,6 +1520,19 @@ class WordNetCorpusReader(CorpusReader):
     _pos_names = dict(tup[::-1] for tup in _pos_numbers.items())
     # }
 
+    #: The default number of entries kept by the similarity cache.
+    SIMILARITY_CACHE_SIZE = 100000
+
+    #: The index cache of readers constructed without one, such as
+    #: ``nltk.corpus.wordnet``: see the ``index_cache`` argument of the
+    #: constructor.  It is read from the ``NLTK_WORDNET_INDEX_CACHE``
+    #: environment variable, a directory or ``1`` for the default one, and
+    #: can be set before the first reader is loaded.
+    INDEX_CACHE = os.environ.get("NLTK_WORDNET_INDEX_CACHE") or None
+
+    #: The names of the metrics accepted by ``similarity_matrix()``.
+    _SIMILARITY_METRICS = ("path", "lch", "wup", "res", "jcn", "lin")
+
     #: A list of file identifiers for all the fileids used by this
     #: corpus reader.
     _FILES = (
@@ -1148,10 +1553,42 @@ class WordNetCorpusReader(CorpusReader):
         "verb.exc",
     )
 
-    def __init__(self, root, omw_reader):
+    #: The files parsed into the lemma index, lexnames and exception lists.
+    _INDEX_FILES = (
+        "lexnames",
+        "index.adj",
+        "index.adv",
+        "index.noun",
+        "index.verb",
+        "adj.exc",
+        "adv.exc",
+        "noun.exc",
+        "verb.exc",
+    )
+
+    # { Index cache format: a header written by `write_binary_header`,
+    # followed by the cached data as compact JSON, which is parsed in full
+    # when the cache is read.
+    _INDEX_CACHE_MAGIC = b"NLTK-WNI"
+    _INDEX_CACHE_VERSION = 2
+    # }
+
+    def __init__(self, root, omw_reader, index_cache=None):
         """
         Construct a new wordnet corpus reader, with the given root
         directory.
+
+        :param index_cache: A directory in which to keep prebuilt copies
+            of the lemma index, the exception lists and the Open
+            Multilingual Wordnet language data, so that later readers of
+            the same corpus can load them without parsing the corpus files.
+            A copy is rebuilt whenever the files it was built from change.
+            Loading a copy parses a single JSON document instead of the
+            corpus files.  If True, the corpus directory is used when it is
+            writable, and otherwise a directory under the user's cache
+            directory.  If False, nothing is cached.  If None (the default),
+            `INDEX_CACHE` is used, which is None unless configured.
+        :type index_cache: str or bool or None
         """
 
         super().__init__(root, self._FILES, encoding=self._ENCODING)
@@ -1168,6 +1605,16 @@ class WordNetCorpusReader(CorpusReader):
         # the lch similarity metric.
         self._max_depth = defaultdict(dict)
 
+        # The hypernym graph of each part of speech, see hypernym_graph()
+        self._hypernym_graphs = {}
+
+        # A bounded cache for the hypernym closures, hypernym paths, lowest
+        # common hypernyms and path distances used by the similarity metrics.
+        self._similarity_cache = _LRUCache(self.SIMILARITY_CACHE_SIZE)
+
+        # The WordNet version, read from the data files on first use.
+        self._version = _MISSING
+
         # Corpus reader containing omw data.
         self._omw_reader = omw_reader
 
@@ -1188,23 +1635,34 @@ class WordNetCorpusReader(CorpusReader):
         self._lang_data = defaultdict(list)
 
         self._data_file_map = {}
+        self._data_buffer_map = {}
         self._exception_map = {}
         self._lexnames = []
         self._key_count_file = None
         self._key_synset_file = None
 
-        # Load the lexnames
-        with self.open("lexnames") as fp:
-            for i, line in enumerate(fp):
-                index, lexname, _ = line.split()
-                assert int(index) == i
-                self._lexnames.append(lexname)
-
-        # Load the indices for lemmas and synset offsets
-        self._load_lemma_pos_offset_map()
-
-        # load the exception file data into memory
-        self._load_exception_map()
+        # Guards the files and buffers which are opened on first use, and
+        # the binary searches in the sense key files.  Synsets are read from
+        # the data files with positional reads, which need no locking.
+        self._lock = threading.RLock()
+
+        if index_cache is None:
+            index_cache = self.INDEX_CACHE
+        if index_cache is True or index_cache == "1":
+            index_cache = self._default_index_cache_dir()
+        self._index_cache_dir = index_cache or None
+
+        # Load the lexnames, the indices for lemmas and synset offsets and
+        # the exception file data, from the index cache if it is up to date
+        index = self._read_index_cache("index", self._INDEX_FILES)
+        if index is not None:
+            self._load_index(index)
+        else:
+            self._load_lexnames()
+            self._load_lemma_pos_offset_map()
+            self._load_exception_map()
+            if self._index_cache_dir is not None:
+                self._write_index_cache("index", self._INDEX_FILES, self._dump_index())
 
         self.nomap = {}
         self.splits = {}
@@ -1333,9 +1791,16 @@ class WordNetCorpusReader(CorpusReader):
         else:
             prov2 = "data"
 
-        with reader.open(f"{prov}/wn-{prov2}-{lang.split('_')[0]}.tab") as fp:
+        fileid = f"{prov}/wn-{prov2}-{lang.split('_')[0]}.tab"
+        cache_name = f"lang-{lang}"
+        lang_data = self._read_index_cache(cache_name, [fileid], reader)
+        if lang_data is not None:
+            self._lang_data[lang] = [defaultdict(None, data) for data in lang_data]
+            return
+        with reader.open(fileid) as fp:
             self.custom_lemmas(fp, lang)
         self.disable_custom_lemmas(lang)
+        self._write_index_cache(cache_name, [fileid], self._lang_data[lang], reader)
 
     def add_provs(self, reader):
         """Add languages from Multilingual Wordnet to the provenance dictionary"""
@@ -1375,6 +1840,13 @@ class WordNetCorpusReader(CorpusReader):
         """return a list of languages supported by Multilingual Wordnet"""
         return list(self.provenances.keys())
 
+    def _load_lexnames(self):
+        with self.open("lexnames") as fp:
+            for i, line in enumerate(fp):
+                index, lexname, _ = line.split()
+                assert int(index) == i
+                self._lexnames.append(lexname)
+
     def _load_lemma_pos_offset_map(self):
         for suffix in self._FILEMAP.values():
             # parse each line of the file (ignoring comment lines)
@@ -1434,30 +1906,150 @@ class WordNetCorpusReader(CorpusReader):
                     self._exception_map[pos][terms[0]] = terms[1:]
         self._exception_map[ADJ_SAT] = self._exception_map[ADJ]
 
+    def _dump_index(self):
+        # Adjective satellites share the entries of adjectives, so they are
+        # left out of the cache and restored by _load_index().
+        return {
+            "lexnames": self._lexnames,
+            "lemmas": {
+                lemma: {
+                    pos: offsets for pos, offsets in entry.items() if pos != ADJ_SAT
+                }
+                for lemma, entry in self._lemma_pos_offset_map.items()
+            },
+            "exceptions": {pos: self._exception_map[pos] for pos in self._FILEMAP},
+        }
+
+    def _load_index(self, index):
+        self._lexnames = index["lexnames"]
+        for entry in index["lemmas"].values():
+            if ADJ in entry:
+                entry[ADJ_SAT] = entry[ADJ]
+        self._lemma_pos_offset_map = defaultdict(dict, index["lemmas"])
+        self._exception_map = index["exceptions"]
+        self._exception_map[ADJ_SAT] = self._exception_map[ADJ]
+
+    #############################################################
+    # Index cache
+    #############################################################
+
+    def _default_index_cache_dir(self):
+        root = self._root
+        if isinstance(root, FileSystemPathPointer) and os.access(root.path, os.W_OK):
+            return root.path
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        digest = hashlib.sha1(repr(root).encode("utf8")).hexdigest()[:16]
+        return os.path.join(cache_home, "nltk", f"wordnet-{digest}")
+
+    def _index_cache_signature(self, fileids, reader):
+        """
+        Identify the current state of the given files of ``reader``, by the
+        size and modification time of each file (or of the zip archive it
+        is stored in).  Return None if a file's state cannot be determined.
+        """
+        signature = [self._INDEX_CACHE_VERSION, repr(self._root)]
+        for fileid in fileids:
+            path = reader.abspath(fileid)
+            if isinstance(path, ZipFilePathPointer):
+                filename = path.zipfile.filename
+            elif isinstance(path, FileSystemPathPointer):
+                filename = path.path
+            else:
+                return None
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                return None
+            signature.append([fileid, stat.st_size, stat.st_mtime_ns])
+        return signature
+
+    def _read_index_cache(self, name, fileids, reader=None):
+        """
+        Return the data stored in the index cache file ``name``, or None if
+        there is no such file, or it was built from a different state of
+        the files ``fileids`` of ``reader`` (by default, this reader).
+        """
+        if self._index_cache_dir is None:
+            return None
+        signature = self._index_cache_signature(fileids, reader or self)
+        path = os.path.join(self._index_cache_dir, f"nltk-{name}.cache")
+        if signature is None or not os.path.isfile(path):
+            return None
+        try:
+            with open(path, "rb") as fp:
+                version, header, data_start = read_binary_header(
+                    fp, self._INDEX_CACHE_MAGIC, self._INDEX_CACHE_VERSION
+                )
+                if version != self._INDEX_CACHE_VERSION:
+                    return None
+                if header["signature"] != signature:
+                    return None
+                fp.seek(data_start)
+                return json.loads(fp.read())
+        except (OSError, ValueError, KeyError):
+            # An unreadable cache is rebuilt like a stale one.
+            return None
+
+    def _write_index_cache(self, name, fileids, data, reader=None):
+        """
+        Store ``data`` in the index cache file ``name``, along with the
+        state of the files ``fileids`` of ``reader`` it was built from.
+        """
+        if self._index_cache_dir is None:
+            return
+        signature = self._index_cache_signature(fileids, reader or self)
+        if signature is None:
+            return
+        path = os.path.join(self._index_cache_dir, f"nltk-{name}.cache")
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self._index_cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as fp:
+                write_binary_header(
+                    fp,
+                    self._INDEX_CACHE_MAGIC,
+                    self._INDEX_CACHE_VERSION,
+                    {"signature": signature},
+                )
+                fp.write(json.dumps(data, separators=(",", ":")).encode("utf8"))
+            # Readers in other processes only ever see a complete file.
+            os.replace(tmp_path, path)
+        except OSError as e:
+            warnings.warn(f"Could not write the WordNet index cache {path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def _compute_max_depth(self, pos, simulate_root):
         """
         Compute the max depth for the given part of speech.  This is
         used by the lch similarity metric.
         """
         depth = 0
-        for ii in self.all_synsets(pos):
-            try:
-                depth = max(depth, ii.max_depth())
-            except RuntimeError:
-                print(ii)
+        if np is not None:
+            depth = int(self.hypernym_graph(pos).max_depth.max(initial=0))
+        else:
+            for ii in self.all_synsets(pos):
+                try:
+                    depth = max(depth, ii.max_depth())
+                except RuntimeError:
+                    print(ii)
         if simulate_root:
             depth += 1
         self._max_depth[pos] = depth
 
     def get_version(self):
-        fh = self._data_file(ADJ)
-        fh.seek(0)
-        for line in fh:
-            match = re.search(r"Word[nN]et (\d+|\d+\.\d+) Copyright", line)
-            if match is not None:
-                version = match.group(1)
-                fh.seek(0)
-                return version
+        if self._version is _MISSING:
+            self._version = self._read_version()
+        return self._version
+
+    def _read_version(self):
+        match = re.search(
+            rb"Word[nN]et (\d+|\d+\.\d+) Copyright", self._data_buffer(ADJ)
+        )
+        if match is not None:
+            return match.group(1).decode(self._ENCODING)
 
     #############################################################
     # Loading Lemmas
@@ -1485,12 +2077,13 @@ class WordNetCorpusReader(CorpusReader):
         pos_number, lexname_index, lex_id, _, _ = lex_sense.split(":")
         pos = self._pos_names[int(pos_number)]
 
-        # open the key -> synset file if necessary
-        if self._key_synset_file is None:
-            self._key_synset_file = self.open("index.sense")
+        with self._lock:
+            # open the key -> synset file if necessary
+            if self._key_synset_file is None:
+                self._key_synset_file = self.open("index.sense")
 
-        # Find the synset for the lemma.
-        synset_line = _binary_search_file(self._key_synset_file, key)
+            # Find the synset for the lemma.
+            synset_line = _binary_search_file(self._key_synset_file, key)
         if not synset_line:
             raise WordNetError("No synset found for key %r" % key)
         offset = int(synset_line.split()[1])
@@ -1548,6 +2141,67 @@ class WordNetCorpusReader(CorpusReader):
             self._data_file_map[pos] = self.open(fileid)
         return self._data_file_map[pos]
 
+    def _data_buffer(self, pos):
+        """
+        Return the contents of the data file for the given part of speech
+        as a read-only bytes-like object, memory-mapped when the file is
+        on disk.  Unlike the file pointers of ``_data_file()``, the buffer
+        has no current position, so it can be read by several threads at
+        once.
+        """
+        if pos == ADJ_SAT:
+            pos = ADJ
+        buffer = self._data_buffer_map.get(pos)
+        if buffer is None:
+            with self._lock:
+                buffer = self._data_buffer_map.get(pos)
+                if buffer is None:
+                    fileid = "data.%s" % self._FILEMAP[pos]
+                    buffer = self._data_buffer_map[pos] = self._map_file(fileid)
+        return buffer
+
+    def _map_file(self, fileid):
+        path = self.abspath(fileid)
+        if isinstance(path, FileSystemPathPointer) and not isinstance(
+            path, GzipFileSystemPathPointer
+        ):
+            with open(path.path, "rb") as fp:
+                if os.fstat(fp.fileno()).st_size == 0:
+                    # Empty files cannot be memory-mapped.
+                    return b""
+                return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        # Files inside zip archives are read into memory instead.
+        with path.open() as fp:
+            return fp.read()
+
+    def hypernym_graph(self, pos=NOUN):
+        """
+        Load the hypernym hierarchy of the given part of speech into a
+        ``WordNetGraph``, with its nodes' depths and hypernym closures.  The
+        graph is built on the first call for each part of speech, in one pass
+        over the data file.  Requires NumPy.
+
+            >>> from nltk.corpus import wordnet as wn
+            >>> graph = wn.hypernym_graph('n')
+            >>> dog = graph.node(wn.synset('dog.n.01'))
+            >>> int(graph.max_depth[dog]), int(graph.min_depth[dog])
+            (13, 8)
+
+        :param pos: The part of speech; adjective satellites share the
+            graph of adjectives.
+        :rtype: WordNetGraph
+        """
+        if pos == ADJ_SAT:
+            pos = ADJ
+        graph = self._hypernym_graphs.get(pos)
+        if graph is None:
+            with self._lock:
+                graph = self._hypernym_graphs.get(pos)
+                if graph is None:
+                    graph = WordNetGraph.from_data_file(self, pos)
+                    self._hypernym_graphs[pos] = graph
+        return graph
+
     def synset_from_pos_and_offset(self, pos, offset):
         """
         - pos: The synset's part of speech, matching one of the module level
@@ -1560,12 +2214,15 @@ class WordNetCorpusReader(CorpusReader):
         Synset('entity.n.01')
         """
         # Check to see if the synset is in the cache
-        if offset in self._synset_offset_cache[pos]:
-            return self._synset_offset_cache[pos][offset]
-
-        data_file = self._data_file(pos)
-        data_file.seek(offset)
-        data_file_line = data_file.readline()
+        cache = self._synset_offset_cache[pos]
+        if offset in cache:
+            return cache[offset]
+
+        # Read the line starting at offset without moving any shared file
+        # pointer, so that lookups from several threads cannot interleave.
+        data_buffer = self._data_buffer(pos)
+        end = data_buffer.find(b"\n", offset) + 1 or len(data_buffer)
+        data_file_line = data_buffer[offset:end].decode(self._ENCODING)
         # If valid, the offset equals the 8-digit 0-padded integer found at the start of the line:
         line_offset = data_file_line[:8]
         if (
@@ -1574,11 +2231,12 @@ class WordNetCorpusReader(CorpusReader):
         ):
             synset = self._synset_from_pos_and_line(pos, data_file_line)
             assert synset._offset == offset
-            self._synset_offset_cache[pos][offset] = synset
+            # Another thread may have loaded the same synset in the meantime:
+            # keep whichever was cached first, so each synset has one object.
+            synset = cache.setdefault(offset, synset)
         else:
             synset = None
             warnings.warn(f"No WordNet synset found for pos={pos} at offset={offset}.")
-        data_file.seek(0)
         return synset
 
     @deprecated("Use public method synset_from_pos_and_offset() instead")
@@ -1895,8 +2553,9 @@ class WordNetCorpusReader(CorpusReader):
                             synset = cache[pos_tag][offset]
                         else:
                             # Otherwise, parse the line
-                            synset = from_pos_and_line(pos_tag, line)
-                            cache[pos_tag][offset] = synset
+                            synset = cache[pos_tag].setdefault(
+                                offset, from_pos_and_line(pos_tag, line)
+                            )
 
                         # adjective satellites are in the same file as
                         # adjectives so only yield the synset if it's actually
@@ -1969,11 +2628,12 @@ class WordNetCorpusReader(CorpusReader):
         # Currently, count is only work for English
         if lemma._lang != "eng":
             return 0
-        # open the count file if we haven't already
-        if self._key_count_file is None:
-            self._key_count_file = self.open("cntlist.rev")
-        # find the key in the counts file and return the count
-        line = _binary_search_file(self._key_count_file, lemma._key)
+        with self._lock:
+            # open the count file if we haven't already
+            if self._key_count_file is None:
+                self._key_count_file = self.open("cntlist.rev")
+            # find the key in the counts file and return the count
+            line = _binary_search_file(self._key_count_file, lemma._key)
         if line:
             return int(line.rsplit(" ", 1)[-1])
         else:
@@ -2009,6 +2669,126 @@ class WordNetCorpusReader(CorpusReader):
 
     lin_similarity.__doc__ = Synset.lin_similarity.__doc__
 
+    def similarity_matrix(
+        self, synsets, metric="path", others=None, processes=1, **kwargs
+    ):
+        """
+        Compute the similarity of every synset in ``synsets`` to every
+        synset in ``others``.  The hypernym closures and path distances
+        behind each score are computed once per synset rather than once
+        per pair, through the reader's similarity cache.
+
+            >>> from nltk.corpus import wordnet as wn
+            >>> dog, cat = wn.synset('dog.n.01'), wn.synset('cat.n.01')
+            >>> wn.similarity_matrix([dog, cat], 'path')
+            [[1.0, 0.2], [0.2, 1.0]]
+
+        :type synsets: list(Synset)
+        :param synsets: The synsets giving the rows of the matrix.
+        :type metric: str or function
+        :param metric: The name of a similarity metric, one of ``'path'``,
+            ``'lch'``, ``'wup'``, ``'res'``, ``'jcn'`` or ``'lin'``, or a
+            function taking two synsets and returning their similarity.
+        :type others: list(Synset)
+        :param others: The synsets giving the columns of the matrix;
+            defaults to ``synsets``.
+        :type processes: int
+        :param processes: The number of worker processes to split the rows
+            over.  With one process or fewer, or where worker processes
+            cannot be forked from the current one (see
+            `nltk.util.parallel_imap`), the rows are computed in this process.
+        :param kwargs: Further keyword arguments for the metric, e.g. ``ic``
+            for the information content metrics, or ``simulate_root``.
+        :return: A list of rows, where ``matrix[i][j]`` is the similarity of
+            ``synsets[i]`` to ``others[j]``.
+        """
+        synsets = list(synsets)
+        others = synsets if others is None else list(others)
+        if isinstance(metric, str):
+            if metric not in self._SIMILARITY_METRICS:
+                raise ValueError(
+                    "Unknown similarity metric %r; expected one of %s"
+                    % (metric, ", ".join(self._SIMILARITY_METRICS))
+                )
+            if (
+                metric in ("res", "jcn", "lin")
+                and np is not None
+                and set(kwargs) <= {"ic", "verbose"}
+                and "ic" in kwargs
+                and not kwargs.get("verbose")
+                and len({synset._pos for synset in synsets + others}) == 1
+            ):
+                return self._ic_similarity_matrix(metric, synsets, others, kwargs["ic"])
+            metric = getattr(Synset, f"{metric}_similarity")
+        if _fork_context() is None:
+            processes = 1
+        row = partial(_similarity_row, metric, synsets, others, kwargs)
+        chunksize = max(1, -(-len(synsets) // (4 * max(processes, 1))))
+        return list(parallel_imap(row, range(len(synsets)), processes, chunksize))
+
+    def _ic_similarity_matrix(self, metric, synsets, others, ic):
+        """
+        Compute the ``res``, ``jcn`` or ``lin`` similarities of synsets of
+        one part of speech, as ``Synset.res_similarity()`` etc. would, with
+        array operations over the precomputed hypernym closures.
+        """
+        if not synsets or not others:
+            return [[] for _ in synsets]
+        graph = self.hypernym_graph(synsets[0]._pos)
+        nodes1, nodes2 = graph.nodes(synsets), graph.nodes(others)
+        closure = np.concatenate(
+            [graph.ancestors(node) for node in np.union1d(nodes1, nodes2)]
+        )
+        ic_values = graph.information_content(ic, np.unique(closure))
+        lcs_ic, has_subsumer = graph.subsumer_ic(nodes1, nodes2, ic_values)
+        # Without a common subsumer, _lcs_ic() gives an (integer) 0
+        lcs_ic[~has_subsumer] = 0
+        ic1 = ic_values[nodes1][:, None]
+        ic2 = ic_values[nodes2][None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if metric == "res":
+                matrix = lcs_ic.tolist()
+                special = [(~has_subsumer, 0)]
+            elif metric == "jcn":
+                ic_difference = ic1 + ic2 - 2 * lcs_ic
+                matrix = (1 / ic_difference).tolist()
+                special = [
+                    (ic_difference == 0, _INF),
+                    ((ic1 == 0) | (ic2 == 0), 0),
+                    (nodes1[:, None] == nodes2[None, :], _INF),
+                ]
+            else:
+                ic_sum = ic1 + ic2
+                matrix = (2.0 * lcs_ic / ic_sum).tolist()
+                special = []
+                # lin_similarity() divides by zero here: let it raise.
+                for i, j in zip(*np.nonzero(ic_sum == 0)):
+                    synsets[i].lin_similarity(others[j], ic)
+        # Patch in the special cases, in reverse order of precedence
+        for mask, value in special:
+            for i, j in zip(*np.nonzero(np.broadcast_to(mask, lcs_ic.shape))):
+                matrix[i][j] = value
+        return matrix
+
+    def set_similarity_cache_size(self, maxsize):
+        """
+        Set the maximum number of entries kept in the cache of hypernym
+        closures, hypernym paths and path distances shared by the synsets
+        of this reader.  When the cache is full, the least recently used
+        entry is evicted.
+
+        :type maxsize: int or None
+        :param maxsize: The new size of the cache; None leaves it
+            unbounded, and 0 disables caching.
+        """
+        self._similarity_cache.resize(maxsize)
+
+    def clear_similarity_cache(self):
+        """
+        Remove all entries from the similarity cache of this reader.
+        """
+        self._similarity_cache.clear()
+
     #############################################################
     # Morphy
     #############################################################
@@ -2132,6 +2912,9 @@ class WordNetCorpusReader(CorpusReader):
         for ww in corpus.words():
             counts[ww] += 1
 
+        if np is not None:
+            return self._ic_from_graphs(counts, weight_senses_equally, smoothing)
+
         ic = {}
         for pp in POS_LIST:
             ic[pp] = defaultdict(float)
@@ -2167,6 +2950,75 @@ class WordNetCorpusReader(CorpusReader):
                 ic[pos][0] += weight
         return ic
 
+    def _ic_from_graphs(self, counts, weight_senses_equally, smoothing):
+        """
+        Compute the same information content dictionary as ``ic()``, by
+        adding up the weight of each sense over its precomputed hypernym
+        closure with array operations.
+        """
+        # The weight of each sense of each word, by part of speech
+        index = self._lemma_pos_offset_map
+        senses = {pos: ([], []) for pos in POS_LIST}
+        for ww in counts:
+            lemma = ww.lower()
+            possible_synsets = [
+                (pos, offset)
+                for pos in POS_LIST
+                for form in self._morphy(lemma, pos)
+                for offset in index[form].get(pos, [])
+            ]
+            if len(possible_synsets) == 0:
+                continue
+
+            # Distribute weight among possible synsets
+            weight = float(counts[ww])
+            if not weight_senses_equally:
+                weight /= float(len(possible_synsets))
+
+            for pos, offset in possible_synsets:
+                senses[pos][0].append(offset)
+                senses[pos][1].append(weight)
+
+        ic = {}
+        for pos, (offsets, weights) in senses.items():
+            ic[pos] = defaultdict(float)
+            if smoothing <= 0.0 and not offsets:
+                continue
+            graph = self.hypernym_graph(pos)
+            n = len(graph)
+            nodes = graph._offset_nodes(offsets)
+            weights = np.array(weights, dtype=float)
+
+            # ic() adds the weight of a sense to each node of its hypernym
+            # closure once for each shortest path from the sense to the
+            # node.  The additions are made by bincount() one at a time, in
+            # the same order as ic(), so that the sums come out the same.
+            lengths = np.diff(graph.ancestor_indptr)[nodes]
+            closure = _segments(graph.ancestor_indptr[nodes], lengths)
+            paths = graph.ancestor_paths[closure]
+            bins = np.repeat(graph.ancestor_indices[closure], paths)
+            bin_weights = np.repeat(np.repeat(weights, lengths), paths)
+            if smoothing > 0.0:
+                bins = np.concatenate([np.arange(n), bins])
+                bin_weights = np.concatenate(
+                    [np.full(n, float(smoothing)), bin_weights]
+                )
+                touched = np.arange(n)
+            else:
+                touched = np.unique(bins)
+            totals = np.bincount(bins, weights=bin_weights, minlength=n)
+
+            root_total = 0.0
+            if smoothing > 0.0:
+                ic[pos][0] = root_total = smoothing
+            for weight in weights.tolist():
+                root_total += weight
+            ic[pos][0] = root_total
+            ic[pos].update(
+                zip(graph.offsets[touched].tolist(), totals[touched].tolist())
+            )
+        return ic
+
     def custom_lemmas(self, tab_file, lang):
         """
         Reads a custom tab file containing mappings of lemmas in the given
@@ -2471,6 +3323,10 @@ def information_content(synset, ic):
         return -math.log(counts / icpos[0])
 
 
+def _similarity_row(metric, synsets, others, kwargs, i):
+    return [metric(synsets[i], other, **kwargs) for other in others]
+
+
 # get the part of speech (NOUN or VERB) from the information content record
 # (each identifier has a 'n' or 'v' suffix)
 
@@ -8,10 +8,12 @@
 # For license information, see LICENSE.TXT
 
 import fnmatch
+import json
 import locale
 import os
 import re
 import stat
+import struct
 import subprocess
 import sys
 import textwrap
@@ -880,6 +882,70 @@ def import_from_stdlib(module):
     return m
 
 
+##########################################################################
+# Binary File Headers
+##########################################################################
+
+# Binary files written by NLTK (saved models, indexes and caches) start with
+# a fixed size prefix: an 8 byte magic string identifying the kind of file,
+# the format version, and the length of the JSON header that follows it.
+# The file's data starts after the header, aligned to 8 bytes.
+_BINARY_PREFIX = struct.Struct("<8sHQ")
+
+
+def _aligned(offset, alignment=8):
+    return -(-offset // alignment) * alignment
+
+
+def write_binary_header(fp, magic, version, header):
+    """
+    Write the prefix and the JSON header of a binary file to ``fp``,
+    followed by the padding up to where the file's data starts.
+
+    :param fp: a binary file, open for writing at its start
+    :param bytes magic: 8 bytes identifying the kind of file
+    :param int version: the format version of the file
+    :param header: JSON serializable data describing the file
+    :return: the offset at which the file's data starts
+    """
+    header = json.dumps(header).encode("utf8")
+    fp.write(_BINARY_PREFIX.pack(magic, version, len(header)))
+    fp.write(header)
+    data_start = _aligned(_BINARY_PREFIX.size + len(header))
+    fp.write(bytes(data_start - _BINARY_PREFIX.size - len(header)))
+    return data_start
+
+
+def read_binary_header(fp, magic, version, kind="NLTK binary file"):
+    """
+    Read the prefix and the JSON header of a binary file written with
+    ``write_binary_header()``.
+
+    :param fp: a binary file, open for reading at its start
+    :param bytes magic: the magic string the file must start with
+    :param int version: the newest format version that can be read
+    :param str kind: a description of the kind of file, for error messages
+    :return: the format version of the file, its header, and the offset
+        at which the file's data starts
+    :raise ValueError: if the file does not start with ``magic``, or was
+        written in a format version newer than ``version``
+    """
+    name = getattr(fp, "name", "The file")
+    prefix = fp.read(_BINARY_PREFIX.size)
+    if len(prefix) < _BINARY_PREFIX.size:
+        raise ValueError(f"{name} is not a {kind}.")
+    file_magic, file_version, header_size = _BINARY_PREFIX.unpack(prefix)
+    if file_magic != magic:
+        raise ValueError(f"{name} is not a {kind}.")
+    if file_version > version:
+        raise ValueError(
+            f"{name} was saved in format version {file_version}, "
+            f"only versions up to {version} are supported."
+        )
+    header = json.loads(fp.read(header_size).decode("utf8"))
+    return file_version, header, _aligned(_BINARY_PREFIX.size + header_size)
+
+
 ##########################################################################
 # Wrapper for ElementTree Elements
 ##########################################################################
@@ -185,6 +185,13 @@ perplexity with respect to sequences of ngrams.
     >>> lm.perplexity(test)
     2.449489742783178
 
+To score many ngrams at once, use `score_many` or `logscore_many`. They accept
+any iterable of ngrams and yield scores lazily, computing the score of an ngram
+that occurs repeatedly only once.
+
+    >>> list(lm.logscore_many(test))
+    [-1.0, -1.5849625007211563]
+
 It is advisable to preprocess your test text exactly the same way as you did
 the training text.
 
@@ -210,7 +217,7 @@ on 2 preceding words. If you pass in a 4-word context, the first two words
 will be ignored.
 """
 
-from nltk.lm.counter import NgramCounter
+from nltk.lm.counter import FrozenNgramCounter, NgramCounter
 from nltk.lm.models import (
     MLE,
     AbsoluteDiscountingInterpolated,
@@ -225,6 +232,7 @@ from nltk.lm.vocabulary import Vocabulary
 __all__ = [
     "Vocabulary",
     "NgramCounter",
+    "FrozenNgramCounter",
     "MLE",
     "Lidstone",
     "Laplace",
@@ -6,15 +6,29 @@
 # For license information, see LICENSE.TXT
 """Language Model Interface."""
 
+import importlib
+import math
+import mmap
 import random
+import struct
+import sys
 import warnings
 from abc import ABCMeta, abstractmethod
 from bisect import bisect
-from itertools import accumulate
+from collections import defaultdict
+from functools import partial
+from itertools import accumulate, islice
 
-from nltk.lm.counter import NgramCounter
+from nltk.internals import _aligned, read_binary_header, write_binary_header
+from nltk.lm.counter import FrozenNgramCounter, NgramCounter
 from nltk.lm.util import log_base2
 from nltk.lm.vocabulary import Vocabulary
+from nltk.util import parallel_imap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class Smoothing(metaclass=ABCMeta):
@@ -35,6 +49,13 @@ class Smoothing(metaclass=ABCMeta):
         self.vocab = vocabulary
         self.counts = counter
 
+    def precompute(self):
+        """Compute anything derived from the counts ahead of scoring.
+
+        Called before a model is saved, so that derived data is stored along
+        with it. Does nothing by default.
+        """
+
     @abstractmethod
     def unigram_score(self, word):
         raise NotImplementedError()
@@ -43,10 +64,61 @@ class Smoothing(metaclass=ABCMeta):
     def alpha_gamma(self, word, context):
         raise NotImplementedError()
 
+    def _unigram_score_many(self, ngrams):
+        """Vectorized `unigram_score` for the last words of `ngrams`.
+
+        Used by `LanguageModel.score_many` when the counts are frozen, see
+        `LanguageModel._unmasked_score_many`. Returns None by default, for
+        algorithms that have no vectorized version.
+        """
+        return None
+
+    def _alpha_gamma_many(self, ngrams):
+        """Vectorized `alpha_gamma` for equally long `ngrams`, each one a
+        context followed by a word.
+
+        Returns arrays of alphas and gammas, and whether each context was
+        seen; or None by default, as `_unigram_score_many` does.
+        """
+        return None
+
+
+# Saved models start with the header written by `write_binary_header`, which
+# describes the model and where its count arrays are. The arrays come after
+# the header, each of them aligned to 8 bytes.
+_MAGIC = b"NLTK-LM\0"
+_FORMAT_VERSION = 1
+
+
+def _qualified_name(cls):
+    return f"{cls.__module__}.{cls.__qualname__}"
 
-def _mean(items):
-    """Return average (aka mean) for sequence of items."""
-    return sum(items) / len(items)
+
+def _import_class(name, base):
+    module_name, _, class_name = name.rpartition(".")
+    cls = getattr(importlib.import_module(module_name), class_name, None)
+    if not (isinstance(cls, type) and issubclass(cls, base)):
+        raise ValueError(f"{name!r} is not a subclass of {base.__name__}.")
+    return cls
+
+
+def _count_chunk(vocabulary, preprocess, sents):
+    """Count the ngrams of a chunk of sentences in a worker process."""
+    if preprocess is not None:
+        sents = map(preprocess, sents)
+    counter = NgramCounter()
+    counter.update(vocabulary.lookup(sent) for sent in sents)
+    return counter
+
+
+def _chunks(text, chunksize):
+    """Split text into lists of sentences, each of them a list."""
+    sents = iter(text)
+    while True:
+        chunk = [list(sent) for sent in islice(sents, chunksize)]
+        if not chunk:
+            return
+        yield chunk
 
 
 def _random_generator(seed_or_generator):
@@ -101,10 +173,46 @@ class LanguageModel(metaclass=ABCMeta):
         self.vocab = Vocabulary() if vocabulary is None else vocabulary
         self.counts = NgramCounter() if counter is None else counter
 
-    def fit(self, text, vocabulary_text=None):
+    def fit(
+        self, text, vocabulary_text=None, processes=1, chunksize=1000, preprocess=None
+    ):
         """Trains the model on a text.
 
+        With more than one process, the text is split into chunks of
+        sentences that are counted in worker processes. The partial counts
+        are merged in the order of the chunks, so the result is the same as
+        when counting serially, see `nltk.util.parallel_imap`.
+
+        Sentences are sent to the workers as they are. If `text` holds the
+        ngrams of each sentence, as the train text of
+        `padded_everygram_pipeline` does, they are generated and sent by this
+        process, which then does most of the work; so to spread the work over
+        the processes, pass the tokenized sentences as `text`, with a
+        `preprocess` function that turns a sentence into its ngrams:
+
+        >>> from functools import partial
+        >>> from nltk.lm import MLE
+        >>> from nltk.lm.preprocessing import padded_everygrams
+        >>> sents = [["a", "b", "c"], ["a", "c", "d", "c"]] * 100
+        >>> lm = MLE(2)
+        >>> lm.fit(sents, vocabulary_text=["a", "b", "c", "d"], processes=2,
+        ...        chunksize=50, preprocess=partial(padded_everygrams, 2))
+        >>> lm.counts[["a"]]["c"]
+        100
+
+        Even then, each chunk's counts are sent back to this process and
+        merged there, so processes only pay off for texts of many thousands
+        of sentences, with `chunksize` large enough that the counts of a
+        chunk are much smaller than the chunk itself.
+
         :param text: Training text as a sequence of sentences.
+        :param vocabulary_text: Text to build the vocabulary from, needed if
+            the model's vocabulary is empty.
+        :param int processes: Number of worker processes used for counting.
+        :param int chunksize: Number of sentences sent to a worker at once.
+        :param preprocess: Function that turns each sentence of `text` into
+            its ngrams, or None if `text` holds the ngrams of each sentence.
+            With more than one process it runs in the workers.
 
         """
         if not self.vocab:
@@ -113,7 +221,150 @@ class LanguageModel(metaclass=ABCMeta):
                     "Cannot fit without a vocabulary or text to create it from."
                 )
             self.vocab.update(vocabulary_text)
-        self.counts.update(self.vocab.lookup(sent) for sent in text)
+        if processes <= 1:
+            if preprocess is not None:
+                text = map(preprocess, text)
+            self.counts.update(self.vocab.lookup(sent) for sent in text)
+            return
+        count_chunk = partial(_count_chunk, self.vocab, preprocess)
+        chunks = _chunks(text, chunksize)
+        for counter in parallel_imap(count_chunk, chunks, processes, chunksize=1):
+            self.counts.merge(counter)
+
+    def save(self, path):
+        """Saves the model to `path` in a binary format.
+
+        Ngram counts are stored frozen (see `NgramCounter.freeze`) as flat
+        integer arrays, and anything the smoothing algorithm precomputes from
+        them is stored along with them. Vocabulary and model parameters are
+        kept in a JSON header. Parameters must be JSON serializable.
+        Use `load` to read the model back.
+
+        :param path: Name of the file to write.
+
+        """
+        counts = self.counts
+        if not isinstance(counts, FrozenNgramCounter):
+            counts = counts.freeze(self.vocab)
+        arrays = []
+        offset = 0
+
+        def store_array(values):
+            nonlocal offset
+            offset = _aligned(offset)
+            typecode = getattr(values, "typecode", None) or values.format
+            arrays.append((offset, values))
+            description = [typecode, offset, len(values)]
+            offset += len(values) * values.itemsize
+            return description
+
+        header = {
+            "byteorder": sys.byteorder,
+            "model": _qualified_name(type(self)),
+            "state": {
+                name: value
+                for name, value in vars(self).items()
+                if name not in ("vocab", "counts", "estimator")
+            },
+            "vocabulary": {
+                "unk_label": self.vocab.unk_label,
+                "cutoff": self.vocab.cutoff,
+                "counts": dict(self.vocab.counts),
+            },
+            "counts": counts._to_state(store_array),
+        }
+        estimator = getattr(self, "estimator", None)
+        if estimator is not None:
+            estimator.precompute()
+            state, counters = {}, {}
+            for name, value in vars(estimator).items():
+                if name in ("vocab", "counts"):
+                    continue
+                if isinstance(value, NgramCounter):
+                    value = value.freeze()
+                if isinstance(value, FrozenNgramCounter):
+                    counters[name] = value._to_state(store_array)
+                else:
+                    state[name] = value
+            header["estimator"] = {
+                "class": _qualified_name(type(estimator)),
+                "state": state,
+                "counters": counters,
+            }
+
+        with open(path, "wb") as outfile:
+            data_start = write_binary_header(outfile, _MAGIC, _FORMAT_VERSION, header)
+            for array_offset, values in arrays:
+                outfile.write(b"\0" * (data_start + array_offset - outfile.tell()))
+                outfile.write(values.tobytes())
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """Loads a model saved with `save`.
+
+        By default the count arrays are memory-mapped rather than read, so
+        loading is fast and processes that load the same file share one copy
+        of the counts through the page cache. The loaded model's counts are a
+        read-only `FrozenNgramCounter`.
+
+        >>> import os, tempfile
+        >>> from nltk.lm import Laplace
+        >>> lm = Laplace(2)
+        >>> lm.fit([[("a", "b"), ("a",), ("b",)]], vocabulary_text=["a", "b"])
+        >>> path = os.path.join(tempfile.mkdtemp(), "laplace.lm")
+        >>> lm.save(path)
+        >>> loaded = Laplace.load(path)
+        >>> type(loaded).__name__, loaded.score("b", ["a"]) == lm.score("b", ["a"])
+        ('Laplace', True)
+
+        :param path: Name of the file to read.
+        :param bool use_mmap: Whether to memory-map the counts.
+        :raises ValueError: if the file is not a saved model or was saved
+            in an incompatible format.
+
+        """
+        with open(path, "rb") as infile:
+            _, header, data_start = read_binary_header(
+                infile, _MAGIC, _FORMAT_VERSION, "saved language model"
+            )
+            if header["byteorder"] != sys.byteorder:
+                raise ValueError(
+                    f"{path} was saved on a {header['byteorder']}-endian machine."
+                )
+            if use_mmap:
+                data = memoryview(
+                    mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+                )
+            else:
+                infile.seek(0)
+                data = memoryview(infile.read())
+
+        def load_array(description):
+            typecode, offset, length = description
+            start = data_start + offset
+            end = start + length * struct.calcsize(typecode)
+            return data[start:end].cast(typecode)
+
+        model_cls = _import_class(header["model"], cls)
+        model = model_cls.__new__(model_cls)
+        vars(model).update(header["state"])
+        vocab = header["vocabulary"]
+        model.vocab = Vocabulary(
+            vocab["counts"], unk_cutoff=vocab["cutoff"], unk_label=vocab["unk_label"]
+        )
+        model.counts = FrozenNgramCounter._from_state(header["counts"], load_array)
+        if "estimator" in header:
+            estimator_cls = _import_class(header["estimator"]["class"], Smoothing)
+            estimator = estimator_cls.__new__(estimator_cls)
+            vars(estimator).update(header["estimator"]["state"])
+            for name, state in header["estimator"]["counters"].items():
+                setattr(
+                    estimator, name, FrozenNgramCounter._from_state(state, load_array)
+                )
+            estimator.vocab = model.vocab
+            estimator.counts = model.counts
+            model.estimator = estimator
+        return model
 
     def score(self, word, context=None):
         """Masks out of vocab (OOV) words and computes their model score.
@@ -149,6 +400,109 @@ class LanguageModel(metaclass=ABCMeta):
         """
         return log_base2(self.score(word, context))
 
+    def score_many(self, text_ngrams, cache_size=100000, chunksize=1000):
+        """Score a stream of ngrams, yielding one score per ngram.
+
+        Gives the same results as calling `score` on every ngram, but scores
+        for ngrams that occur repeatedly in the stream (for instance when
+        ranking many similar candidate sentences) are only computed once.
+        Models can also reuse intermediate results across ngrams, see
+        `_cached_unmasked_score`. Scores are yielded lazily; to keep memory
+        bounded the cache is cleared whenever it holds `cache_size` entries.
+
+        If NumPy is installed and the counts are frozen (see
+        `NgramCounter.freeze`), as they are for models read with `load`,
+        ngrams are instead scored `chunksize` at a time, in vectorized
+        passes over their word ids. This is supported by the MLE, Lidstone
+        and interpolated models; others score ngrams one by one.
+
+        :param Iterable(tuple(str)) text_ngrams: A sequence of ngram tuples.
+        :param int cache_size: Maximum number of scores kept in the cache.
+        :param int chunksize: Number of ngrams scored at once with NumPy.
+        :rtype: Iterator(float)
+
+        """
+        ngram_cache, cache = {}, {}
+
+        def cached_score(ngram):
+            score = ngram_cache.get(ngram)
+            if score is None:
+                if len(cache) >= cache_size:
+                    ngram_cache.clear()
+                    cache.clear()
+                masked = self.vocab.lookup(ngram)
+                score = ngram_cache[ngram] = self._cached_unmasked_score(
+                    masked[-1], masked[:-1], cache
+                )
+            return score
+
+        if np is None or not isinstance(self.counts, FrozenNgramCounter):
+            for ngram in text_ngrams:
+                yield cached_score(tuple(ngram))
+            return
+        text_ngrams = iter(text_ngrams)
+        while True:
+            chunk = [tuple(ngram) for ngram in islice(text_ngrams, chunksize)]
+            if not chunk:
+                return
+            yield from self._score_chunk(chunk, cached_score)
+
+    def _score_chunk(self, ngrams, cached_score):
+        """Score a list of ngrams with `_unmasked_score_many`, falling back
+        on `cached_score` for the ngrams it cannot score."""
+        masked = [self.vocab.lookup(ngram) for ngram in ngrams]
+        rows = defaultdict(list)
+        for i, ngram in enumerate(masked):
+            rows[len(ngram)].append(i)
+        scores = [None] * len(ngrams)
+        for length, indices in rows.items():
+            many = None
+            if length:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    many = self._unmasked_score_many([masked[i] for i in indices])
+            if many is None:
+                many = [math.nan] * len(indices)
+            else:
+                many = many.tolist()
+            for i, score in zip(indices, many):
+                # Ngrams that would raise an error, or that need another
+                # path through `unmasked_score`, are scored one by one.
+                scores[i] = cached_score(ngrams[i]) if math.isnan(score) else score
+        return scores
+
+    def _unmasked_score_many(self, ngrams):
+        """Score equally long ngrams at once with NumPy.
+
+        Called by `score_many` when the counts are frozen. `ngrams` are
+        already masked with the OOV label. Returns an array of scores, with
+        NaN for ngrams that must be scored with `unmasked_score` instead; or
+        None, by default, for models that have no vectorized scoring.
+        """
+        return None
+
+    def logscore_many(self, text_ngrams, cache_size=100000):
+        """Evaluate the log scores of a stream of ngrams.
+
+        The arguments are the same as for `score_many`.
+
+        :rtype: Iterator(float)
+
+        """
+        return map(log_base2, self.score_many(text_ngrams, cache_size))
+
+    def _cached_unmasked_score(self, word, context, cache):
+        """Look up `unmasked_score` in `cache`, computing it if needed.
+
+        `context` is a (possibly empty) tuple of words already masked with the
+        OOV label. Models that compute scores recursively can override this to
+        cache every step of the recursion.
+        """
+        key = context + (word,)
+        score = cache.get(key)
+        if score is None:
+            score = cache[key] = self.unmasked_score(word, context or None)
+        return score
+
     def context_counts(self, context):
         """Helper method for retrieving counts for a given context.
 
@@ -167,12 +521,15 @@ class LanguageModel(metaclass=ABCMeta):
         as used and referenced by Dan Jurafsky and Jordan Boyd-Graber.
 
         :param Iterable(tuple(str)) text_ngrams: A sequence of ngram tuples.
+            Can be any iterable, ngrams are consumed one at a time.
         :rtype: float
 
         """
-        return -1 * _mean(
-            [self.logscore(ngram[-1], ngram[:-1]) for ngram in text_ngrams]
-        )
+        # Accumulate as we go so that memory use does not depend on text length.
+        total, count = 0.0, 0
+        for count, logscore in enumerate(self.logscore_many(text_ngrams), 1):
+            total += logscore
+        return -1 * total / count
 
     def perplexity(self, text_ngrams):
         """Calculates the perplexity of the given text.
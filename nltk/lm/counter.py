@@ -9,11 +9,20 @@ Language Model Counter
 ----------------------
 """
 
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from itertools import islice
+from operator import itemgetter
 
 from nltk.probability import ConditionalFreqDist, FreqDist
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class NgramCounter:
     """Class for counting ngrams.
@@ -84,6 +93,15 @@ class NgramCounter:
     >>> ngram_counts['e']
     1
 
+    Once training is done, the counter can be frozen into a compact read-only
+    version with the same lookup interface.
+
+    >>> frozen_counts = ngram_counts.freeze()
+    >>> frozen_counts[['a']]['b']
+    1
+    >>> frozen_counts.N() == ngram_counts.N()
+    True
+
     """
 
     def __init__(self, ngram_text=None):
@@ -113,6 +131,8 @@ class NgramCounter:
 
         """
 
+        # Local names save attribute lookups in this hot loop.
+        counts, unigrams = self._counts, self.unigrams
         for sent in ngram_text:
             for ngram in sent:
                 if not isinstance(ngram, tuple):
@@ -122,11 +142,49 @@ class NgramCounter:
 
                 ngram_order = len(ngram)
                 if ngram_order == 1:
-                    self.unigrams[ngram[0]] += 1
+                    unigrams[ngram[0]] += 1
                     continue
 
                 context, word = ngram[:-1], ngram[-1]
-                self[ngram_order][context][word] += 1
+                counts[ngram_order][context][word] += 1
+
+    def merge(self, other):
+        """Adds the counts from another `NgramCounter` to this one.
+
+        >>> from nltk.lm import NgramCounter
+        >>> counts = NgramCounter([[("a", "b"), ("a",)]])
+        >>> counts.merge(NgramCounter([[("a", "b"), ("a", "c")]]))
+        >>> counts[['a']]['b'], counts[['a']]['c'], counts['a']
+        (2, 1, 1)
+
+        :param NgramCounter other: The counter whose counts to add.
+
+        """
+        if not isinstance(other, NgramCounter):
+            raise TypeError(
+                f"Can only merge an NgramCounter, not {other.__class__.__name__}."
+            )
+        for ngram_order, cfd in other._counts.items():
+            if ngram_order == 1:
+                self.unigrams.update(cfd)
+                continue
+            if not cfd:
+                continue
+            own_cfd = self._counts[ngram_order]
+            for context, freqdist in cfd.items():
+                own_cfd[context].update(freqdist)
+
+    def freeze(self, vocabulary=None):
+        """Returns a compact, read-only copy of these counts.
+
+        See `FrozenNgramCounter` for details.
+
+        :param vocabulary: Optional vocabulary whose items get word ids first.
+        :type vocabulary: nltk.lm.Vocabulary or None
+        :rtype: FrozenNgramCounter
+
+        """
+        return FrozenNgramCounter(self, vocabulary)
 
     def N(self):
         """Returns grand total number of ngrams stored.
@@ -161,3 +219,468 @@ class NgramCounter:
 
     def __contains__(self, item):
         return item in self._counts
+
+
+def _compact_array(values):
+    """Store non-negative integers in the smallest array type that fits them."""
+    values = list(values)
+    largest = max(values, default=0)
+    for typecode in "BHIQ":
+        if largest < 1 << (8 * array(typecode).itemsize):
+            return array(typecode, values)
+    raise OverflowError(f"Count is too large to be stored: {largest}")
+
+
+class FrozenFreqDist(Mapping):
+    """Read-only frequency distribution over a slice of a `FrozenNgramCounter`.
+
+    Behaves like the `nltk.FreqDist` it was created from as far as lookups
+    go: missing words have a count of zero and `N`, `B`, `freq` and
+    `most_common` are supported.
+    """
+
+    def __init__(self, counter, word_ids, counts, start, end, total):
+        self._counter = counter
+        self._word_ids = word_ids
+        self._counts = counts
+        self._start = start
+        self._end = end
+        self._N = total
+
+    def _position(self, word):
+        word_id = self._counter._word_ids.get(word)
+        if word_id is None:
+            return None
+        i = bisect_left(self._word_ids, word_id, self._start, self._end)
+        return i if i < self._end and self._word_ids[i] == word_id else None
+
+    def __getitem__(self, word):
+        i = self._position(word)
+        return 0 if i is None else self._counts[i]
+
+    def __contains__(self, word):
+        return self._position(word) is not None
+
+    def get(self, word, default=None):
+        """Return the count of ``word``, or ``default`` if it was not seen,
+        as `nltk.FreqDist` does."""
+        i = self._position(word)
+        return default if i is None else self._counts[i]
+
+    def __iter__(self):
+        words = self._counter._words
+        return (words[self._word_ids[i]] for i in range(self._start, self._end))
+
+    def __len__(self):
+        return self._end - self._start
+
+    def items(self):
+        return zip(self, self.values())
+
+    def values(self):
+        return islice(self._counts, self._start, self._end)
+
+    def N(self):
+        """Return the total number of sample outcomes in this distribution."""
+        return self._N
+
+    def B(self):
+        """Return the number of sample values with nonzero counts."""
+        return len(self)
+
+    def freq(self, word):
+        """Return the frequency of ``word``, as in `nltk.FreqDist.freq`."""
+        if self._N == 0:
+            return 0
+        return self[word] / self._N
+
+    def most_common(self, n=None):
+        """List the ``n`` most common words and their counts."""
+        ranked = sorted(self.items(), key=itemgetter(1), reverse=True)
+        return ranked if n is None else ranked[:n]
+
+    def __repr__(self):
+        return "<{} with {} samples and {} outcomes>".format(
+            self.__class__.__name__, len(self), self._N
+        )
+
+
+class FrozenConditionalFreqDist(Mapping):
+    """Read-only mapping from contexts to `FrozenFreqDist` for one ngram order.
+
+    Unlike `nltk.ConditionalFreqDist`, looking up an unseen context returns an
+    empty distribution without adding it to the mapping.
+    """
+
+    def __init__(self, counter, order):
+        self._counter = counter
+        self._order = order
+
+    def __getitem__(self, context):
+        return self._counter._context_dist(self._order, context)
+
+    def __contains__(self, context):
+        return self._counter._find_context(self._order, context) is not None
+
+    def get(self, context, default=None):
+        """Return the distribution of ``context``, or ``default`` if it was
+        not seen, as `nltk.ConditionalFreqDist` does."""
+        return self[context] if context in self else default
+
+    def __iter__(self):
+        return self._counter._iter_contexts(self._order)
+
+    def __len__(self):
+        return self._counter._num_contexts(self._order)
+
+    def conditions(self):
+        """Return a list of the contexts in this distribution."""
+        return list(self)
+
+    def N(self):
+        """Return the total number of ngrams of this order."""
+        return self._counter._order_totals.get(self._order, 0)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} with {len(self)} conditions>"
+
+
+class FrozenNgramCounter:
+    """Compact, read-only ngram counts.
+
+    Created from a trained `NgramCounter` with its `freeze` method. Words are
+    replaced by integer ids and for every ngram order the counts are stored in
+    a sorted array trie: each context word is a node whose children are found
+    by binary search, and the leaves hold the ids and counts of the words that
+    follow the context. This takes a small fraction of the memory used by
+    nested `FreqDist` objects.
+
+    Lookups work the same as for `NgramCounter`, so the frozen counter can be
+    passed to any of the language models in `nltk.lm` with the ``counter``
+    argument. Trying to update it raises a `TypeError`.
+
+    >>> from nltk.lm import MLE, NgramCounter, Vocabulary
+    >>> text = [("a", "b"), ("b", "c"), ("a",), ("b",), ("c",)]
+    >>> frozen = NgramCounter([text]).freeze()
+    >>> print(frozen)
+    <FrozenNgramCounter with 2 ngram orders and 5 ngrams>
+    >>> frozen['b'], frozen[['a']]['b'], frozen[['a']]['c']
+    (1, 1, 0)
+    >>> sorted(frozen[2])
+    [('a',), ('b',)]
+    >>> lm = MLE(2, vocabulary=Vocabulary("abc"), counter=frozen)
+    >>> lm.score("b", ["a"])
+    1.0
+
+    Empty contexts of the original counter are not kept.
+    """
+
+    def __init__(self, counter, vocabulary=None):
+        """Freezes the counts of `counter`.
+
+        :param counter: The counts to freeze.
+        :type counter: NgramCounter
+        :param vocabulary: If given, the ids of its items are assigned first,
+            in sorted order. Other words in the counts get ids after them.
+        :type vocabulary: nltk.lm.Vocabulary or None
+
+        """
+        counts = counter._counts
+        vocab_words = sorted(vocabulary) if vocabulary is not None else []
+        seen = set(vocab_words)
+        other_words = set(counts[1])
+        for order, cfd in counts.items():
+            if order == 1:
+                continue
+            for context, dist in cfd.items():
+                if dist:
+                    other_words.update(context)
+                    other_words.update(dist)
+        self._words = vocab_words + sorted(other_words - seen)
+        self._word_ids = {word: i for i, word in enumerate(self._words)}
+
+        self._orders = sorted(counts)
+        # For each order: (context levels, leaf word ids, leaf counts, totals).
+        # Every context level is a pair (word ids, child offsets) and the
+        # children of node i span child offsets [i] to [i + 1] of the next level.
+        self._tries = {}
+        self._order_totals = {}
+        word_ids = self._word_ids
+        for order in self._orders:
+            if order == 1:
+                entries = sorted(
+                    ((), word_ids[word], count) for word, count in counts[1].items()
+                )
+            else:
+                entries = sorted(
+                    (tuple(word_ids[w] for w in context), word_ids[word], count)
+                    for context, dist in counts[order].items()
+                    for word, count in dist.items()
+                )
+            self._tries[order] = self._build_trie(order - 1, entries)
+            self._order_totals[order] = sum(self._tries[order][3])
+
+        self._empty_dist = FrozenFreqDist(self, array("B"), array("B"), 0, 0, 0)
+        self.unigrams = self._context_dist(1, ())
+        self._search_arrays = {}
+
+    def _to_state(self, store_array):
+        """Describes this counter, passing all its arrays to `store_array`.
+
+        Used by `nltk.lm.api.LanguageModel.save`. The description contains
+        whatever `store_array` returns in place of each array.
+        """
+        tries = {}
+        for order, (levels, leaf_words, leaf_counts, totals) in self._tries.items():
+            tries[order] = [
+                [
+                    [store_array(word_ids), store_array(offsets)]
+                    for word_ids, offsets in levels
+                ],
+                store_array(leaf_words),
+                store_array(leaf_counts),
+                store_array(totals),
+            ]
+        return {
+            "words": self._words,
+            "orders": self._orders,
+            "order_totals": self._order_totals,
+            "tries": tries,
+        }
+
+    @classmethod
+    def _from_state(cls, state, load_array):
+        """Recreates a counter described by `_to_state`.
+
+        `load_array` turns the stored descriptions back into arrays, which can
+        be any sequences of integers that support slicing, such as memoryviews.
+        """
+        counter = cls.__new__(cls)
+        counter._words = state["words"]
+        counter._word_ids = {word: i for i, word in enumerate(counter._words)}
+        counter._orders = [int(order) for order in state["orders"]]
+        counter._tries = {}
+        counter._order_totals = {
+            int(order): total for order, total in state["order_totals"].items()
+        }
+        for order, (levels, leaf_words, leaf_counts, totals) in state["tries"].items():
+            order = int(order)
+            counter._tries[order] = (
+                [
+                    (load_array(word_ids), load_array(offsets))
+                    for word_ids, offsets in levels
+                ],
+                load_array(leaf_words),
+                load_array(leaf_counts),
+                load_array(totals),
+            )
+        counter._empty_dist = FrozenFreqDist(counter, array("B"), array("B"), 0, 0, 0)
+        counter.unigrams = counter._context_dist(1, ())
+        counter._search_arrays = {}
+        return counter
+
+    @staticmethod
+    def _build_trie(depth, entries):
+        level_words = [[] for _ in range(depth)]
+        level_offsets = [[] for _ in range(depth)]
+        leaf_words, leaf_counts, totals = [], [], []
+        previous = None
+        for context, word, count in entries:
+            # Find where this context diverges from the previous one and
+            # add nodes for the rest of it.
+            shared = 0
+            if previous is not None:
+                while shared < depth and context[shared] == previous[shared]:
+                    shared += 1
+            for level in range(shared, depth):
+                level_words[level].append(context[level])
+                children = level_words[level + 1] if level + 1 < depth else leaf_words
+                level_offsets[level].append(len(children))
+            if shared < depth or previous is None:
+                totals.append(0)
+            totals[-1] += count
+            leaf_words.append(word)
+            leaf_counts.append(count)
+            previous = context
+        levels = []
+        for level in range(depth):
+            children = level_words[level + 1] if level + 1 < depth else leaf_words
+            level_offsets[level].append(len(children))
+            levels.append(
+                (
+                    _compact_array(level_words[level]),
+                    _compact_array(level_offsets[level]),
+                )
+            )
+        return (
+            levels,
+            _compact_array(leaf_words),
+            _compact_array(leaf_counts),
+            _compact_array(totals),
+        )
+
+    def _context_dist(self, order, context):
+        found = self._find_context(order, context)
+        if found is None:
+            return self._empty_dist
+        _, leaf_words, leaf_counts, _ = self._tries[order]
+        return FrozenFreqDist(self, leaf_words, leaf_counts, *found)
+
+    def _find_context(self, order, context):
+        """Locate the leaves of `context`.
+
+        Returns their start and end positions and the context's total count,
+        or None if the context was not seen.
+        """
+        if order not in self._tries or len(context) != order - 1:
+            return None
+        levels, leaf_words, _, totals = self._tries[order]
+        if not leaf_words:
+            return None
+        start, end = 0, len(levels[0][0]) if levels else len(leaf_words)
+        node = 0
+        for word, (word_ids, offsets) in zip(context, levels):
+            word_id = self._word_ids.get(word)
+            if word_id is None:
+                return None
+            node = bisect_left(word_ids, word_id, start, end)
+            if node == end or word_ids[node] != word_id:
+                return None
+            start, end = offsets[node], offsets[node + 1]
+        return start, end, totals[node]
+
+    def _encode_many(self, ngrams):
+        """Return the word ids of equally long ngrams as a NumPy array with a
+        row per ngram, and -1 for words that are not in the counts."""
+        get = self._word_ids.get
+        return np.fromiter(
+            (get(word, -1) for ngram in ngrams for word in ngram),
+            dtype=np.int64,
+            count=sum(map(len, ngrams)),
+        ).reshape(len(ngrams), -1)
+
+    def _get_search_arrays(self, order):
+        """The arrays `_lookup_many` searches for ngrams of `order`.
+
+        Each trie level is turned into one sorted array of keys, where the
+        key of a node is its parent's position times the number of words,
+        plus its word id; so a node is found with a single binary search
+        over the whole level. Also returns the leaf counts and context
+        totals, and the number of nonzero counts before each leaf.
+        """
+        arrays = self._search_arrays.get(order)
+        if arrays is None:
+            levels, leaf_words, leaf_counts, totals = self._tries[order]
+            width = len(self._words)
+            keys = []
+            parents = np.zeros(len(levels[0][0]) if levels else len(leaf_words), int)
+            for word_ids, offsets in levels:
+                keys.append(parents * width + np.asarray(word_ids, dtype=np.int64))
+                parents = np.repeat(np.arange(len(word_ids)), np.diff(offsets))
+            keys.append(parents * width + np.asarray(leaf_words, dtype=np.int64))
+            leaf_counts = np.asarray(leaf_counts, dtype=np.int64)
+            nonzero = np.concatenate(([0], np.cumsum(leaf_counts > 0)))
+            offsets = np.asarray(levels[-1][1]) if levels else [0, len(leaf_words)]
+            arrays = self._search_arrays[order] = (
+                keys,
+                leaf_counts,
+                np.asarray(totals, dtype=np.int64),
+                np.asarray(offsets, dtype=np.int64),
+                nonzero,
+            )
+        return arrays
+
+    def _lookup_many(self, ngram_ids):
+        """Look up many ngrams of the same order at once, with NumPy.
+
+        `ngram_ids` are word ids as given by `_encode_many`. Returns four
+        arrays: the count of each ngram, the total count of its context, the
+        number of words seen after its context with a count above zero, and
+        whether the context was seen at all. Counts are zero for unseen
+        contexts.
+        """
+        n, order = ngram_ids.shape
+        zeros = np.zeros(n, dtype=np.int64)
+        if order not in self._tries or not len(self._tries[order][1]):
+            return zeros, zeros, zeros, np.zeros(n, dtype=bool)
+        keys, leaf_counts, totals, offsets, nonzero = self._get_search_arrays(order)
+        width = len(self._words)
+        found = np.ones(n, dtype=bool)
+        node = zeros
+        for level, level_keys in enumerate(keys):
+            if level == order - 1:
+                context, context_found = node, found
+            word_ids = ngram_ids[:, level]
+            query = node * width + word_ids
+            node = np.searchsorted(level_keys, query)
+            node[node == len(level_keys)] = 0
+            found = found & (word_ids >= 0) & (level_keys[node] == query)
+        context = np.where(context_found, context, 0)
+        start, end = offsets[context], offsets[context + 1]
+        return (
+            np.where(found, leaf_counts[node], 0),
+            np.where(context_found, totals[context], 0),
+            np.where(context_found, nonzero[end] - nonzero[start], 0),
+            context_found,
+        )
+
+    def _iter_contexts(self, order):
+        if order not in self._tries:
+            return iter(())
+        levels = self._tries[order][0]
+        if not levels:
+            return iter([()] if self._tries[order][1] else [])
+        return self._walk_levels(levels, 0, 0, len(levels[0][0]), ())
+
+    def _walk_levels(self, levels, level, start, end, prefix):
+        word_ids, offsets = levels[level]
+        for node in range(start, end):
+            context = prefix + (self._words[word_ids[node]],)
+            if level + 1 == len(levels):
+                yield context
+            else:
+                yield from self._walk_levels(
+                    levels, level + 1, offsets[node], offsets[node + 1], context
+                )
+
+    def _num_contexts(self, order):
+        if order not in self._tries:
+            return 0
+        return len(self._tries[order][3])
+
+    def update(self, ngram_text):
+        raise TypeError(f"{self.__class__.__name__} cannot be updated.")
+
+    def merge(self, other):
+        raise TypeError(f"{self.__class__.__name__} cannot be updated.")
+
+    def freeze(self, vocabulary=None):
+        return self
+
+    def N(self):
+        """Returns grand total number of ngrams stored.
+
+        :rtype: int
+
+        """
+        return sum(self._order_totals.values())
+
+    def __getitem__(self, item):
+        """User-friendly access to ngram counts."""
+        if isinstance(item, int):
+            return self.unigrams if item == 1 else FrozenConditionalFreqDist(self, item)
+        elif isinstance(item, str):
+            return self.unigrams[item]
+        elif isinstance(item, Sequence):
+            return self[len(item) + 1][tuple(item)]
+
+    def __str__(self):
+        return "<{} with {} ngram orders and {} ngrams>".format(
+            self.__class__.__name__, len(self), self.N()
+        )
+
+    def __len__(self):
+        return len(self._orders)
+
+    def __contains__(self, item):
+        return item in self._tries
@@ -10,6 +10,11 @@
 from nltk.lm.api import LanguageModel, Smoothing
 from nltk.lm.smoothing import AbsoluteDiscounting, KneserNey, WittenBell
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class MLE(LanguageModel):
     """Class for providing MLE ngram model scores.
@@ -26,6 +31,12 @@ class MLE(LanguageModel):
         """
         return self.context_counts(context).freq(word)
 
+    def _unmasked_score_many(self, ngrams):
+        counts, totals, _, _ = self.counts._lookup_many(
+            self.counts._encode_many(ngrams)
+        )
+        return np.where(totals == 0, 0.0, counts / totals)
+
 
 class Lidstone(LanguageModel):
     """Provides Lidstone-smoothed scores.
@@ -49,6 +60,12 @@ class Lidstone(LanguageModel):
         norm_count = counts.N()
         return (word_count + self.gamma) / (norm_count + len(self.vocab) * self.gamma)
 
+    def _unmasked_score_many(self, ngrams):
+        counts, totals, _, _ = self.counts._lookup_many(
+            self.counts._encode_many(ngrams)
+        )
+        return (counts + self.gamma) / (totals + len(self.vocab) * self.gamma)
+
 
 class Laplace(Lidstone):
     """Implements Laplace (add one) smoothing.
@@ -99,17 +116,46 @@ class InterpolatedLanguageModel(LanguageModel):
         self.estimator = smoothing_cls(self.vocab, self.counts, **params)
 
     def unmasked_score(self, word, context=None):
+        return self._cached_unmasked_score(word, tuple(context or ()), {})
+
+    def _cached_unmasked_score(self, word, context, cache):
+        # Lower order scores are cached so that `score_many` can share them
+        # between all ngrams that end with the same words.
+        key = context + (word,)
+        score = cache.get(key)
+        if score is not None:
+            return score
         if not context:
             # The base recursion case: no context, we only have a unigram.
-            return self.estimator.unigram_score(word)
-        if not self.counts[context]:
-            # It can also happen that we have no data for this context.
-            # In that case we defer to the lower-order ngram.
-            # This is the same as setting alpha to 0 and gamma to 1.
-            alpha, gamma = 0, 1
+            score = self.estimator.unigram_score(word)
         else:
-            alpha, gamma = self.estimator.alpha_gamma(word, context)
-        return alpha + gamma * self.unmasked_score(word, context[1:])
+            if not self.counts[context]:
+                # It can also happen that we have no data for this context.
+                # In that case we defer to the lower-order ngram.
+                # This is the same as setting alpha to 0 and gamma to 1.
+                alpha, gamma = 0, 1
+            else:
+                alpha, gamma = self.estimator.alpha_gamma(word, context)
+            score = alpha + gamma * self._cached_unmasked_score(
+                word, context[1:], cache
+            )
+        cache[key] = score
+        return score
+
+    def _unmasked_score_many(self, ngrams):
+        # The same recursion as `_cached_unmasked_score`, from the unigrams up.
+        scores = self.estimator._unigram_score_many(ngrams)
+        for start in range(len(ngrams[0]) - 2, -1, -1):
+            if scores is None:
+                return None
+            found = self.estimator._alpha_gamma_many(
+                [ngram[start:] for ngram in ngrams]
+            )
+            if found is None:
+                return None
+            alpha, gamma, seen = found
+            scores = np.where(seen, alpha + gamma * scores, scores)
+        return scores
 
 
 class WittenBellInterpolated(InterpolatedLanguageModel):
@@ -139,3 +185,65 @@ class KneserNeyInterpolated(InterpolatedLanguageModel):
         super().__init__(
             KneserNey, order, params={"discount": discount, "order": order}, **kwargs
         )
+
+    def fit(self, text, vocabulary_text=None, **kwargs):
+        super().fit(text, vocabulary_text=vocabulary_text, **kwargs)
+        # Continuation counts are derived from the ngram counts, so they have
+        # to be recomputed after every update.
+        self.estimator.reset_continuation_index()
+
+
+def demo(num_sents=2000, sent_len=20, vocab_size=1000, order=3, num_scored=50):
+    """
+    Benchmark Kneser-Ney scoring on a synthetic corpus, comparing the
+    precomputed continuation index against scanning the higher order
+    counts for every score.
+    """
+    import random
+    import time
+
+    from nltk.lm.preprocessing import padded_everygram_pipeline
+    from nltk.lm.smoothing import _scan_continuation_counts
+
+    rng = random.Random(0)
+    words = [f"w{i}" for i in range(vocab_size)]
+    # A Zipf-like distribution gives a realistic mix of frequent and rare words.
+    weights = [1 / rank for rank in range(1, vocab_size + 1)]
+    sents = [rng.choices(words, weights, k=sent_len) for _ in range(num_sents)]
+
+    train, vocab = padded_everygram_pipeline(order, sents)
+    lm = KneserNeyInterpolated(order)
+    t = time.time()
+    lm.fit(train, vocab)
+    print(
+        f"Trained {order}-gram model on {num_sents * sent_len} tokens: {time.time() - t:.3f}s"
+    )
+
+    ngrams = [
+        tuple(sent[i : i + order])
+        for sent in rng.sample(sents, num_scored)
+        for i in range(sent_len - order + 1)
+    ]
+
+    t = time.time()
+    indexed = [lm.score(ngram[-1], ngram[:-1]) for ngram in ngrams]
+    indexed_time = time.time() - t
+
+    # Swap in the old implementation to compare against.
+    estimator = lm.estimator
+    estimator._continuation_counts = lambda word, context=(): (
+        _scan_continuation_counts(estimator.counts, word, context)
+    )
+    t = time.time()
+    scanned = [lm.score(ngram[-1], ngram[:-1]) for ngram in ngrams]
+    scanned_time = time.time() - t
+    del estimator._continuation_counts
+
+    print(f"Scored {len(ngrams)} ngrams")
+    print(f"  continuation index: {indexed_time:.3f}s")
+    print(f"  scanning counts:    {scanned_time:.3f}s")
+    print("  same scores:", indexed == scanned)
+
+
+if __name__ == "__main__":
+    demo()
@@ -13,7 +13,16 @@ Interpolation.
 from operator import methodcaller
 
 from nltk.lm.api import Smoothing
-from nltk.probability import ConditionalFreqDist
+from nltk.lm.counter import FrozenNgramCounter, NgramCounter
+from nltk.probability import ConditionalFreqDist, FreqDist
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Looked up for contexts that never occur inside a higher order ngram.
+_NO_CONTINUATIONS = FreqDist()
 
 
 def _count_values_gt_zero(distribution):
@@ -33,6 +42,16 @@ def _count_values_gt_zero(distribution):
     )
 
 
+def _lookup_many(counter, ngrams):
+    """Look up `ngrams` in a `FrozenNgramCounter`, see its `_lookup_many`."""
+    return counter._lookup_many(counter._encode_many(ngrams))
+
+
+def _freq_many(counts, totals):
+    """Vectorized `FreqDist.freq`."""
+    return np.where(totals == 0, 0.0, counts / totals)
+
+
 class WittenBell(Smoothing):
     """Witten-Bell smoothing."""
 
@@ -51,6 +70,18 @@ class WittenBell(Smoothing):
     def unigram_score(self, word):
         return self.counts.unigrams.freq(word)
 
+    def _alpha_gamma_many(self, ngrams):
+        counts, totals, n_plus, seen = _lookup_many(self.counts, ngrams)
+        alpha = _freq_many(counts, totals)
+        gamma = n_plus / (n_plus + totals)
+        return (1.0 - gamma) * alpha, gamma, seen
+
+    def _unigram_score_many(self, ngrams):
+        counts, totals, _, _ = _lookup_many(
+            self.counts, [ngram[-1:] for ngram in ngrams]
+        )
+        return _freq_many(counts, totals)
+
 
 class AbsoluteDiscounting(Smoothing):
     """Smoothing with absolute discount."""
@@ -74,6 +105,18 @@ class AbsoluteDiscounting(Smoothing):
     def unigram_score(self, word):
         return self.counts.unigrams.freq(word)
 
+    def _alpha_gamma_many(self, ngrams):
+        counts, totals, n_plus, seen = _lookup_many(self.counts, ngrams)
+        alpha = np.maximum(counts - self.discount, 0) / totals
+        gamma = (self.discount * n_plus) / totals
+        return alpha, gamma, seen
+
+    def _unigram_score_many(self, ngrams):
+        counts, totals, _, _ = _lookup_many(
+            self.counts, [ngram[-1:] for ngram in ngrams]
+        )
+        return _freq_many(counts, totals)
+
 
 class KneserNey(Smoothing):
     """Kneser-Ney Smoothing.
@@ -92,6 +135,7 @@ class KneserNey(Smoothing):
         super().__init__(vocabulary, counter, **kwargs)
         self.discount = discount
         self._order = order
+        self._continuation_index = None
 
     def unigram_score(self, word):
         word_continuation_count, total_count = self._continuation_counts(word)
@@ -108,6 +152,66 @@ class KneserNey(Smoothing):
         gamma = self.discount * _count_values_gt_zero(prefix_counts) / total_count
         return alpha, gamma
 
+    def _alpha_gamma_many(self, ngrams):
+        counts, totals, n_plus, seen = _lookup_many(self.counts, ngrams)
+        if len(ngrams[0]) != self._order:
+            counts, totals, _, _ = _lookup_many(
+                self._frozen_continuation_index(), ngrams
+            )
+        alpha = np.maximum(counts - self.discount, 0.0) / totals
+        gamma = self.discount * n_plus / totals
+        return alpha, gamma, seen
+
+    def _unigram_score_many(self, ngrams):
+        index = self._frozen_continuation_index()
+        counts, totals, _, _ = _lookup_many(index, [ngram[-1:] for ngram in ngrams])
+        return counts / totals
+
+    def _frozen_continuation_index(self):
+        # Only used when the counts are frozen, so the index can't change.
+        index = self.continuation_index()
+        if not isinstance(index, FrozenNgramCounter):
+            index = self._continuation_index = index.freeze()
+        return index
+
+    def precompute(self):
+        self.continuation_index()
+
+    def continuation_index(self):
+        """Continuation counts for every context, computed on first use.
+
+        The index is an `NgramCounter` (or a `FrozenNgramCounter` for models
+        loaded from disk). Its distribution for a context of length k maps each
+        word to the number of unique ngrams of order k + 2 that end with that
+        context and word. Every such ngram type is counted once, so the total
+        number of continuations of a context is simply the `N()` of its
+        distribution.
+        """
+        if self._continuation_index is None:
+            self._continuation_index = self._build_continuation_index()
+        return self._continuation_index
+
+    def reset_continuation_index(self):
+        """Discard the continuation counts precomputed from the counter.
+
+        The index is rebuilt the next time a score is requested, so this
+        should be called whenever the underlying counter is updated.
+        `KneserNeyInterpolated.fit` takes care of that automatically.
+        """
+        self._continuation_index = None
+
+    def _build_continuation_index(self):
+        index = NgramCounter()
+        for order in range(2, self._order + 1):
+            for prefix_ngram, counts in self.counts[order].items():
+                context = prefix_ngram[1:]
+                continuations = index[order - 1][context] if context else index[1]
+                for word, count in counts.items():
+                    # Same guard against negative counts as `_count_values_gt_zero`.
+                    if count > 0:
+                        continuations[word] += 1
+        return index
+
     def _continuation_counts(self, word, context=tuple()):
         """Count continuations that end with context and word.
 
@@ -115,13 +219,26 @@ class KneserNey(Smoothing):
         instances were observed for each "type".
         This is different than raw ngram counts which track number of instances.
         """
-        higher_order_ngrams_with_context = (
-            counts
-            for prefix_ngram, counts in self.counts[len(context) + 2].items()
-            if prefix_ngram[1:] == context
-        )
-        higher_order_ngrams_with_word_count, total = 0, 0
-        for counts in higher_order_ngrams_with_context:
-            higher_order_ngrams_with_word_count += int(counts[word] > 0)
-            total += _count_values_gt_zero(counts)
-        return higher_order_ngrams_with_word_count, total
+        continuations = self.continuation_index()[len(context) + 1]
+        if context:
+            continuations = continuations.get(context, _NO_CONTINUATIONS)
+        return continuations[word], continuations.N()
+
+
+def _scan_continuation_counts(counter, word, context=tuple()):
+    """Count continuations by scanning every context of the next higher order.
+
+    This is linear in the number of distinct contexts of order
+    ``len(context) + 2``. `KneserNey` uses a precomputed index instead; the scan
+    is kept as a reference for tests and for the benchmark in `nltk.lm.models`.
+    """
+    higher_order_ngrams_with_context = (
+        counts
+        for prefix_ngram, counts in counter[len(context) + 2].items()
+        if prefix_ngram[1:] == context
+    )
+    higher_order_ngrams_with_word_count, total = 0, 0
+    for counts in higher_order_ngrams_with_context:
+        higher_order_ngrams_with_word_count += int(counts[word] > 0)
+        total += _count_values_gt_zero(counts)
+    return higher_order_ngrams_with_word_count, total
@@ -25,7 +25,11 @@ def _(words, vocab):
     Returns an iterator over looked up words.
 
     """
-    return tuple(_dispatched_lookup(w, vocab) for w in words)
+    # Strings are by far the most common items, so they skip the dispatch.
+    return tuple(
+        _string_lookup(w, vocab) if isinstance(w, str) else _dispatched_lookup(w, vocab)
+        for w in words
+    )
 
 
 @_dispatched_lookup.register(str)
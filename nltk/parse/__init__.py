@@ -53,6 +53,7 @@ from nltk.parse.chart import (
     SteppingChartParser,
     TopDownChartParser,
 )
+from nltk.parse.cky import CKYParser
 from nltk.parse.corenlp import CoreNLPDependencyParser, CoreNLPParser
 from nltk.parse.dependencygraph import DependencyGraph
 from nltk.parse.earleychart import (
@@ -35,15 +35,19 @@ defines three chart parsers:
     be used to step through the parsing process.
 """
 
+import bisect
+import heapq
 import itertools
+import math
+import random
 import re
 import warnings
 from functools import total_ordering
 
-from nltk.grammar import PCFG, is_nonterminal, is_terminal
+from nltk.grammar import PCFG, FeatureGrammar, is_nonterminal, is_terminal
 from nltk.internals import raise_unorderable_types
 from nltk.parse.api import ParserI
-from nltk.tree import Tree
+from nltk.tree import ProbabilisticTree, Tree
 from nltk.util import OrderedDict
 
 ########################################################################
@@ -673,9 +677,32 @@ class Chart:
         Return an iterator of the complete tree structures that span
         the entire chart, and whose root node is ``root``.
         """
-        for edge in self.select(start=0, end=self._num_leaves, lhs=root):
+        for edge in self._root_edges(root):
             yield from self.trees(edge, tree_class=tree_class, complete=True)
 
+    def forest(self, root, tree_class=None, grammar=None):
+        """
+        Return a ``ParseForest`` of the complete tree structures that
+        span the entire chart, and whose root node is ``root``.  Unlike
+        ``parses``, the forest does not build any trees until they are
+        requested.
+
+        :param tree_class: The class of the trees; by default ``Tree``,
+            or ``ProbabilisticTree`` if ``grammar`` is given.
+        :type grammar: PCFG
+        :param grammar: The probabilistic grammar that the chart was
+            built with, if the trees should have probabilities.
+        :rtype: ParseForest
+        """
+        return ParseForest(self, self._root_edges(root), tree_class, grammar)
+
+    def _root_edges(self, root):
+        """
+        Return an iterator of the edges that span the entire chart, and
+        whose left hand side is ``root``.
+        """
+        return self.select(start=0, end=self._num_leaves, lhs=root)
+
     def trees(self, edge, tree_class=Tree, complete=False):
         """
         Return an iterator of the tree structures that are associated
@@ -906,6 +933,344 @@ class Chart:
         return s
 
 
+########################################################################
+##  Parse Forests
+########################################################################
+
+
+class ParseForest:
+    """
+    A packed forest of the complete parses in a ``Chart``.  Each complete
+    edge that the parses use is a node of the forest, which is shared by
+    all the parses, and the node's child pointer lists are its packed
+    alternatives.  The trees are only built when they are requested, so
+    a forest can stand for far more trees than fit in memory:
+
+    - ``count`` returns the number of trees, without building them;
+    - iterating over the forest yields the trees one at a time, in the
+      same order as ``Chart.parses``, and ``tree`` returns the tree with
+      a given index in that order;
+    - ``sample`` returns a random tree;
+    - if the forest has probabilities, ``best`` yields the trees in
+      descending order of probability.
+
+    As in ``Chart.trees``, an alternative is left out if it leads back
+    to an edge that contains it, so that a cyclic grammar does not give
+    infinitely many trees.
+
+        >>> from nltk.grammar import PCFG
+        >>> from nltk.parse.chart import ChartParser
+        >>> grammar = PCFG.fromstring('''
+        ...     S -> S S [0.4] | 'a' [0.6]
+        ... ''')
+        >>> parser = ChartParser(grammar)
+        >>> forest = parser.parse_forest(['a'] * 20)
+        >>> forest
+        <ParseForest with 1767263190 trees>
+        >>> best = next(forest.best())
+        >>> print('%.4g' % best.prob())
+        1.005e-12
+        >>> print(forest.tree(forest.count() - 1).pformat(margin=1000)[:48])
+        (S (S (S (S (S (S (S (S (S (S (S a) (S a)) (S (S
+        >>> forest.sample().leaves() == ['a'] * 20
+        True
+    """
+
+    def __init__(self, chart, root_edges, tree_class=None, grammar=None):
+        """
+        Create the forest of the trees of ``root_edges`` in ``chart``.
+
+        :type chart: Chart
+        :param root_edges: The edges whose complete trees are in the
+            forest.
+        :param tree_class: The class of the trees; by default ``Tree``,
+            or ``ProbabilisticTree`` if ``grammar`` is given.
+        :type grammar: PCFG
+        :param grammar: The probabilistic grammar that the chart was
+            built with, if the trees should have probabilities.
+        """
+        self._chart = chart
+        # For each node: its edge (None for the root of the forest, whose
+        # alternatives are the root edges), the tuples of child nodes
+        # of its alternatives, and the cumulative counts of their trees.
+        # Children are numbered before their parents.
+        self._edges = []
+        self._alternatives = []
+        self._cumulative = []
+        roots = []
+        for edge in root_edges:
+            # As in ``Chart.trees``, the nodes are only shared within the
+            # trees of one root edge: which alternatives lead back to an
+            # edge depends on the root that the edge is reached from.
+            node = self._add_edge(edge, {}, set())
+            if node is not None:
+                roots.append((node,))
+        self._root = self._add_node(None, roots)
+
+        if grammar is None:
+            self._tree_class = tree_class or Tree
+            self._logprobs = None
+        else:
+            self._tree_class = tree_class or ProbabilisticTree
+            self._set_logprobs(grammar)
+        self._derivations = {}
+        self._candidates = {}
+
+    def _add_node(self, edge, alternatives):
+        cumulative = list(
+            itertools.accumulate(
+                math.prod(self._cumulative[child][-1] for child in children)
+                for children in alternatives
+            )
+        )
+        self._edges.append(edge)
+        self._alternatives.append(alternatives)
+        self._cumulative.append(cumulative)
+        return len(self._edges) - 1
+
+    def _add_edge(self, edge, nodes, in_progress):
+        """
+        Add the node for ``edge``, and return it, or return None if
+        ``edge`` has no complete trees.
+
+        :param nodes: The nodes added so far for the current root edge.
+        :param in_progress: The edges whose nodes are being added.
+        """
+        if edge in nodes:
+            return nodes[edge]
+        if edge in in_progress or edge.is_incomplete():
+            return None
+        if isinstance(edge, LeafEdge):
+            alternatives = [()]
+        else:
+            in_progress.add(edge)
+            alternatives = []
+            for cpl in self._chart.child_pointer_lists(edge):
+                children = tuple(
+                    self._add_edge(child, nodes, in_progress) for child in cpl
+                )
+                if None not in children:
+                    alternatives.append(children)
+            in_progress.discard(edge)
+        if not alternatives:
+            node = None
+        else:
+            node = self._add_node(edge, alternatives)
+        nodes[edge] = node
+        return node
+
+    def _set_logprobs(self, grammar):
+        """
+        Record the log probabilities (base 2) of the productions of the
+        nodes, and of the best tree and all the trees of each node.
+        """
+        production_logprobs = {
+            (prod.lhs(), prod.rhs()): prod.logprob() for prod in grammar.productions()
+        }
+        self._logprobs = []
+        self._best_logprobs = []
+        self._inside_logprobs = []
+        for node, edge in enumerate(self._edges):
+            if edge is None or isinstance(edge, LeafEdge):
+                logprob = 0.0
+            else:
+                logprob = production_logprobs[edge.lhs(), edge.rhs()]
+            scores = [
+                logprob + sum(self._best_logprobs[child] for child in children)
+                for children in self._alternatives[node]
+            ]
+            inside = [
+                logprob + sum(self._inside_logprobs[child] for child in children)
+                for children in self._alternatives[node]
+            ]
+            self._logprobs.append(logprob)
+            self._best_logprobs.append(max(scores, default=-math.inf))
+            self._inside_logprobs.append(_log2_sum(inside))
+
+    def count(self):
+        """
+        Return the number of trees in the forest.
+
+        :rtype: int
+        """
+        return self._cumulative[self._root][-1] if self._cumulative[self._root] else 0
+
+    def __iter__(self):
+        for index in range(self.count()):
+            yield self.tree(index)
+
+    def tree(self, index):
+        """
+        Return the tree with the given index, in the order of
+        ``Chart.parses``.
+
+        :type index: int
+        :rtype: Tree
+        """
+        if not 0 <= index < self.count():
+            raise IndexError("Tree index out of range")
+        return self._tree(self._root, index)[0]
+
+    def _tree(self, node, index):
+        """
+        Return the tree of ``node`` with the given index, and its log
+        probability.
+        """
+        alternative = bisect.bisect_right(self._cumulative[node], index)
+        if alternative:
+            index -= self._cumulative[node][alternative - 1]
+        children = self._alternatives[node][alternative]
+        # The last child varies fastest, as in ``itertools.product``.
+        child_indices = []
+        for child in reversed(children):
+            index, child_index = divmod(index, self._cumulative[child][-1])
+            child_indices.append(child_index)
+        subtrees = [
+            self._tree(child, child_index)
+            for child, child_index in zip(children, reversed(child_indices))
+        ]
+        logprob = self._logprobs[node] if self._logprobs else 0.0
+        logprob += sum(subtree[1] for subtree in subtrees)
+        return self._make_tree(node, [subtree[0] for subtree in subtrees], logprob)
+
+    def _make_tree(self, node, children, logprob):
+        edge = self._edges[node]
+        if edge is None:
+            return children[0], logprob
+        if isinstance(edge, LeafEdge):
+            return self._chart.leaf(edge.start()), logprob
+        label = edge.lhs().symbol()
+        if self._logprobs is None:
+            return self._tree_class(label, children), logprob
+        return self._tree_class(label, children, logprob=logprob), logprob
+
+    def sample(self, random=random):
+        """
+        Return a random tree from the forest: with the probability of
+        the tree if the forest has probabilities, and otherwise with
+        the same probability for every tree.
+
+        :param random: The random number generator to use.
+        :type random: random.Random
+        :rtype: Tree
+        :raise ValueError: If the forest has no trees.
+        """
+        if not self.count():
+            raise ValueError("The forest has no trees")
+        if self._logprobs is None:
+            return self.tree(random.randrange(self.count()))
+        return self._sample(self._root, random)[0]
+
+    def _sample(self, node, random):
+        alternatives = self._alternatives[node]
+        weights = [
+            2
+            ** (
+                sum(self._inside_logprobs[child] for child in children)
+                + self._logprobs[node]
+                - self._inside_logprobs[node]
+            )
+            for children in alternatives
+        ]
+        children = random.choices(alternatives, weights)[0]
+        subtrees = [self._sample(child, random) for child in children]
+        logprob = self._logprobs[node] + sum(subtree[1] for subtree in subtrees)
+        return self._make_tree(node, [subtree[0] for subtree in subtrees], logprob)
+
+    def best(self):
+        """
+        Yield the trees of the forest in descending order of
+        probability.  The trees are enumerated lazily, with "Algorithm
+        3" of Huang and Chiang (2005), "Better k-best parsing", so the
+        first *k* trees take little more time than the first one.
+
+        :rtype: iter(ProbabilisticTree)
+        :raise ValueError: If the forest has no probabilities.
+        """
+        if self._logprobs is None:
+            raise ValueError("The forest has no probabilities")
+        rank = 0
+        while self._derivation(self._root, rank) is not None:
+            yield self._derivation_tree(self._root, rank)[0]
+            rank += 1
+
+    def _candidate(self, node, alternative, ranks):
+        """
+        Return a heap entry for the derivation of ``node`` by
+        ``alternative`` from the children's derivations of rank
+        ``ranks``, or None if a child has no such derivation.
+        """
+        logprob = self._logprobs[node]
+        for child, rank in zip(self._alternatives[node][alternative], ranks):
+            if rank == 0:
+                logprob += self._best_logprobs[child]
+            else:
+                derivation = self._derivation(child, rank)
+                if derivation is None:
+                    return None
+                logprob += derivation[0]
+        return (-logprob, alternative, ranks)
+
+    def _derivation(self, node, rank):
+        """
+        Return the derivation of ``node`` with the given rank (0 for
+        the best): a tuple of its log probability, its alternative, and
+        the ranks of the derivations of the alternative's children; or
+        None if the node has fewer derivations.
+        """
+        derivations = self._derivations.get(node)
+        if derivations is None:
+            derivations = self._derivations[node] = []
+            candidates = [
+                self._candidate(node, alternative, (0,) * len(children))
+                for alternative, children in enumerate(self._alternatives[node])
+            ]
+            heapq.heapify(candidates)
+            self._candidates[node] = (candidates, {c[1:] for c in candidates})
+        candidates, seen = self._candidates[node]
+        while len(derivations) <= rank:
+            if derivations:
+                # Add the successors of the last derivation.
+                _, alternative, ranks = derivations[-1]
+                for i in range(len(ranks)):
+                    successor = ranks[:i] + (ranks[i] + 1,) + ranks[i + 1 :]
+                    if (alternative, successor) not in seen:
+                        seen.add((alternative, successor))
+                        candidate = self._candidate(node, alternative, successor)
+                        if candidate is not None:
+                            heapq.heappush(candidates, candidate)
+            if not candidates:
+                return None
+            neg_logprob, alternative, ranks = heapq.heappop(candidates)
+            derivations.append((-neg_logprob, alternative, ranks))
+        return derivations[rank]
+
+    def _derivation_tree(self, node, rank):
+        logprob, alternative, ranks = self._derivation(node, rank)
+        children = self._alternatives[node][alternative]
+        subtrees = [
+            self._derivation_tree(child, child_rank)[0]
+            for child, child_rank in zip(children, ranks)
+        ]
+        return self._make_tree(node, subtrees, logprob)
+
+    def __repr__(self):
+        return "<ParseForest with %d trees>" % self.count()
+
+
+def _log2_sum(logprobs):
+    """
+    Return the log (base 2) of the sum of the probabilities whose logs
+    (base 2) are ``logprobs``.
+    """
+    if not logprobs:
+        return -math.inf
+    top = max(logprobs)
+    if top == -math.inf:
+        return top
+    return top + math.log2(sum(2 ** (logprob - top) for logprob in logprobs))
+
+
 ########################################################################
 ##  Chart Rules
 ########################################################################
@@ -1307,6 +1672,250 @@ def _bottomup_filter(grammar, nexttoken, rhs, dot=0):
         return grammar.is_leftcorner(_next, nexttoken)
 
 
+########################################################################
+##  Compiled Grammars
+########################################################################
+
+
+class CompiledGrammar:
+    """
+    A ``CFG`` compiled for fast Earley parsing, which is used by the
+    chart parsers when they are created with ``compiled=True``.
+
+    Every symbol of the grammar gets an integer id, and every production
+    with its dot at each position of its right hand side becomes a
+    "dotted rule" with an integer id, so that the parser can record an
+    edge as a pair of integers ``(dotted_rule, start)`` in a dictionary
+    for the edge's end, and follow it with list lookups instead of
+    method calls on ``TreeEdge`` objects.  ``TreeEdge`` objects are only
+    created for the complete edges, once the text has been parsed.
+
+    When a nonterminal is predicted, the productions of all its left
+    corners are predicted at once, except (if the grammar has no empty
+    productions) those that cannot start with the next word.  These
+    predictions are computed once for each nonterminal and word, and
+    stored in a table.
+    """
+
+    def __init__(self, grammar):
+        """
+        Compile ``grammar``.
+
+        :type grammar: CFG
+        :param grammar: The grammar to compile.  It must not be a
+            ``FeatureGrammar``, and its left corners must have been
+            calculated.
+        """
+        if isinstance(grammar, FeatureGrammar):
+            raise ValueError("Feature grammars cannot be compiled")
+        self._grammar = grammar
+        self._symbols = []
+        self._ids = {}
+        # The productions (without duplicates) and their left hand side
+        # ids, and for each dotted rule: its production, and the id of
+        # the symbol after its dot (-1 if it is complete).
+        self._productions = list(dict.fromkeys(grammar.productions()))
+        self._lhs = []
+        self._rule_production = []
+        self._rule_nextsym = []
+        self._first_rule = []
+        self._by_lhs = {}
+        for index, prod in enumerate(self._productions):
+            self._first_rule.append(len(self._rule_production))
+            for dot in range(len(prod) + 1):
+                self._rule_production.append(index)
+                if dot < len(prod):
+                    self._rule_nextsym.append(self._symbol_id(prod.rhs()[dot]))
+                else:
+                    self._rule_nextsym.append(-1)
+            self._lhs.append(self._symbol_id(prod.lhs()))
+            self._by_lhs.setdefault(self._lhs[-1], []).append(index)
+        self._is_terminal = [is_terminal(symbol) for symbol in self._symbols]
+        self._filter = grammar.is_nonempty()
+        self._word_starters = {}
+        self._predictions = {}
+
+    def _symbol_id(self, symbol):
+        if symbol not in self._ids:
+            self._ids[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+        return self._ids[symbol]
+
+    def grammar(self):
+        return self._grammar
+
+    def _starters(self, word):
+        """
+        Return the set of nonterminals that have ``word`` as a left corner.
+        """
+        if word not in self._word_starters:
+            grammar = self._grammar
+            starters = self._word_starters[word] = set()
+            if word is not None:
+                for prod in grammar.productions(rhs=word):
+                    starters.update(grammar.leftcorner_parents(prod.lhs()))
+        return self._word_starters[word]
+
+    def predictions(self, symbol, word):
+        """
+        Return the first dotted rules of the productions to predict for
+        the nonterminal with id ``symbol`` before ``word`` (None at the
+        end of the text), and the ids of the nonterminals that they are
+        the productions of.
+
+        :rtype: tuple(list(int), list(int))
+        """
+        key = (symbol, word)
+        if key not in self._predictions:
+            starters = self._starters(word)
+            rules = []
+            predicted = []
+            for cat in self._grammar.leftcorners(self._symbols[symbol]):
+                cat_id = self._ids.get(cat)
+                if cat_id is None:
+                    continue
+                predicted.append(cat_id)
+                if self._filter and cat not in starters:
+                    continue
+                for index in self._by_lhs.get(cat_id, ()):
+                    first = self._productions[index].rhs()[:1]
+                    if self._filter and not (
+                        first[0] == word
+                        if is_terminal(first[0])
+                        else first[0] in starters
+                    ):
+                        continue
+                    rules.append(self._first_rule[index])
+            self._predictions[key] = (rules, predicted)
+        return self._predictions[key]
+
+    def chart_parse(self, tokens, chart_class=Chart):
+        """
+        Parse ``tokens`` with Earley's algorithm, and return a chart of
+        class ``chart_class`` that contains the leaf edges and all the
+        complete edges that were found, with their child pointer lists.
+
+        :type tokens: list(str)
+        :rtype: Chart
+        """
+        tokens = list(tokens)
+        self._grammar.check_coverage(tokens)
+        num_leaves = len(tokens)
+        words = [self._ids.get(token, -1) for token in tokens] + [-1]
+        nextsym = self._rule_nextsym
+        rule_production = self._rule_production
+        production_lhs = self._lhs
+        terminal = self._is_terminal
+
+        # edges[end] maps each edge (dotted_rule, start) to its list of
+        # backpointers (split, child): the edge was formed from the edge
+        # (dotted_rule - 1, start) ending at split, and the complete
+        # edge of production child from split to end (or the leaf at
+        # split, if child is -1).  It is ordered by insertion, and the
+        # edges that end at an index are processed in that order.
+        edges = [{} for _ in range(num_leaves + 1)]
+        # waiting[index][symbol] lists the processed incomplete edges
+        # ending at index whose next symbol is the nonterminal symbol.
+        waiting = [{} for _ in range(num_leaves + 1)]
+        # empty[index][symbol] lists the productions of the processed
+        # complete edges for symbol from index to index.
+        empty = [{} for _ in range(num_leaves + 1)]
+
+        start_id = self._ids.get(self._grammar.start())
+        if start_id is not None:
+            for rule in self.predictions(start_id, tokens[0] if tokens else None)[0]:
+                edges[0][rule, 0] = []
+
+        for end in range(num_leaves + 1):
+            agenda = edges[end]
+            following = edges[end + 1] if end < num_leaves else None
+            waiting_here = waiting[end]
+            empty_here = empty[end]
+            word = tokens[end] if end < num_leaves else None
+            predicted = set()
+            # New edges are appended to the queue while it is iterated.
+            queue = list(agenda)
+            for rule, start in queue:
+                symbol = nextsym[rule]
+                if symbol < 0:
+                    # Complete edge: move the dot of the edges waiting
+                    # for its left hand side.
+                    production = rule_production[rule]
+                    lhs = production_lhs[production]
+                    if start == end:
+                        empty_here.setdefault(lhs, []).append(production)
+                    for left_rule, left_start in waiting[start].get(lhs, ()):
+                        key = (left_rule + 1, left_start)
+                        if key not in agenda:
+                            agenda[key] = []
+                            queue.append(key)
+                        agenda[key].append((start, production))
+                elif terminal[symbol]:
+                    # Scan the next word.
+                    if symbol == words[end]:
+                        following.setdefault((rule + 1, start), []).append((end, -1))
+                else:
+                    waiting_here.setdefault(symbol, []).append((rule, start))
+                    for production in empty_here.get(symbol, ()):
+                        key = (rule + 1, start)
+                        if key not in agenda:
+                            agenda[key] = []
+                            queue.append(key)
+                        agenda[key].append((end, production))
+                    if symbol not in predicted:
+                        rules, symbols = self.predictions(symbol, word)
+                        predicted.update(symbols)
+                        for first in rules:
+                            key = (first, end)
+                            if key not in agenda:
+                                agenda[key] = []
+                                queue.append(key)
+
+        return self._build_chart(tokens, edges, chart_class)
+
+    def _build_chart(self, tokens, edges, chart_class):
+        """
+        Return a chart with the leaf edges and the complete edges in
+        ``edges``, as built by ``chart_parse``.
+        """
+        chart = chart_class(tokens)
+        leaves = [LeafEdge(token, index) for index, token in enumerate(tokens)]
+        for leaf in leaves:
+            chart.insert(leaf, ())
+
+        tree_edges = {}
+        for end, agenda in enumerate(edges):
+            for rule, start in agenda:
+                if self._rule_nextsym[rule] < 0:
+                    production = self._rule_production[rule]
+                    prod = self._productions[production]
+                    tree_edges[production, start, end] = TreeEdge(
+                        (start, end), prod.lhs(), prod.rhs(), len(prod)
+                    )
+
+        memo = {}
+
+        def child_pointer_lists(rule, start, end):
+            if rule == self._first_rule[self._rule_production[rule]]:
+                return [()]
+            key = (rule, start, end)
+            if key not in memo:
+                memo[key] = cpls = []
+                for split, child in edges[end][rule, start]:
+                    if child < 0:
+                        child_edge = leaves[split]
+                    else:
+                        child_edge = tree_edges[child, split, end]
+                    for cpl in child_pointer_lists(rule - 1, start, split):
+                        cpls.append(cpl + (child_edge,))
+            return memo[key]
+
+        for (production, start, end), edge in tree_edges.items():
+            rule = self._first_rule[production] + len(edge.rhs())
+            chart.insert(edge, *child_pointer_lists(rule, start, end))
+        return chart
+
+
 ########################################################################
 ##  Generic Chart Parser
 ########################################################################
@@ -1358,6 +1967,7 @@ class ChartParser(ParserI):
         trace_chart_width=50,
         use_agenda=True,
         chart_class=Chart,
+        compiled=False,
     ):
         """
         Create a new chart parser, that uses ``grammar`` to parse
@@ -1382,8 +1992,14 @@ class ChartParser(ParserI):
             if possible.
         :param chart_class: The class that should be used to create
             the parse charts.
+        :type compiled: bool
+        :param compiled: Parse with a ``CompiledGrammar`` (Earley's
+            algorithm over integer ids) instead of the strategy.  The
+            charts contain the same complete parses, but only the leaf
+            and complete edges, and no trace output is printed.
         """
         self._grammar = grammar
+        self._compiled = CompiledGrammar(grammar) if compiled else None
         self._strategy = strategy
         self._trace = trace
         self._trace_chart_width = trace_chart_width
@@ -1424,6 +2040,8 @@ class ChartParser(ParserI):
         :type tokens: list(str)
         :rtype: Chart
         """
+        if self._compiled is not None:
+            return self._compiled.chart_parse(tokens, self._chart_class)
         if trace is None:
             trace = self._trace
         trace_new_edges = self._trace_new_edges
@@ -1472,7 +2090,21 @@ class ChartParser(ParserI):
 
     def parse(self, tokens, tree_class=Tree):
         chart = self.chart_parse(tokens)
-        return iter(chart.parses(self._grammar.start(), tree_class=tree_class))
+        return iter(chart.forest(self._grammar.start(), tree_class=tree_class))
+
+    def parse_forest(self, tokens):
+        """
+        Return a ``ParseForest`` of the parses of ``tokens``, from which
+        the trees can be counted, enumerated lazily and sampled without
+        building them all.  If the grammar is a ``PCFG``, the trees have
+        probabilities, and can be enumerated from the most likely one.
+
+        :type tokens: list(str)
+        :rtype: ParseForest
+        """
+        chart = self.chart_parse(tokens)
+        grammar = self._grammar if isinstance(self._grammar, PCFG) else None
+        return chart.forest(self._grammar.start(), grammar=grammar)
 
 
 class TopDownChartParser(ChartParser):
@@ -0,0 +1,611 @@
+# Natural Language Toolkit: CKY Probabilistic Parser
+#
+# Copyright (C) 2001-2024 NLTK Project
+# URL: <https://www.nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+A CKY parser for ``PCFG`` grammars.  ``CKYParser`` compiles the grammar
+into arrays of integer symbol ids, and fills its chart one span width
+at a time with NumPy operations over all the binary rules, rather than
+matching productions against a dictionary of constituents.  Besides the
+most likely parse, it finds the k most likely parses, the inside
+probability of a text and the posterior probabilities of its labelled
+spans (with the inside-outside algorithm).
+"""
+
+import heapq
+import math
+from itertools import count
+
+from nltk.grammar import PCFG, Nonterminal
+from nltk.parse.api import ParserI
+from nltk.tree import ProbabilisticTree
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+_LOG2 = math.log(2)
+
+##//////////////////////////////////////////////////////
+##  CKY PCFG Parser
+##//////////////////////////////////////////////////////
+
+
+class CKYParser(ParserI):
+    """
+    A bottom-up ``PCFG`` parser that fills a CKY chart with the best
+    (Viterbi) or total (inside) log probability of every nonterminal
+    over every span of the text.
+
+    The grammar is converted for CKY parsing when the parser is created:
+    productions with more than two children are binarized with new
+    symbols (shared by productions whose right hand sides end in the same
+    symbols), and terminals in such productions get new preterminals.
+    These symbols are removed again from the trees that the parser
+    returns.  Unary productions ``A -> B`` are kept, and handled by
+    closing each cell of the chart under the unary productions, so the
+    grammar does not have to be in Chomsky normal form.  (Note that
+    ``CFG.chomsky_normal_form`` does not preserve probabilities.)  Empty
+    productions are not supported.
+
+    Each cell of the chart is a vector with one entry per symbol.  The
+    cells for spans of one width are filled together: for every start,
+    split point and binary rule, the scores of the two children are
+    gathered and added to the rule's log probability, and the results
+    are reduced over split points and then over the rules of each left
+    hand side.  The work for a text of *n* words is therefore
+    O(*n*\\ :sup:`3` *R*) for *R* binary rules, but done in a few large
+    array operations per span width.
+
+        >>> from nltk.grammar import PCFG, Nonterminal
+        >>> from nltk.parse.cky import CKYParser
+        >>> grammar = PCFG.fromstring('''
+        ...     S -> NP VP [1.0]
+        ...     NP -> Det N [0.5] | NP PP [0.25] | 'John' [0.1] | 'I' [0.15]
+        ...     Det -> 'the' [0.8] | 'my' [0.2]
+        ...     N -> 'man' [0.5] | 'telescope' [0.5]
+        ...     VP -> VP PP [0.1] | V NP [0.7] | V [0.2]
+        ...     V -> 'ate' [0.35] | 'saw' [0.65]
+        ...     PP -> P NP [1.0]
+        ...     P -> 'with' [0.61] | 'under' [0.39]
+        ... ''')
+        >>> parser = CKYParser(grammar)
+        >>> tokens = 'I saw the man with my telescope'.split()
+        >>> for tree in parser.kbest(tokens, 2):
+        ...     print(tree.label(), tree[1][0].label(), '%.4g' % tree.prob())
+        S V 0.0001041
+        S VP 4.163e-05
+        >>> logprob, marginals = parser.inside_outside(tokens)
+        >>> print('%.4g' % 2**logprob)
+        0.0001457
+        >>> print('%.3f' % marginals[2, 7, Nonterminal('NP')])
+        0.714
+    """
+
+    def __init__(self, grammar):
+        """
+        Create a new ``CKYParser``, that uses ``grammar`` to parse texts.
+
+        :type grammar: PCFG
+        :param grammar: The grammar used to parse texts.
+        """
+        if not isinstance(grammar, PCFG):
+            raise ValueError("The grammar must be probabilistic PCFG")
+        self._grammar = grammar
+        self._compile()
+
+    def grammar(self):
+        return self._grammar
+
+    def _compile(self):
+        """
+        Convert the grammar into arrays of rules over integer symbol ids.
+        """
+        self._labels = []
+        """The ``Nonterminal`` of each symbol id, or None for the symbols
+        that are introduced by binarization."""
+        self._ids = {}
+        binary = {}
+        unary = {}
+        lexical = {}
+
+        def symbol_id(symbol):
+            if symbol not in self._ids:
+                self._ids[symbol] = len(self._labels)
+                self._labels.append(symbol if isinstance(symbol, Nonterminal) else None)
+            return self._ids[symbol]
+
+        def add(rules, key, logp):
+            rules[key] = max(rules.get(key, -math.inf), logp)
+
+        def child_id(symbol):
+            if isinstance(symbol, Nonterminal):
+                return symbol_id(symbol)
+            # A terminal among several children gets a preterminal.
+            preterminal = symbol_id(("terminal", symbol))
+            add(lexical, (symbol, preterminal), 0.0)
+            return preterminal
+
+        for production in self._grammar.productions():
+            rhs = production.rhs()
+            if not rhs:
+                raise ValueError(
+                    "Grammar has empty productions, which CKY parsing does "
+                    "not support: %s" % production
+                )
+            if production.prob() <= 0:
+                continue
+            lhs = symbol_id(production.lhs())
+            logp = math.log(production.prob())
+            if len(rhs) == 1:
+                if isinstance(rhs[0], Nonterminal):
+                    add(unary, (lhs, symbol_id(rhs[0])), logp)
+                else:
+                    add(lexical, (rhs[0], lhs), logp)
+                continue
+            children = [child_id(symbol) for symbol in rhs]
+            # Binarize A -> B C D into A -> B <C D> and <C D> -> C D.
+            while len(children) > 2:
+                rest = symbol_id(("rest", tuple(children[1:])))
+                add(binary, (lhs, children[0], rest), logp)
+                lhs, children, logp = rest, children[1:], 0.0
+            add(binary, (lhs, children[0], children[1]), logp)
+
+        num_symbols = len(self._labels)
+        rules = sorted(binary.items())
+        lhs = np.array([r[0][0] for r in rules], dtype=np.intp)
+        self._left = np.array([r[0][1] for r in rules], dtype=np.intp)
+        self._right = np.array([r[0][2] for r in rules], dtype=np.intp)
+        self._rule_logp = np.array([r[1] for r in rules], dtype=float)
+        self._rule_lhs = lhs
+        # The rules are sorted by left hand side, for np.*.reduceat().
+        self._lhs_ids, self._lhs_starts = np.unique(lhs, return_index=True)
+        self._lhs_ends = np.append(self._lhs_starts[1:], len(rules))
+        self._lhs_group = np.full(num_symbols, -1, dtype=np.intp)
+        self._lhs_group[self._lhs_ids] = np.arange(len(self._lhs_ids))
+        # The orders of the rules by left and right child, for the
+        # outside probabilities.
+        self._by_child = []
+        for child in (self._left, self._right):
+            order = np.argsort(child, kind="stable")
+            ids, starts = np.unique(child[order], return_index=True)
+            self._by_child.append((order, ids, starts))
+
+        self._lexical = {}
+        for (token, symbol), logp in lexical.items():
+            self._lexical.setdefault(token, []).append((symbol, logp))
+
+        # The unary closure is computed over the symbols that take part
+        # in unary rules only.
+        self._unary_ids = np.array(
+            sorted({s for pair in unary for s in pair}), dtype=np.intp
+        )
+        index = {s: i for i, s in enumerate(self._unary_ids.tolist())}
+        size = len(index)
+        self._unary_logp = np.full((size, size), -math.inf)
+        for (parent, child), logp in unary.items():
+            self._unary_logp[index[parent], index[child]] = logp
+        self._unary_best = _best_unary_chains(self._unary_logp)
+        self._unary_cyclic = _has_cycle(self._unary_logp > -math.inf)
+        self._unary_sum = None
+        self._unary_rules = {}
+        for (parent, child), logp in sorted(unary.items()):
+            self._unary_rules.setdefault(parent, []).append((child, logp))
+
+    def _unary_closure_sum(self):
+        """
+        Return the matrix of the total probabilities of all chains of unary
+        rules between the symbols in ``self._unary_ids``.
+        """
+        if self._unary_sum is None:
+            size = len(self._unary_ids)
+            rules = np.exp(self._unary_logp)
+            try:
+                self._unary_sum = np.linalg.inv(np.eye(size) - rules)
+            except np.linalg.LinAlgError as e:
+                raise ValueError(
+                    "The unary productions of the grammar form a cycle with "
+                    "probability 1"
+                ) from e
+        return self._unary_sum
+
+    def _check_tokens(self, tokens):
+        tokens = list(tokens)
+        self._grammar.check_coverage(tokens)
+        return tokens
+
+    def _fill_chart(self, tokens, inside=False):
+        """
+        Return the CKY chart of ``tokens``: two arrays indexed by start,
+        end and symbol id, with the log probabilities of the symbols
+        before and after applying unary rules to each cell.  The chart
+        holds the best (Viterbi) log probabilities, or if ``inside`` is
+        true, the inside log probabilities.
+        """
+        n = len(tokens)
+        bottom = np.full((n + 1, n + 1, len(self._labels)), -math.inf)
+        top = bottom.copy()
+        logp = self._rule_logp
+
+        for i, token in enumerate(tokens):
+            for symbol, p in self._lexical.get(token, ()):
+                bottom[i, i + 1, symbol] = p
+        self._apply_unary(bottom, top, np.arange(n), np.arange(1, n + 1), inside)
+        if not len(logp):
+            # Without binary rules, only single words can be parsed.
+            return bottom, top
+
+        for width in range(2, n + 1):
+            starts = np.arange(n - width + 1)
+            ends = starts + width
+            splits = starts[:, None] + np.arange(1, width)
+            # The score of every rule at every split: (start, split, rule).
+            scores = (
+                top[starts[:, None], splits][..., self._left]
+                + top[splits, ends[:, None]][..., self._right]
+            )
+            if inside:
+                shift = _finite_max(scores, axis=(1, 2))
+                summed = np.exp(scores - shift[:, None, None]).sum(axis=1) * np.exp(
+                    logp
+                )
+                by_lhs = np.add.reduceat(summed, self._lhs_starts, axis=1)
+                with np.errstate(divide="ignore"):
+                    by_lhs = np.log(by_lhs) + shift[:, None]
+            else:
+                by_lhs = np.maximum.reduceat(
+                    scores.max(axis=1) + logp, self._lhs_starts, axis=1
+                )
+            cells = np.full((len(starts), len(self._labels)), -math.inf)
+            cells[:, self._lhs_ids] = by_lhs
+            bottom[starts, ends] = cells
+            self._apply_unary(bottom, top, starts, ends, inside)
+        return bottom, top
+
+    def _apply_unary(self, bottom, top, starts, ends, inside):
+        """
+        Set the cells ``top[starts, ends]`` to the cells ``bottom[starts,
+        ends]``, closed under the unary rules.
+        """
+        cells = bottom[starts, ends]
+        ids = self._unary_ids
+        if len(ids):
+            below = cells[:, ids]
+            if inside:
+                shift = _finite_max(below, axis=1)[:, None]
+                with np.errstate(divide="ignore"):
+                    cells[:, ids] = (
+                        np.log(np.exp(below - shift) @ self._unary_closure_sum().T)
+                        + shift
+                    )
+            else:
+                cells[:, ids] = (below[:, None, :] + self._unary_best).max(axis=2)
+        top[starts, ends] = cells
+
+    def _outside(self, tokens, bottom, top):
+        """
+        Return the outside log probabilities of the symbols of each cell,
+        before applying unary rules (i.e. the outside probabilities that
+        go with ``bottom``).
+        """
+        n = len(tokens)
+        outside_top = np.full_like(top, -math.inf)
+        outside_bottom = np.full_like(top, -math.inf)
+        start = self._ids.get(self._grammar.start())
+        outside_top[0, n, start] = 0.0
+        ids = self._unary_ids
+
+        for width in range(n, 0, -1):
+            starts = np.arange(n - width + 1)
+            ends = starts + width
+            cells = outside_top[starts, ends]
+            if len(ids):
+                above = cells[:, ids]
+                shift = _finite_max(above, axis=1)[:, None]
+                with np.errstate(divide="ignore"):
+                    cells[:, ids] = (
+                        np.log(np.exp(above - shift) @ self._unary_closure_sum())
+                        + shift
+                    )
+            outside_bottom[starts, ends] = cells
+            if width == 1:
+                break
+
+            # Pass the outside probabilities of the rules' parents down to
+            # their children, for every start and split point.
+            splits = starts[:, None] + np.arange(1, width)
+            parents = cells[:, self._rule_lhs] + self._rule_logp
+            lefts = (starts[:, None], splits)
+            rights = (splits, ends[:, None])
+            for child, (order, child_ids, child_starts), sibling in (
+                (lefts, self._by_child[0], top[rights][..., self._right]),
+                (rights, self._by_child[1], top[lefts][..., self._left]),
+            ):
+                scores = (parents[:, None, :] + sibling)[..., order]
+                shift = _finite_max(scores, axis=2)[..., None]
+                summed = np.add.reduceat(np.exp(scores - shift), child_starts, axis=2)
+                with np.errstate(divide="ignore"):
+                    summed = np.log(summed) + shift
+                child_cells = outside_top[child]
+                child_cells[..., child_ids] = np.logaddexp(
+                    child_cells[..., child_ids], summed
+                )
+                outside_top[child] = child_cells
+        return outside_bottom
+
+    def parse(self, tokens):
+        """
+        Yield the most likely parse of ``tokens``, if there is one.  The
+        probability of each subtree is set to its Viterbi probability.
+        """
+        yield from self.kbest(tokens, 1)
+
+    def kbest(self, tokens, k):
+        """
+        Return a list of the ``k`` most likely parses of ``tokens``, in
+        descending order of probability.  If the unary productions of the
+        grammar form cycles, chains of unary productions over one span are
+        limited to as many productions as there are symbols in unary
+        productions.
+
+        :type k: int
+        :rtype: list(ProbabilisticTree)
+        """
+        tokens = self._check_tokens(tokens)
+        start = self._ids.get(self._grammar.start())
+        if not tokens or start is None:
+            return []
+        bottom, top = self._fill_chart(tokens)
+        derivations = _KBestDerivations(self, tokens, bottom, top, k)
+        trees = []
+        for rank in range(k):
+            root = (0, len(tokens), start, derivations.max_depth)
+            if derivations.get(root, rank) is None:
+                break
+            (tree,) = derivations.tree(root, rank)
+            trees.append(tree)
+        return trees
+
+    def inside_outside(self, tokens):
+        """
+        Return the log probability of ``tokens`` (the sum of the
+        probabilities of all its parses); and a dictionary that maps each
+        tuple ``(start, end, nonterminal)`` to the posterior probability
+        that a constituent ``nonterminal`` spans ``tokens[start:end]``
+        (or, with unary rules, the expected number of such constituents),
+        for all such probabilities that are not zero.  As elsewhere in
+        NLTK, log probabilities are base 2.
+
+        :rtype: tuple(float, dict(tuple(int, int, Nonterminal), float))
+        """
+        tokens = self._check_tokens(tokens)
+        start = self._ids.get(self._grammar.start())
+        if not tokens or start is None:
+            return -math.inf, {}
+        bottom, top = self._fill_chart(tokens, inside=True)
+        total = top[0, len(tokens), start]
+        if total == -math.inf:
+            return -math.inf, {}
+        outside = self._outside(tokens, bottom, top)
+        with np.errstate(invalid="ignore"):
+            posteriors = np.exp(outside + top - total)
+        labels = self._labels
+        marginals = {}
+        for i, j, symbol in zip(*np.nonzero(posteriors > 0)):
+            if labels[symbol] is not None:
+                marginals[int(i), int(j), labels[symbol]] = float(
+                    posteriors[i, j, symbol]
+                )
+        return float(total) / _LOG2, marginals
+
+    def __repr__(self):
+        return "<CKYParser for %r>" % self._grammar
+
+
+def _finite_max(array, axis):
+    """Return the maximum of ``array`` along ``axis``, or 0 where it is -inf."""
+    result = array.max(axis=axis)
+    result[result == -math.inf] = 0.0
+    return result
+
+
+def _best_unary_chains(logp):
+    """
+    Return the log probabilities of the most likely chains of unary rules
+    between each pair of symbols (0 from each symbol to itself), given
+    the log probabilities ``logp`` of the unary rules.
+    """
+    best = logp.copy()
+    np.fill_diagonal(best, 0.0)
+    # Floyd-Warshall, in the (max, +) semiring.
+    for via in range(len(best)):
+        best = np.maximum(best, best[:, via, None] + best[None, via, :])
+    return best
+
+
+def _has_cycle(edges):
+    """
+    Return True if the directed graph with the boolean adjacency matrix
+    ``edges`` has a cycle.
+    """
+    reachable = edges.copy()
+    for via in range(len(reachable)):
+        reachable |= reachable[:, via, None] & reachable[None, via, :]
+    return bool(reachable.diagonal().any())
+
+
+class _KBestDerivations:
+    """
+    The k best derivations of the nodes of a CKY chart, which are
+    enumerated lazily, with "Algorithm 3" of Huang and Chiang (2005),
+    "Better k-best parsing".
+
+    A node ``(start, end, symbol, depth)`` stands for the symbol over a
+    span: before unary rules if ``depth`` is -1; otherwise, after at most
+    ``depth`` unary rules.  (The depth bounds chains of unary rules that
+    form cycles.  If the unary rules have no cycles, the depth of the
+    nodes after unary rules is always 1, and is not decreased.)  A
+    derivation of a node is a tuple ``(logp, edge,
+    ranks)``: its log probability; the way it was built; and the ranks of
+    the derivations of the children (given by the edge) that it was built
+    from.  Edges are ``("lexical",)``, ``("binary", rule, split)``,
+    ``("unary", child_symbol, logp)``, or ``("none",)`` for a node after
+    unary rules that uses none.
+    """
+
+    def __init__(self, parser, tokens, bottom, top, k):
+        self._parser = parser
+        self._tokens = tokens
+        self._bottom = bottom
+        self._top = top
+        self._k = k
+        self._cyclic = parser._unary_cyclic
+        self.max_depth = len(parser._unary_ids) if self._cyclic else 1
+        self._derivations = {}
+        self._candidates = {}
+        self._seen = {}
+        self._counter = count()
+
+    def _children(self, node, edge):
+        start, end, symbol, depth = node
+        if edge[0] == "binary":
+            rule, split = edge[1], edge[2]
+            parser = self._parser
+            return (
+                (start, split, int(parser._left[rule]), self.max_depth),
+                (split, end, int(parser._right[rule]), self.max_depth),
+            )
+        if edge[0] == "unary":
+            return ((start, end, edge[1], depth - 1 if self._cyclic else depth),)
+        if edge[0] == "none":
+            return ((start, end, symbol, -1),)
+        return ()
+
+    def _edge_logp(self, node, edge):
+        if edge[0] == "binary":
+            return self._parser._rule_logp[edge[1]]
+        if edge[0] == "unary":
+            return edge[2]
+        if edge[0] == "lexical":
+            return self._bottom[node[:3]]
+        return 0.0
+
+    def _first_candidates(self, node):
+        """
+        Return the best derivation of each edge into ``node`` (for binary
+        edges, of the k best edges only).
+        """
+        start, end, symbol, depth = node
+        parser = self._parser
+        if depth >= 0:
+            edges = []
+            if self._bottom[start, end, symbol] > -math.inf:
+                edges.append(("none",))
+            if depth > 0:
+                for child, logp in parser._unary_rules.get(symbol, ()):
+                    if self._top[start, end, child] > -math.inf:
+                        edges.append(("unary", child, logp))
+        elif end - start == 1:
+            edges = [("lexical",)] if self._bottom[node[:3]] > -math.inf else []
+        else:
+            group = parser._lhs_group[symbol]
+            if group < 0:
+                return []
+            rules = np.arange(parser._lhs_starts[group], parser._lhs_ends[group])
+            splits = np.arange(start + 1, end)
+            scores = (
+                parser._rule_logp[rules, None]
+                + self._top[start, splits[None, :], parser._left[rules, None]]
+                + self._top[splits[None, :], end, parser._right[rules, None]]
+            ).ravel()
+            best = np.nonzero(scores > -math.inf)[0]
+            if len(best) > self._k:
+                best = best[np.argpartition(-scores[best], self._k - 1)[: self._k]]
+            edges = [
+                ("binary", int(rules[i // len(splits)]), int(splits[i % len(splits)]))
+                for i in best
+            ]
+        candidates = []
+        for edge in edges:
+            ranks = (0,) * len(self._children(node, edge))
+            candidate = self._candidate(node, edge, ranks)
+            if candidate is not None:
+                candidates.append(candidate)
+        return candidates
+
+    def _candidate(self, node, edge, ranks):
+        """
+        Return a heap entry for the derivation of ``node`` by ``edge``
+        from the children's derivations of rank ``ranks``, or None if a
+        child has no such derivation.
+        """
+        logp = self._edge_logp(node, edge)
+        for child, rank in zip(self._children(node, edge), ranks):
+            if rank == 0 and child[3] in (-1, self.max_depth):
+                # The chart holds the score of the best derivation, so
+                # the child's derivations need not be enumerated yet.
+                cell = self._bottom if child[3] == -1 else self._top
+                best = cell[child[:3]]
+                if best == -math.inf:
+                    return None
+                logp += best
+                continue
+            derivation = self.get(child, rank)
+            if derivation is None:
+                return None
+            logp += derivation[0]
+        return (-logp, next(self._counter), edge, ranks)
+
+    def get(self, node, rank):
+        """
+        Return the derivation of ``node`` with the given rank (0 for the
+        best), or None if it has fewer derivations.
+        """
+        derivations = self._derivations.get(node)
+        if derivations is None:
+            derivations = self._derivations[node] = []
+            candidates = self._candidates[node] = self._first_candidates(node)
+            heapq.heapify(candidates)
+            self._seen[node] = {(c[2], c[3]) for c in candidates}
+        candidates = self._candidates[node]
+        while len(derivations) <= rank:
+            if derivations:
+                # Add the successors of the last derivation.
+                _, edge, ranks = derivations[-1]
+                for i in range(len(ranks)):
+                    successor = ranks[:i] + (ranks[i] + 1,) + ranks[i + 1 :]
+                    if (edge, successor) not in self._seen[node]:
+                        self._seen[node].add((edge, successor))
+                        candidate = self._candidate(node, edge, successor)
+                        if candidate is not None:
+                            heapq.heappush(candidates, candidate)
+            if not candidates:
+                return None
+            neg_logp, _, edge, ranks = heapq.heappop(candidates)
+            derivations.append((-neg_logp, edge, ranks))
+        return derivations[rank]
+
+    def tree(self, node, rank):
+        """
+        Return the list of trees (or tokens) that the derivation of
+        ``node`` with the given rank stands for: one tree, or if the
+        node's symbol was introduced by binarization, its children.
+        """
+        logp, edge, ranks = self.get(node, rank)
+        if edge[0] == "none":
+            return self.tree(self._children(node, edge)[0], ranks[0])
+        if edge[0] == "lexical":
+            children = [self._tokens[node[0]]]
+        else:
+            children = []
+            for child, child_rank in zip(self._children(node, edge), ranks):
+                children.extend(self.tree(child, child_rank))
+        label = self._parser._labels[node[2]]
+        if label is None:
+            return children
+        return [
+            ProbabilisticTree(label.symbol(), children, logprob=float(logp / _LOG2))
+        ]
@@ -33,6 +33,7 @@ from nltk.parse.chart import (
     CachedTopDownPredictRule,
     Chart,
     ChartParser,
+    CompiledGrammar,
     EdgeI,
     EmptyPredictRule,
     FilteredBottomUpPredictCombineRule,
@@ -307,6 +308,7 @@ class IncrementalChartParser(ChartParser):
         trace=0,
         trace_chart_width=50,
         chart_class=IncrementalChart,
+        compiled=False,
     ):
         """
         Create a new Earley chart parser, that uses ``grammar`` to
@@ -325,8 +327,12 @@ class IncrementalChartParser(ChartParser):
             be used to display edges.
         :param chart_class: The class that should be used to create
             the charts used by this parser.
+        :type compiled: bool
+        :param compiled: Parse with a ``CompiledGrammar`` instead of the
+            strategy (see ``ChartParser``).
         """
         self._grammar = grammar
+        self._compiled = CompiledGrammar(grammar) if compiled else None
         self._trace = trace
         self._trace_chart_width = trace_chart_width
         self._chart_class = chart_class
@@ -344,6 +350,8 @@ class IncrementalChartParser(ChartParser):
                 )
 
     def chart_parse(self, tokens, trace=None):
+        if self._compiled is not None:
+            return self._compiled.chart_parse(tokens, self._chart_class)
         if trace is None:
             trace = self._trace
         trace_new_edges = self._trace_new_edges
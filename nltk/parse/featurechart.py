@@ -120,6 +120,16 @@ class FeatureTreeEdge(TreeEdge):
             return nt
         return nt.substitute_bindings(bindings)
 
+    def _with_span(self, span):
+        """
+        :return: A copy of this edge with the given span.  The copy
+            shares this edge's (already bound) nonterminals.
+        :rtype: FeatureTreeEdge
+        """
+        return FeatureTreeEdge(
+            span, self._lhs, self._rhs, self._dot, self._bindings.copy()
+        )
+
     def next_with_bindings(self):
         return self._bind(self.nextsym(), self._bindings)
 
@@ -229,14 +239,14 @@ class FeatureChart(Chart):
         else:
             return item
 
-    def parses(self, start, tree_class=Tree):
+    def _root_edges(self, start):
         for edge in self.select(start=0, end=self._num_leaves):
             if (
                 (isinstance(edge, FeatureTreeEdge))
                 and (edge.lhs()[TYPE] == start[TYPE])
                 and (unify(edge.lhs(), start, rename_vars=True))
             ):
-                yield from self.trees(edge, complete=True, tree_class=tree_class)
+                yield edge
 
 
 # ////////////////////////////////////////////////////////////
@@ -244,6 +254,26 @@ class FeatureChart(Chart):
 # ////////////////////////////////////////////////////////////
 
 
+#: The maximum number of unifications that a rule memoizes.
+_MEMO_SIZE = 10000
+
+
+def _unification_memo(rule, grammar):
+    """
+    Return the dictionary that ``rule`` uses to memoize unifications.
+    Unifying the same (frozen) nonterminals always gives the same
+    outcome, but the deep copying done by ``unify`` dominates the cost
+    of feature chart parsing, so each outcome -- including failure --
+    is stored, keyed on the nonterminals, and reused at other spans
+    and for later sentences.  The memo is discarded when the rule is
+    used with a different grammar, or when it grows too large.
+    """
+    if rule._memo_grammar is not grammar or len(rule._memo) > _MEMO_SIZE:
+        rule._memo_grammar = grammar
+        rule._memo = {}
+    return rule._memo
+
+
 class FeatureFundamentalRule(FundamentalRule):
     r"""
     A specialized version of the fundamental rule that operates on
@@ -266,6 +296,11 @@ class FeatureFundamentalRule(FundamentalRule):
     assuming that B1 and B2 can be unified to generate B3.
     """
 
+    def __init__(self):
+        FundamentalRule.__init__(self)
+        self._memo_grammar = None
+        self._memo = {}
+
     def apply(self, chart, grammar, left_edge, right_edge):
         # Make sure the rule is applicable.
         if not (
@@ -282,29 +317,50 @@ class FeatureFundamentalRule(FundamentalRule):
                 return
             if left_edge.nextsym()[TYPE] != right_edge.lhs()[TYPE]:
                 return
-            # Create a copy of the bindings.
-            bindings = left_edge.bindings()
-            # We rename vars here, because we don't want variables
-            # from the two different productions to match.
-            found = found.rename_variables(used_vars=left_edge.variables())
-            # Unify B1 (left_edge.nextsym) with B2 (right_edge.lhs) to
-            # generate B3 (result).
-            result = unify(nextsym, found, bindings, rename_vars=False)
-            if result is None:
+            # The new edge only depends on the left edge's dotted rule
+            # and bindings (not on its span) and on B2, so the same
+            # unification is only done once, and edges that differ
+            # only in their spans share their nonterminals.
+            memo = _unification_memo(self, grammar)
+            key = (
+                left_edge._comparison_key[0][1:],
+                left_edge._comparison_key[1],
+                found,
+            )
+            if key not in memo:
+                memo[key] = self._unify(left_edge, nextsym, found)
+            if memo[key] is None:
                 return
+            new_edge = memo[key]._with_span((left_edge.start(), right_edge.end()))
         else:
             if nextsym != found:
                 return
             # Create a copy of the bindings.
             bindings = left_edge.bindings()
-
-        # Construct the new edge.
-        new_edge = left_edge.move_dot_forward(right_edge.end(), bindings)
+            # Construct the new edge.
+            new_edge = left_edge.move_dot_forward(right_edge.end(), bindings)
 
         # Add it to the chart, with appropriate child pointers.
         if chart.insert_with_backpointer(new_edge, left_edge, right_edge):
             yield new_edge
 
+    def _unify(self, left_edge, nextsym, found):
+        """
+        Unify B1 (``nextsym``) with B2 (``found``), and return the
+        new edge licensed by ``left_edge``, or None if unification
+        fails.
+        """
+        # Create a copy of the bindings.
+        bindings = left_edge.bindings()
+        # We rename vars here, because we don't want variables
+        # from the two different productions to match.
+        found = found.rename_variables(used_vars=left_edge.variables())
+        # Unify B1 (left_edge.nextsym) with B2 (right_edge.lhs) to
+        # generate B3 (result).
+        if unify(nextsym, found, bindings, rename_vars=False) is None:
+            return None
+        return left_edge.move_dot_forward(left_edge.end(), bindings)
+
 
 class FeatureSingleEdgeFundamentalRule(SingleEdgeFundamentalRule):
     """
@@ -363,6 +419,11 @@ class FeatureTopDownPredictRule(CachedTopDownPredictRule):
     and B2 can be unified.
     """
 
+    def __init__(self):
+        CachedTopDownPredictRule.__init__(self)
+        self._memo_grammar = None
+        self._memo = {}
+
     def apply(self, chart, grammar, edge):
         if edge.is_complete():
             return
@@ -390,8 +451,15 @@ class FeatureTopDownPredictRule(CachedTopDownPredictRule):
                         continue
 
             # We rename vars here, because we don't want variables
-            # from the two different productions to match.
-            if unify(prod.lhs(), nextsym_with_bindings, rename_vars=True):
+            # from the two different productions to match.  The same
+            # pair is tried at every chart position, so memoize it.
+            memo = _unification_memo(self, grammar)
+            key = (prod.lhs(), nextsym_with_bindings)
+            if key not in memo:
+                memo[key] = bool(
+                    unify(prod.lhs(), nextsym_with_bindings, rename_vars=True)
+                )
+            if memo[key]:
                 new_edge = FeatureTreeEdge.from_production(prod, edge.end())
                 if chart.insert(new_edge, ()):
                     yield new_edge
@@ -421,34 +489,46 @@ class FeatureBottomUpPredictRule(BottomUpPredictRule):
 
 
 class FeatureBottomUpPredictCombineRule(BottomUpPredictCombineRule):
+    def __init__(self):
+        BottomUpPredictCombineRule.__init__(self)
+        self._memo_grammar = None
+        self._memo = {}
+
     def apply(self, chart, grammar, edge):
         if edge.is_incomplete():
             return
         found = edge.lhs()
         for prod in grammar.productions(rhs=found):
-            bindings = {}
             if isinstance(edge, FeatureTreeEdge):
                 _next = prod.rhs()[0]
                 if not is_nonterminal(_next):
                     continue
 
-                # We rename vars here, because we don't want variables
-                # from the two different productions to match.
-                used_vars = find_variables(
-                    (prod.lhs(),) + prod.rhs(), fs_class=FeatStruct
-                )
-                found = found.rename_variables(used_vars=used_vars)
-
-                result = unify(_next, found, bindings, rename_vars=False)
-                if result is None:
+                # Complete edges with the same lhs are found at many
+                # spans, so memoize the unification.
+                memo = _unification_memo(self, grammar)
+                if (prod, found) not in memo:
+                    memo[prod, found] = self._unify(prod, _next, found)
+                if memo[prod, found] is None:
                     continue
-
-            new_edge = FeatureTreeEdge.from_production(
-                prod, edge.start()
-            ).move_dot_forward(edge.end(), bindings)
+                new_edge = memo[prod, found]._with_span(edge.span())
+            else:
+                new_edge = FeatureTreeEdge.from_production(
+                    prod, edge.start()
+                ).move_dot_forward(edge.end())
             if chart.insert(new_edge, (edge,)):
                 yield new_edge
 
+    def _unify(self, prod, _next, found):
+        bindings = {}
+        # We rename vars here, because we don't want variables
+        # from the two different productions to match.
+        used_vars = find_variables((prod.lhs(),) + prod.rhs(), fs_class=FeatStruct)
+        found = found.rename_variables(used_vars=used_vars)
+        if unify(_next, found, bindings, rename_vars=False) is None:
+            return None
+        return FeatureTreeEdge.from_production(prod, 0).move_dot_forward(0, bindings)
+
 
 class FeatureEmptyPredictRule(EmptyPredictRule):
     def apply(self, chart, grammar):
@@ -660,6 +740,47 @@ def run_profile():
     p.strip_dirs().sort_stats("cum", "time").print_stats(60)
 
 
+def benchmark(repeat=10):
+    """
+    Time the feature chart parsers on the example sentences for the
+    book's ``feat0.fcfg`` and ``feat1.fcfg`` grammars, which spend
+    most of their time unifying feature structures.
+    """
+    from nltk.data import load
+    from nltk.parse.earleychart import FeatureEarleyChartParser
+
+    sents = {
+        "grammars/book_grammars/feat0.fcfg": [
+            "Kim likes children",
+            "these dogs see the girl",
+            "some child saw Jody",
+        ],
+        "grammars/book_grammars/feat1.fcfg": [
+            "who do you claim that you like",
+            "you claim that you like cats",
+            "rarely do you sing",
+            "who do you say that you claim that you like",
+        ],
+    }
+    parsers = [
+        FeatureChartParser,
+        FeatureTopDownChartParser,
+        FeatureBottomUpChartParser,
+        FeatureBottomUpLeftCornerChartParser,
+        FeatureEarleyChartParser,
+    ]
+    for resource, sentences in sents.items():
+        grammar = load(resource)
+        print(resource)
+        for parser in parsers:
+            cp = parser(grammar)
+            t = perf_counter()
+            for i in range(repeat):
+                for sent in sentences:
+                    list(cp.parse(sent.split()))
+            print("  %-40s %.4f" % (parser.__name__, (perf_counter() - t) / repeat))
+
+
 if __name__ == "__main__":
     from nltk.data import load
 
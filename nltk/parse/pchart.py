@@ -28,6 +28,8 @@ search strategies.  Currently the following subclasses are defined:
 The ``BottomUpProbabilisticChartParser`` constructor has an optional
 argument beam_size.  If non-zero, this controls the size of the beam
 (aka the edge queue).  This option is most useful with InsideChartParser.
+The optional argument span_beam_size instead limits the number of complete
+edges that are built for each span of the text.
 """
 
 ##//////////////////////////////////////////////////////
@@ -37,8 +39,10 @@ argument beam_size.  If non-zero, this controls the size of the beam
 # [XX] This might not be implemented quite right -- it would be better
 # to associate probabilities with child pointer lists.
 
+import heapq
 import random
 from functools import reduce
+from itertools import count
 
 from nltk.grammar import PCFG, Nonterminal
 from nltk.parse.api import ParserI
@@ -134,6 +138,14 @@ class SingleEdgeProbabilisticFundamentalRule(AbstractChartRule):
 
     _fundamental_rule = ProbabilisticFundamentalRule()
 
+    def __init__(self, complete_edges=None):
+        """
+        :param complete_edges: If given, the set of complete edges that
+            incomplete edges may be combined with.  Other complete edges
+            are only combined when the rule is applied to them.
+        """
+        self._complete_edges = complete_edges
+
     def apply(self, chart, grammar, edge1):
         fr = self._fundamental_rule
         if edge1.is_incomplete():
@@ -141,7 +153,8 @@ class SingleEdgeProbabilisticFundamentalRule(AbstractChartRule):
             for edge2 in chart.select(
                 start=edge1.end(), is_complete=True, lhs=edge1.nextsym()
             ):
-                yield from fr.apply(chart, grammar, edge1, edge2)
+                if self._complete_edges is None or edge2 in self._complete_edges:
+                    yield from fr.apply(chart, grammar, edge1, edge2)
         else:
             # edge2 = left_edge; edge1 = right_edge
             for edge2 in chart.select(
@@ -171,7 +184,10 @@ class BottomUpProbabilisticChartParser(ParserI):
     ``BottomUpProbabilisticChartParser``.  Different sorting orders will
     result in different search strategies.  The sorting order for the
     queue is defined by the method ``sort_queue``; subclasses are required
-    to provide a definition for this method.
+    to provide a definition for this method.  Subclasses whose order is
+    given by a priority for each edge should also define ``queue_key``,
+    which lets the queue be kept in a heap rather than sorted before
+    every step.
 
     :type _grammar: PCFG
     :ivar _grammar: The grammar used to parse sentences.
@@ -180,7 +196,7 @@ class BottomUpProbabilisticChartParser(ParserI):
         when parsing a text.
     """
 
-    def __init__(self, grammar, beam_size=0, trace=0):
+    def __init__(self, grammar, beam_size=0, trace=0, span_beam_size=0):
         """
         Create a new ``BottomUpProbabilisticChartParser``, that uses
         ``grammar`` to parse texts.
@@ -189,6 +205,11 @@ class BottomUpProbabilisticChartParser(ParserI):
         :param grammar: The grammar used to parse texts.
         :type beam_size: int
         :param beam_size: The maximum length for the parser's edge queue.
+        :type span_beam_size: int
+        :param span_beam_size: The maximum number of complete edges for
+            each span of the text that are taken from the queue and used
+            to build larger edges.  Further complete edges for a span are
+            discarded.  ``0`` means no limit.
         :type trace: int
         :param trace: The level of tracing that should be used when
             parsing a text.  ``0`` will generate no tracing output;
@@ -199,6 +220,7 @@ class BottomUpProbabilisticChartParser(ParserI):
             raise ValueError("The grammar must be probabilistic PCFG")
         self._grammar = grammar
         self.beam_size = beam_size
+        self.span_beam_size = span_beam_size
         self._trace = trace
 
     def grammar(self):
@@ -223,13 +245,24 @@ class BottomUpProbabilisticChartParser(ParserI):
         chart = Chart(list(tokens))
         grammar = self._grammar
 
+        # With a span beam, complete edges are only combined with others
+        # once they have been taken from the queue and kept in the beam.
+        if self.span_beam_size:
+            beam_edges = set()
+            span_counts = {}
+        else:
+            beam_edges = None
+
         # Chart parser rules.
         bu_init = ProbabilisticBottomUpInitRule()
         bu = ProbabilisticBottomUpPredictRule()
-        fr = SingleEdgeProbabilisticFundamentalRule()
+        fr = SingleEdgeProbabilisticFundamentalRule(beam_edges)
 
         # Our queue
-        queue = []
+        if self._uses_queue_key():
+            queue = _EdgeHeap(self.queue_key)
+        else:
+            queue = _SortedEdgeQueue(self, chart)
 
         # Initialize the chart.
         for edge in bu_init.apply(chart, grammar):
@@ -238,18 +271,26 @@ class BottomUpProbabilisticChartParser(ParserI):
                     "  %-50s [%s]"
                     % (chart.pretty_format_edge(edge, width=2), edge.prob())
                 )
-            queue.append(edge)
+            queue.push(edge)
 
         while len(queue) > 0:
-            # Re-sort the queue.
-            self.sort_queue(queue, chart)
-
             # Prune the queue to the correct size if a beam was defined
             if self.beam_size:
-                self._prune(queue, chart)
+                self._trace_discarded(queue.prune(self.beam_size), chart)
 
             # Get the best edge.
             edge = queue.pop()
+
+            # Discard it if its span's beam is full.  Words are always kept.
+            if beam_edges is not None and edge.is_complete() and edge not in beam_edges:
+                if isinstance(edge, ProbabilisticTreeEdge):
+                    span_count = span_counts.get(edge.span(), 0)
+                    if span_count >= self.span_beam_size:
+                        self._trace_discarded([edge], chart)
+                        continue
+                    span_counts[edge.span()] = span_count + 1
+                beam_edges.add(edge)
+
             if self._trace > 0:
                 print(
                     "  %-50s [%s]"
@@ -257,8 +298,10 @@ class BottomUpProbabilisticChartParser(ParserI):
                 )
 
             # Apply BU & FR to it.
-            queue.extend(bu.apply(chart, grammar, edge))
-            queue.extend(fr.apply(chart, grammar, edge))
+            for new_edge in bu.apply(chart, grammar, edge):
+                queue.push(new_edge)
+            for new_edge in fr.apply(chart, grammar, edge):
+                queue.push(new_edge)
 
         # Get a list of complete parses.
         parses = list(chart.parses(grammar.start(), ProbabilisticTree))
@@ -315,14 +358,100 @@ class BottomUpProbabilisticChartParser(ParserI):
         """
         raise NotImplementedError()
 
-    def _prune(self, queue, chart):
-        """Discard items in the queue if the queue is longer than the beam."""
-        if len(queue) > self.beam_size:
-            split = len(queue) - self.beam_size
-            if self._trace > 2:
-                for edge in queue[:split]:
-                    print("  %-50s [DISCARDED]" % chart.pretty_format_edge(edge, 2))
-            del queue[:split]
+    queue_key = None
+    """
+    A function that maps each edge to its priority, for parsers that try
+    edges in descending order of priority (and the most recently queued
+    edge first, among edges of equal priority).  ``sort_queue`` must order
+    the queue in the same way.
+    """
+
+    def _uses_queue_key(self):
+        """
+        Return True if the queue can be kept in a heap ordered by
+        ``queue_key``, i.e. unless a subclass overrides ``sort_queue`` but
+        not ``queue_key``.
+        """
+        for cls in type(self).__mro__:
+            if "queue_key" in vars(cls):
+                return vars(cls)["queue_key"] is not None
+            if "sort_queue" in vars(cls):
+                return False
+        return False
+
+    def _trace_discarded(self, edges, chart):
+        if self._trace > 2:
+            for edge in edges:
+                print("  %-50s [DISCARDED]" % chart.pretty_format_edge(edge, 2))
+
+
+class _SortedEdgeQueue:
+    """
+    An edge queue that is ordered with the parser's ``sort_queue`` before
+    each edge is taken from it.
+    """
+
+    def __init__(self, parser, chart):
+        self._parser = parser
+        self._chart = chart
+        self._queue = []
+        self._sorted = False
+
+    def __len__(self):
+        return len(self._queue)
+
+    def push(self, edge):
+        self._queue.append(edge)
+        self._sorted = False
+
+    def prune(self, beam_size):
+        """Discard and return the worst edges beyond the first ``beam_size``."""
+        self._parser.sort_queue(self._queue, self._chart)
+        self._sorted = True
+        split = max(0, len(self._queue) - beam_size)
+        discarded = self._queue[:split]
+        del self._queue[:split]
+        return discarded
+
+    def pop(self):
+        """Remove and return the best edge."""
+        if not self._sorted:
+            self._parser.sort_queue(self._queue, self._chart)
+        return self._queue.pop()
+
+
+class _EdgeHeap:
+    """
+    An edge queue that is kept in a heap ordered by a priority function,
+    so that taking the best edge costs O(log n) rather than a sort.  Ties
+    are broken in favour of the most recently pushed edge, which is the
+    order that ``list.sort`` and ``list.pop`` give.
+    """
+
+    def __init__(self, key):
+        self._key = key
+        self._heap = []
+        self._counter = count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, edge):
+        heapq.heappush(self._heap, (-self._key(edge), -next(self._counter), edge))
+
+    def prune(self, beam_size):
+        """Discard and return the worst edges beyond the first ``beam_size``."""
+        if len(self._heap) <= beam_size:
+            return []
+        # A sorted list is also a heap.
+        self._heap.sort()
+        discarded = [edge for (_, _, edge) in reversed(self._heap[beam_size:])]
+        del self._heap[beam_size:]
+        return discarded
+
+    def pop(self):
+        """Remove and return the best edge."""
+        return heapq.heappop(self._heap)[2]
 
 
 class InsideChartParser(BottomUpProbabilisticChartParser):
@@ -342,6 +471,10 @@ class InsideChartParser(BottomUpProbabilisticChartParser):
     """
 
     # Inherit constructor.
+    @staticmethod
+    def queue_key(edge):
+        return edge.prob()
+
     def sort_queue(self, queue, chart):
         """
         Sort the given queue of edges, in descending order of the
@@ -357,7 +490,7 @@ class InsideChartParser(BottomUpProbabilisticChartParser):
         :type chart: Chart
         :rtype: None
         """
-        queue.sort(key=lambda edge: edge.prob())
+        queue.sort(key=self.queue_key)
 
 
 # Eventually, this will become some sort of inside-outside parser:
@@ -418,8 +551,12 @@ class LongestChartParser(BottomUpProbabilisticChartParser):
     """
 
     # Inherit constructor
+    @staticmethod
+    def queue_key(edge):
+        return edge.length()
+
     def sort_queue(self, queue, chart):
-        queue.sort(key=lambda edge: edge.length())
+        queue.sort(key=self.queue_key)
 
 
 ##//////////////////////////////////////////////////////
@@ -21,13 +21,14 @@ Sentiment Analysis of Social Media Text. Eighth International Conference on
 Weblogs and Social Media (ICWSM-14). Ann Arbor, MI, June 2014.
 """
 
+import functools
 import math
 import re
 import string
 from itertools import product
 
 import nltk.data
-from nltk.util import pairwise
+from nltk.util import pairwise, parallel_imap
 
 
 class VaderConstants:
@@ -260,6 +261,10 @@ class VaderConstants:
         return scalar
 
 
+# The constants shared by all analyzers.
+_CONSTANTS = VaderConstants()
+
+
 class SentiText:
     """
     Identify sentiment-relevant string-level properties of input text.
@@ -274,6 +279,7 @@ class SentiText:
         self.words_and_emoticons = self._words_and_emoticons()
         # doesn't separate words from
         # adjacent punctuation (keeps emoticons & contractions)
+        self.words_and_emoticons_lower = [we.lower() for we in self.words_and_emoticons]
         self.is_cap_diff = self.allcap_differential(self.words_and_emoticons)
 
     def _words_plus_punc(self):
@@ -303,6 +309,11 @@ class SentiText:
             Does not preserve punc-plus-letter emoticons (e.g. :D)
         """
         wes = self.text.split()
+        if (
+            self.PUNC_LIST is VaderConstants.PUNC_LIST
+            and self.REGEX_REMOVE_PUNCTUATION is VaderConstants.REGEX_REMOVE_PUNCTUATION
+        ):
+            return [self._strip_punc(we) for we in wes if len(we) > 1]
         words_punc_dict = self._words_plus_punc()
         wes = [we for we in wes if len(we) > 1]
         for i, we in enumerate(wes):
@@ -310,6 +321,30 @@ class SentiText:
                 wes[i] = words_punc_dict[we]
         return wes
 
+    def _strip_punc(self, we):
+        """
+        Return ``we`` without its leading or trailing item of ``PUNC_LIST``,
+        as the mapping of ``_words_plus_punc`` would, but without building
+        that mapping for every word of the text.
+        """
+        if we[0] not in string.punctuation and we[-1] not in string.punctuation:
+            return we
+        left = we.lstrip(string.punctuation)
+        right = we.rstrip(string.punctuation)
+        if len(left) < len(we) == len(right):
+            punc, word = we[: len(we) - len(left)], left
+        elif len(right) < len(we) == len(left):
+            punc, word = we[len(right) :], right
+        else:
+            return we
+        if (
+            len(word) > 1
+            and punc in self.PUNC_LIST
+            and not self.REGEX_REMOVE_PUNCTUATION.search(word)
+        ):
+            return word
+        return we
+
     def allcap_differential(self, words):
         """
         Check whether just some words in the input are ALL CAPS
@@ -328,28 +363,68 @@ class SentiText:
         return is_different
 
 
+class _Lexicon(dict):
+    """
+    A read-only dict, for the lexicons shared by all analyzers in a process.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "VADER lexicons are shared by all analyzers and cannot be changed. "
+            "Assign a changed copy instead, e.g. "
+            "sid.lexicon = dict(sid.lexicon, word=1.5)"
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (_Lexicon, (dict(self),))
+
+
+def _parse_lexicon(lexicon_file):
+    """
+    Convert the text of a lexicon file to a dictionary
+    """
+    lex_dict = {}
+    for line in lexicon_file.split("\n"):
+        (word, measure) = line.strip().split("\t")[0:2]
+        lex_dict[word] = float(measure)
+    return lex_dict
+
+
+@functools.lru_cache
+def _load_lexicon(lexicon_file):
+    """Read and parse a lexicon file, once per process."""
+    text = nltk.data.load(lexicon_file)
+    return text, _Lexicon(_parse_lexicon(text))
+
+
 class SentimentIntensityAnalyzer:
     """
     Give a sentiment intensity score to sentences.
+
+    The lexicon is only read and parsed by the first analyzer that uses it
+    in a process. Later analyzers share it, along with one `VaderConstants`
+    object, so they are cheap to create. The shared lexicon is read-only;
+    to change the lexicon of one analyzer, assign it a changed copy.
+    Processes forked after the lexicon is loaded also share it.
     """
 
     def __init__(
         self,
         lexicon_file="sentiment/vader_lexicon.zip/vader_lexicon/vader_lexicon.txt",
     ):
-        self.lexicon_file = nltk.data.load(lexicon_file)
-        self.lexicon = self.make_lex_dict()
-        self.constants = VaderConstants()
+        self.lexicon_file, self.lexicon = _load_lexicon(lexicon_file)
+        if type(self).make_lex_dict is not SentimentIntensityAnalyzer.make_lex_dict:
+            self.lexicon = self.make_lex_dict()
+        self.constants = _CONSTANTS
 
     def make_lex_dict(self):
         """
         Convert lexicon file to a dictionary
         """
-        lex_dict = {}
-        for line in self.lexicon_file.split("\n"):
-            (word, measure) = line.strip().split("\t")[0:2]
-            lex_dict[word] = float(measure)
-        return lex_dict
+        return _parse_lexicon(self.lexicon_file)
 
     def polarity_scores(self, text):
         """
@@ -367,28 +442,43 @@ class SentimentIntensityAnalyzer:
             text, self.constants.PUNC_LIST, self.constants.REGEX_REMOVE_PUNCTUATION
         )
         sentiments = []
-        words_and_emoticons = sentitext.words_and_emoticons
-        for item in words_and_emoticons:
+        words_lower = sentitext.words_and_emoticons_lower
+        for i, item in enumerate(sentitext.words_and_emoticons):
             valence = 0
-            i = words_and_emoticons.index(item)
             if (
-                i < len(words_and_emoticons) - 1
-                and item.lower() == "kind"
-                and words_and_emoticons[i + 1].lower() == "of"
-            ) or item.lower() in self.constants.BOOSTER_DICT:
+                i < len(words_lower) - 1
+                and words_lower[i] == "kind"
+                and words_lower[i + 1] == "of"
+            ) or words_lower[i] in self.constants.BOOSTER_DICT:
                 sentiments.append(valence)
                 continue
 
             sentiments = self.sentiment_valence(valence, sentitext, item, i, sentiments)
 
-        sentiments = self._but_check(words_and_emoticons, sentiments)
+        sentiments = self._but_check(words_lower, sentiments)
 
         return self.score_valence(sentiments, text)
 
+    def polarity_scores_many(self, texts, processes=1, chunksize=1000):
+        """
+        Lazily yield ``self.polarity_scores(text)`` for each text in *texts*,
+        in order.
+
+        With more than one process, chunks of texts are scored in worker
+        processes, see `nltk.util.parallel_imap`.
+
+        :param texts: an iterable of texts
+        :param int processes: Number of worker processes used for scoring.
+        :param int chunksize: Number of texts sent to a worker at once.
+        :rtype: iter(dict)
+        """
+        return parallel_imap(self.polarity_scores, texts, processes, chunksize)
+
     def sentiment_valence(self, valence, sentitext, item, i, sentiments):
         is_cap_diff = sentitext.is_cap_diff
         words_and_emoticons = sentitext.words_and_emoticons
-        item_lowercase = item.lower()
+        words_lower = sentitext.words_and_emoticons_lower
+        item_lowercase = words_lower[i]
         if item_lowercase in self.lexicon:
             # get the sentiment valence
             valence = self.lexicon[item_lowercase]
@@ -401,11 +491,7 @@ class SentimentIntensityAnalyzer:
                     valence -= self.constants.C_INCR
 
             for start_i in range(0, 3):
-                if (
-                    i > start_i
-                    and words_and_emoticons[i - (start_i + 1)].lower()
-                    not in self.lexicon
-                ):
+                if i > start_i and words_lower[i - (start_i + 1)] not in self.lexicon:
                     # dampen the scalar modifier of preceding words and emoticons
                     # (excluding the ones that immediately preceed the item) based
                     # on their distance from the current item.
@@ -418,7 +504,7 @@ class SentimentIntensityAnalyzer:
                         s = s * 0.9
                     valence = valence + s
                     valence = self._never_check(
-                        valence, words_and_emoticons, start_i, i
+                        valence, words_and_emoticons, start_i, i, words_lower
                     )
                     if start_i == 2:
                         valence = self._idioms_check(valence, words_and_emoticons, i)
@@ -430,36 +516,23 @@ class SentimentIntensityAnalyzer:
                         #  "cooking with gas": 2, "in the black": 2, "in the red": -2,
                         #  "on the ball": 2,"under the weather": -2}
 
-            valence = self._least_check(valence, words_and_emoticons, i)
+            valence = self._least_check(valence, words_lower, i)
 
         sentiments.append(valence)
         return sentiments
 
-    def _least_check(self, valence, words_and_emoticons, i):
+    def _least_check(self, valence, words_lower, i):
         # check for negation case using "least"
-        if (
-            i > 1
-            and words_and_emoticons[i - 1].lower() not in self.lexicon
-            and words_and_emoticons[i - 1].lower() == "least"
-        ):
-            if (
-                words_and_emoticons[i - 2].lower() != "at"
-                and words_and_emoticons[i - 2].lower() != "very"
-            ):
+        if i > 0 and words_lower[i - 1] == "least":
+            if words_lower[i - 1] in self.lexicon:
+                return valence
+            if i == 1 or words_lower[i - 2] not in ("at", "very"):
                 valence = valence * self.constants.N_SCALAR
-        elif (
-            i > 0
-            and words_and_emoticons[i - 1].lower() not in self.lexicon
-            and words_and_emoticons[i - 1].lower() == "least"
-        ):
-            valence = valence * self.constants.N_SCALAR
         return valence
 
-    def _but_check(self, words_and_emoticons, sentiments):
-        words_and_emoticons = [w_e.lower() for w_e in words_and_emoticons]
-        but = {"but"} & set(words_and_emoticons)
-        if but:
-            bi = words_and_emoticons.index(next(iter(but)))
+    def _but_check(self, words_lower, sentiments):
+        if "but" in words_lower:
+            bi = words_lower.index("but")
             for sidx, sentiment in enumerate(sentiments):
                 if sidx < bi:
                     sentiments[sidx] = sentiment * 0.5
@@ -516,9 +589,9 @@ class SentimentIntensityAnalyzer:
             valence = valence + self.constants.B_DECR
         return valence
 
-    def _never_check(self, valence, words_and_emoticons, start_i, i):
+    def _never_check(self, valence, words_and_emoticons, start_i, i, words_lower):
         if start_i == 0:
-            if self.constants.negated([words_and_emoticons[i - 1]]):
+            if self._negated(words_lower[i - 1]):
                 valence = valence * self.constants.N_SCALAR
         if start_i == 1:
             if words_and_emoticons[i - 2] == "never" and (
@@ -526,7 +599,7 @@ class SentimentIntensityAnalyzer:
                 or words_and_emoticons[i - 1] == "this"
             ):
                 valence = valence * 1.5
-            elif self.constants.negated([words_and_emoticons[i - (start_i + 1)]]):
+            elif self._negated(words_lower[i - (start_i + 1)]):
                 valence = valence * self.constants.N_SCALAR
         if start_i == 2:
             if (
@@ -541,10 +614,14 @@ class SentimentIntensityAnalyzer:
                 )
             ):
                 valence = valence * 1.25
-            elif self.constants.negated([words_and_emoticons[i - (start_i + 1)]]):
+            elif self._negated(words_lower[i - (start_i + 1)]):
                 valence = valence * self.constants.N_SCALAR
         return valence
 
+    def _negated(self, word_lower):
+        # ``self.constants.negated([word])`` for a single lower-cased word
+        return word_lower in self.constants.NEGATE or "n't" in word_lower
+
     def _punctuation_emphasis(self, sum_s, text):
         # add emphasis from exclamation points and question marks
         ep_amplifier = self._amplify_ep(text)
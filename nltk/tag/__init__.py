@@ -104,14 +104,16 @@ PRETRAINED_TAGGERS = {
 
 @functools.lru_cache
 def _get_tagger(lang=None):
-    if lang == "rus":
-        tagger = PerceptronTagger(lang=lang)
-    else:
-        tagger = PerceptronTagger()
-    return tagger
+    lang = "rus" if lang == "rus" else "eng"
+    try:
+        # A compiled tagger, loaded from a binary copy of the model saved
+        # with `PerceptronTagger.save_pretrained`.
+        return PerceptronTagger.load_pretrained(lang)
+    except (ImportError, LookupError):
+        return PerceptronTagger(lang=lang)
 
 
-def _pos_tag(tokens, tagset=None, tagger=None, lang=None):
+def _check_pos_tag_args(tokens, lang):
     # Currently only supports English and Russian.
     if lang not in ["eng", "rus"]:
         raise NotImplementedError(
@@ -122,22 +124,27 @@ def _pos_tag(tokens, tagset=None, tagger=None, lang=None):
     elif isinstance(tokens, str):
         raise TypeError("tokens: expected a list of strings, got a string")
 
-    else:
-        tagged_tokens = tagger.tag(tokens)
-        if tagset:  # Maps to the specified tagset.
-            if lang == "eng":
-                tagged_tokens = [
-                    (token, map_tag("en-ptb", tagset, tag))
-                    for (token, tag) in tagged_tokens
-                ]
-            elif lang == "rus":
-                # Note that the new Russian pos tags from the model contains suffixes,
-                # see https://github.com/nltk/nltk/issues/2151#issuecomment-430709018
-                tagged_tokens = [
-                    (token, map_tag("ru-rnc-new", tagset, tag.partition("=")[0]))
-                    for (token, tag) in tagged_tokens
-                ]
-        return tagged_tokens
+
+def _map_tagset(tagged_tokens, tagset, lang):
+    if tagset:  # Maps to the specified tagset.
+        if lang == "eng":
+            tagged_tokens = [
+                (token, map_tag("en-ptb", tagset, tag))
+                for (token, tag) in tagged_tokens
+            ]
+        elif lang == "rus":
+            # Note that the new Russian pos tags from the model contains suffixes,
+            # see https://github.com/nltk/nltk/issues/2151#issuecomment-430709018
+            tagged_tokens = [
+                (token, map_tag("ru-rnc-new", tagset, tag.partition("=")[0]))
+                for (token, tag) in tagged_tokens
+            ]
+    return tagged_tokens
+
+
+def _pos_tag(tokens, tagset=None, tagger=None, lang=None):
+    _check_pos_tag_args(tokens, lang)
+    return _map_tagset(tagger.tag(tokens), tagset, lang)
 
 
 def pos_tag(tokens, tagset=None, lang="eng"):
@@ -169,7 +176,7 @@ def pos_tag(tokens, tagset=None, lang="eng"):
     return _pos_tag(tokens, tagset, tagger, lang)
 
 
-def pos_tag_sents(sentences, tagset=None, lang="eng"):
+def pos_tag_sents(sentences, tagset=None, lang="eng", processes=1):
     """
     Use NLTK's currently recommended part of speech tagger to tag the
     given list of sentences, each consisting of a list of tokens.
@@ -180,8 +187,15 @@ def pos_tag_sents(sentences, tagset=None, lang="eng"):
     :type tagset: str
     :param lang: the ISO 639 code of the language, e.g. 'eng' for English, 'rus' for Russian
     :type lang: str
+    :param processes: Number of worker processes used for tagging, see
+        `PerceptronTagger.tag_sents`
+    :type processes: int
     :return: The list of tagged sentences
     :rtype: list(list(tuple(str, str)))
     """
+    sentences = list(sentences)
+    for sent in sentences:
+        _check_pos_tag_args(sent, lang)
     tagger = _get_tagger(lang)
-    return [_pos_tag(sent, tagset, tagger, lang) for sent in sentences]
+    tagged_sents = tagger.tag_sents(sentences, processes=processes)
+    return [_map_tagset(sent, tagset, lang) for sent in tagged_sents]
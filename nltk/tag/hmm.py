@@ -69,6 +69,7 @@ For more information, please consult the source code for this module,
 which includes extensive demonstration code.
 """
 
+import functools
 import itertools
 import re
 
@@ -90,7 +91,7 @@ from nltk.probability import (
     RandomProbDist,
 )
 from nltk.tag.api import TaggerI
-from nltk.util import LazyMap, unique_list
+from nltk.util import LazyMap, parallel_imap, unique_list
 
 _TEXT = 0  # index of text in a tuple
 _TAG = 1  # index of tag in a tuple
@@ -290,6 +291,21 @@ class HiddenMarkovModelTagger(TaggerI):
         path = self._best_path(unlabeled_sequence)
         return list(zip(unlabeled_sequence, path))
 
+    def tag_sents(self, sentences):
+        """
+        Tags each of the sequences with its highest probability state
+        sequence, see ``tag()``. The Viterbi paths of all sequences are
+        computed together, which is much faster than tagging them one by one.
+
+        :return: a list of labelled sequences of symbols
+        :rtype: list(list)
+        :param sentences: the sequences of unlabeled symbols
+        :type sentences: list(list)
+        """
+        sentences = [self._transform(sent) for sent in sentences]
+        paths = self._best_paths(sentences)
+        return [list(zip(sent, path)) for sent, path in zip(sentences, paths)]
+
     def _output_logprob(self, state, symbol):
         """
         :return: the log probability of the symbol being observed in the given
@@ -319,20 +335,26 @@ class HiddenMarkovModelTagger(TaggerI):
           - P is the log prior probabilities::
 
               P[i] = log( P(tag[0]=state[i]) )
+
+        The probabilities are computed once, so the cache must be reset with
+        `reset_cache` when the probability distributions change.
         """
         if not self._cache:
             N = len(self._states)
             M = len(self._symbols)
-            P = np.zeros(N, np.float32)
-            X = np.zeros((N, N), np.float32)
-            O = np.zeros((N, M), np.float32)
+            P = np.fromiter(map(self._priors.logprob, self._states), np.float64, N)
+            X = np.zeros((N, N), np.float64)
+            O = np.zeros((N, M), np.float64)
             for i in range(N):
                 si = self._states[i]
-                P[i] = self._priors.logprob(si)
-                for j in range(N):
-                    X[i, j] = self._transitions[si].logprob(self._states[j])
-                for k in range(M):
-                    O[i, k] = self._output_logprob(si, self._symbols[k])
+                X[i] = np.fromiter(
+                    map(self._transitions[si].logprob, self._states), np.float64, N
+                )
+                O[i] = np.fromiter(
+                    (self._output_logprob(si, sym) for sym in self._symbols),
+                    np.float64,
+                    M,
+                )
             S = {}
             for k in range(M):
                 S[self._symbols[k]] = k
@@ -344,26 +366,19 @@ class HiddenMarkovModelTagger(TaggerI):
         if symbols:
             self._create_cache()
             P, O, X, S = self._cache
-            for symbol in symbols:
-                if symbol not in self._symbols:
-                    self._cache = None
-                    self._symbols.append(symbol)
+            new_symbols = unique_list(symbol for symbol in symbols if symbol not in S)
             # don't bother with the work if there aren't any new symbols
-            if not self._cache:
-                N = len(self._states)
-                M = len(self._symbols)
+            if new_symbols:
                 Q = O.shape[1]
+                self._symbols.extend(new_symbols)
                 # add new columns to the output probability table without
                 # destroying the old probabilities
-                O = np.hstack([O, np.zeros((N, M - Q), np.float32)])
-                for i in range(N):
-                    si = self._states[i]
-                    # only calculate probabilities for new symbols
-                    for k in range(Q, M):
-                        O[i, k] = self._output_logprob(si, self._symbols[k])
+                O = np.hstack(
+                    [O, np.array([self._outputs_vector(s) for s in new_symbols]).T]
+                )
                 # only create symbol mappings for new symbols
-                for k in range(Q, M):
-                    S[self._symbols[k]] = k
+                for k, symbol in enumerate(new_symbols, Q):
+                    S[symbol] = k
                 self._cache = (P, O, X, S)
 
     def reset_cache(self):
@@ -384,32 +399,36 @@ class HiddenMarkovModelTagger(TaggerI):
         return self._best_path(unlabeled_sequence)
 
     def _best_path(self, unlabeled_sequence):
-        T = len(unlabeled_sequence)
-        N = len(self._states)
+        return self._best_paths([unlabeled_sequence])[0]
+
+    def _best_paths(self, unlabeled_sequences):
+        """
+        Return the Viterbi paths of several sequences. The sequences are
+        decoded together, one time step of all of them at once.
+        """
         self._create_cache()
-        self._update_cache(unlabeled_sequence)
+        self._update_cache([symbol for seq in unlabeled_sequences for symbol in seq])
         P, O, X, S = self._cache
+        # Viterbi scores are kept in single precision.
+        P = P.astype(np.float32)
+        X = X.astype(np.float32)
+        N = len(self._states)
 
-        V = np.zeros((T, N), np.float32)
-        B = -np.ones((T, N), int)
-
-        V[0] = P + O[:, S[unlabeled_sequence[0]]]
-        for t in range(1, T):
-            for j in range(N):
-                vs = V[t - 1, :] + X[:, j]
-                best = np.argmax(vs)
-                V[t, j] = vs[best] + O[j, S[unlabeled_sequence[t]]]
-                B[t, j] = best
-
-        current = np.argmax(V[T - 1, :])
-        sequence = [current]
-        for t in range(T - 1, 0, -1):
-            last = B[t, current]
-            sequence.append(last)
-            current = last
-
-        sequence.reverse()
-        return list(map(self._states.__getitem__, sequence))
+        # Longer sequences come first, so the ones still being decoded at a
+        # time step are always the first ones of the batch.
+        order = sorted(
+            range(len(unlabeled_sequences)),
+            key=lambda n: len(unlabeled_sequences[n]),
+            reverse=True,
+        )
+        paths = [None] * len(unlabeled_sequences)
+        batch_size = max(1, _VITERBI_BATCH_CELLS // (N * N))
+        for start in range(0, len(order), batch_size):
+            batch = order[start : start + batch_size]
+            symbols = [[S[symbol] for symbol in unlabeled_sequences[n]] for n in batch]
+            for n, path in zip(batch, _viterbi(P, O, X, symbols)):
+                paths[n] = list(map(self._states.__getitem__, path))
+        return paths
 
     def best_path_simple(self, unlabeled_sequence):
         """
@@ -684,18 +703,6 @@ class HiddenMarkovModelTagger(TaggerI):
 
         return entropies
 
-    def _transitions_matrix(self):
-        """Return a matrix of transition log probabilities."""
-        trans_iter = (
-            self._transitions[sj].logprob(si)
-            for sj in self._states
-            for si in self._states
-        )
-
-        transitions_logprob = np.fromiter(trans_iter, dtype=np.float64)
-        N = len(self._states)
-        return transitions_logprob.reshape((N, N)).T
-
     def _outputs_vector(self, symbol):
         """
         Return a vector with log probabilities of emitting a symbol
@@ -704,6 +711,20 @@ class HiddenMarkovModelTagger(TaggerI):
         out_iter = (self._output_logprob(sj, symbol) for sj in self._states)
         return np.fromiter(out_iter, dtype=np.float64)
 
+    def _outputs_matrix(self, unlabeled_sequence):
+        """
+        Return a T by N array with the log probabilities of emitting the
+        symbol at each time t when entering each state.
+        """
+        self._create_cache()
+        P, O, X, S = self._cache
+        symbols = [token[_TEXT] for token in unlabeled_sequence]
+        outputs = [
+            O[:, S[symbol]] if symbol in S else self._outputs_vector(symbol)
+            for symbol in symbols
+        ]
+        return np.array(outputs, np.float64).reshape(len(outputs), len(self._states))
+
     def _forward_probability(self, unlabeled_sequence):
         """
         Return the forward probability matrix, a T by N array of
@@ -717,29 +738,9 @@ class HiddenMarkovModelTagger(TaggerI):
         :return: the forward log probability matrix
         :rtype: array
         """
-        T = len(unlabeled_sequence)
-        N = len(self._states)
-        alpha = _ninf_array((T, N))
-
-        transitions_logprob = self._transitions_matrix()
-
-        # Initialization
-        symbol = unlabeled_sequence[0][_TEXT]
-        for i, state in enumerate(self._states):
-            alpha[0, i] = self._priors.logprob(state) + self._output_logprob(
-                state, symbol
-            )
-
-        # Induction
-        for t in range(1, T):
-            symbol = unlabeled_sequence[t][_TEXT]
-            output_logprob = self._outputs_vector(symbol)
-
-            for i in range(N):
-                summand = alpha[t - 1] + transitions_logprob[i]
-                alpha[t, i] = logsumexp2(summand) + output_logprob[i]
-
-        return alpha
+        outputs = self._outputs_matrix(unlabeled_sequence)
+        P, O, X, S = self._cache
+        return _forward(P, X, outputs)
 
     def _backward_probability(self, unlabeled_sequence):
         """
@@ -754,26 +755,9 @@ class HiddenMarkovModelTagger(TaggerI):
         :param unlabeled_sequence: the sequence of unlabeled symbols
         :type unlabeled_sequence: list
         """
-        T = len(unlabeled_sequence)
-        N = len(self._states)
-        beta = _ninf_array((T, N))
-
-        transitions_logprob = self._transitions_matrix().T
-
-        # initialise the backward values;
-        # "1" is an arbitrarily chosen value from Rabiner tutorial
-        beta[T - 1, :] = np.log2(1)
-
-        # inductively calculate remaining backward values
-        for t in range(T - 2, -1, -1):
-            symbol = unlabeled_sequence[t + 1][_TEXT]
-            outputs = self._outputs_vector(symbol)
-
-            for i in range(N):
-                summand = transitions_logprob[i] + beta[t + 1] + outputs
-                beta[t, i] = logsumexp2(summand)
-
-        return beta
+        outputs = self._outputs_matrix(unlabeled_sequence)
+        P, O, X, S = self._cache
+        return _backward(X, outputs)
 
     def test(self, test_sequence, verbose=False, **kwargs):
         """
@@ -881,48 +865,19 @@ class HiddenMarkovModelTrainer:
         return model
 
     def _baum_welch_step(self, sequence, model, symbol_to_number):
-        N = len(model._states)
-        M = len(model._symbols)
-        T = len(sequence)
-
-        # compute forward and backward probabilities
-        alpha = model._forward_probability(sequence)
-        beta = model._backward_probability(sequence)
-
-        # find the log probability of the sequence
-        lpk = logsumexp2(alpha[T - 1])
-
-        A_numer = _ninf_array((N, N))
-        B_numer = _ninf_array((N, M))
-        A_denom = _ninf_array(N)
-        B_denom = _ninf_array(N)
-
-        transitions_logprob = model._transitions_matrix().T
-
-        for t in range(T):
-            symbol = sequence[t][_TEXT]  # not found? FIXME
-            next_symbol = None
-            if t < T - 1:
-                next_symbol = sequence[t + 1][_TEXT]  # not found? FIXME
-            xi = symbol_to_number[symbol]
-
-            next_outputs_logprob = model._outputs_vector(next_symbol)
-            alpha_plus_beta = alpha[t] + beta[t]
-
-            if t < T - 1:
-                numer_add = (
-                    transitions_logprob
-                    + next_outputs_logprob
-                    + beta[t + 1]
-                    + alpha[t].reshape(N, 1)
-                )
-                A_numer = np.logaddexp2(A_numer, numer_add)
-                A_denom = np.logaddexp2(A_denom, alpha_plus_beta)
-            else:
-                B_denom = np.logaddexp2(A_denom, alpha_plus_beta)
-
-            B_numer[:, xi] = np.logaddexp2(B_numer[:, xi], alpha_plus_beta)
-
+        model._create_cache()
+        P, O, X, S = model._cache
+        symbols = [symbol_to_number[token[_TEXT]] for token in sequence]
+        (
+            lpk,
+            A_numer,
+            A_denom,
+            seq_symbols,
+            seq_B_numer,
+            B_denom,
+        ) = _baum_welch_step(P, X, O, symbols)
+        B_numer = _ninf_array((len(model._states), len(model._symbols)))
+        B_numer[:, seq_symbols] = seq_B_numer
         return lpk, A_numer, A_denom, B_numer, B_denom
 
     def train_unsupervised(self, unlabeled_sequences, update_outputs=True, **kwargs):
@@ -947,6 +902,11 @@ class HiddenMarkovModelTrainer:
         :param max_iterations: the maximum number of EM iterations
         :param convergence_logprob: the maximum change in log probability to
             allow convergence
+        :param processes: the number of worker processes that compute the
+            expected counts, defaults to 1. The sums over the sequences are
+            then added up in a different order, so results can differ by
+            rounding errors.
+        :param chunksize: the number of sequences sent to a worker at once
         """
 
         # create a uniform HMM, which will be iteratively refined, unless
@@ -998,35 +958,46 @@ class HiddenMarkovModelTrainer:
         max_iterations = kwargs.get("max_iterations", 1000)
         epsilon = kwargs.get("convergence_logprob", 1e-6)
 
+        processes = kwargs.get("processes", 1)
+        chunksize = kwargs.get("chunksize", 100)
+        sequences = [
+            [symbol_numbers[token[_TEXT]] for token in sequence]
+            for sequence in unlabeled_sequences
+        ]
+        sequences = [sequence for sequence in sequences if sequence]
+
         while not converged and iteration < max_iterations:
             A_numer = _ninf_array((N, N))
             B_numer = _ninf_array((N, M))
             A_denom = _ninf_array(N)
             B_denom = _ninf_array(N)
 
-            logprob = 0
-            for sequence in unlabeled_sequences:
-                sequence = list(sequence)
-                if not sequence:
-                    continue
-
-                (
-                    lpk,
-                    seq_A_numer,
-                    seq_A_denom,
-                    seq_B_numer,
-                    seq_B_denom,
-                ) = self._baum_welch_step(sequence, model, symbol_numbers)
-
-                # add these sums to the global A and B values
-                for i in range(N):
-                    A_numer[i] = np.logaddexp2(A_numer[i], seq_A_numer[i] - lpk)
-                    B_numer[i] = np.logaddexp2(B_numer[i], seq_B_numer[i] - lpk)
-
-                A_denom = np.logaddexp2(A_denom, seq_A_denom - lpk)
-                B_denom = np.logaddexp2(B_denom, seq_B_denom - lpk)
+            model._create_cache()
+            P, O, X, S = model._cache
+            if processes <= 1:
+                results = [_baum_welch_sums(sequences, P, X, O[:, :M])]
+            else:
+                results = _parallel_baum_welch_sums(
+                    sequences, P, X, O[:, :M], processes, chunksize
+                )
 
-                logprob += lpk
+            # add these sums to the global A and B values
+            logprob = 0
+            for (
+                chunk_logprob,
+                chunk_A_numer,
+                chunk_A_denom,
+                chunk_symbols,
+                chunk_B_numer,
+                chunk_B_denom,
+            ) in results:
+                A_numer = np.logaddexp2(A_numer, chunk_A_numer)
+                B_numer[:, chunk_symbols] = np.logaddexp2(
+                    B_numer[:, chunk_symbols], chunk_B_numer
+                )
+                A_denom = np.logaddexp2(A_denom, chunk_A_denom)
+                B_denom = np.logaddexp2(B_denom, chunk_B_denom)
+                logprob += chunk_logprob
 
             # use the calculated values to update the transition and output
             # probability values
@@ -1057,6 +1028,8 @@ class HiddenMarkovModelTrainer:
                 # Rabiner says the priors don't need to be updated. I don't
                 # believe him. FIXME
 
+            model.reset_cache()
+
             # test for convergence
             if iteration > 0 and abs(logprob - last_logprob) < epsilon:
                 converged = True
@@ -1128,6 +1101,197 @@ class HiddenMarkovModelTrainer:
         return HiddenMarkovModelTagger(self._symbols, self._states, A, B, pi)
 
 
+# Largest number of cells of the (batch, N, N) array of path scores that
+# Viterbi decoding of a batch of sequences may allocate.
+_VITERBI_BATCH_CELLS = 2**22
+
+
+def _viterbi(priors, outputs, transitions, sequences):
+    """
+    Return the Viterbi paths, as lists of state numbers, of sequences of
+    symbol numbers. The sequences must be sorted by length, longest first.
+    ``priors`` and ``transitions`` are the P and X arrays of the model cache
+    (see ``HiddenMarkovModelTagger._create_cache``) and ``outputs`` is O.
+    """
+    lengths = [len(seq) for seq in sequences]
+    if not lengths or not lengths[0]:
+        return [[] for seq in sequences]
+    active = sum(1 for length in lengths if length)
+    V = np.zeros((len(sequences), len(priors)), np.float32)
+    first = [seq[0] for seq in sequences[:active]]
+    V[:active] = priors + outputs[:, first].T.astype(np.float32)
+
+    backpointers = []
+    for t in range(1, lengths[0]):
+        while lengths[active - 1] <= t:
+            active -= 1
+        # vs[b, i, j] is the score of reaching state j from state i
+        vs = V[:active, :, None] + transitions
+        best = np.argmax(vs, axis=1)
+        symbols = [seq[t] for seq in sequences[:active]]
+        V[:active] = np.take_along_axis(vs, best[:, None, :], axis=1)[:, 0]
+        V[:active] += outputs[:, symbols].T.astype(np.float32)
+        backpointers.append(best)
+
+    paths = []
+    for b, length in enumerate(lengths):
+        if not length:
+            paths.append([])
+            continue
+        current = int(np.argmax(V[b]))
+        path = [current]
+        for t in range(length - 2, -1, -1):
+            current = int(backpointers[t][b, current])
+            path.append(current)
+        path.reverse()
+        paths.append(path)
+    return paths
+
+
+def _forward(priors, transitions, outputs):
+    """
+    Return the forward log probabilities (see
+    ``HiddenMarkovModelTagger._forward_probability``) for the T by N array
+    of output log probabilities of a sequence.
+    """
+    T, N = outputs.shape
+    alpha = _ninf_array((T, N))
+    # transitions_logprob[i, j] is the log probability of state i after j
+    transitions_logprob = np.ascontiguousarray(transitions.T)
+
+    # Initialization
+    alpha[0] = priors + outputs[0]
+
+    # Induction
+    for t in range(1, T):
+        summand = alpha[t - 1] + transitions_logprob
+        alpha[t] = _logsumexp2_rows(summand) + outputs[t]
+
+    return alpha
+
+
+def _backward(transitions, outputs):
+    """
+    Return the backward log probabilities (see
+    ``HiddenMarkovModelTagger._backward_probability``) for the T by N array
+    of output log probabilities of a sequence.
+    """
+    T, N = outputs.shape
+    beta = _ninf_array((T, N))
+
+    # initialise the backward values;
+    # "1" is an arbitrarily chosen value from Rabiner tutorial
+    beta[T - 1, :] = np.log2(1)
+
+    # inductively calculate remaining backward values
+    for t in range(T - 2, -1, -1):
+        summand = transitions + beta[t + 1] + outputs[t + 1]
+        beta[t] = _logsumexp2_rows(summand)
+
+    return beta
+
+
+def _baum_welch_step(priors, transitions, outputs, symbols):
+    """
+    Return the expected counts of a sequence of symbol numbers for the
+    Baum-Welch algorithm, and its log probability. ``priors``,
+    ``transitions`` and ``outputs`` are the P, X and O arrays of the model
+    cache (see ``HiddenMarkovModelTagger._create_cache``).
+
+    Only the columns of the output counts for the symbols that occur in the
+    sequence are computed. They are returned with the numbers of these
+    symbols.
+    """
+    seq_outputs = outputs[:, symbols].T
+    T, N = seq_outputs.shape
+
+    # compute forward and backward probabilities
+    alpha = _forward(priors, transitions, seq_outputs)
+    beta = _backward(transitions, seq_outputs)
+
+    # find the log probability of the sequence
+    lpk = logsumexp2(alpha[T - 1])
+
+    seq_symbols, columns = np.unique(symbols, return_inverse=True)
+    A_numer = _ninf_array((N, N))
+    B_numer = _ninf_array((N, len(seq_symbols)))
+    A_denom = _ninf_array(N)
+    B_denom = _ninf_array(N)
+
+    for t in range(T):
+        xi = columns[t]
+        alpha_plus_beta = alpha[t] + beta[t]
+
+        if t < T - 1:
+            numer_add = (
+                transitions + seq_outputs[t + 1] + beta[t + 1] + alpha[t].reshape(N, 1)
+            )
+            A_numer = np.logaddexp2(A_numer, numer_add)
+            A_denom = np.logaddexp2(A_denom, alpha_plus_beta)
+        else:
+            B_denom = np.logaddexp2(A_denom, alpha_plus_beta)
+
+        B_numer[:, xi] = np.logaddexp2(B_numer[:, xi], alpha_plus_beta)
+
+    return lpk, A_numer, A_denom, seq_symbols, B_numer, B_denom
+
+
+def _baum_welch_sums(sequences, priors, transitions, outputs):
+    """
+    Return the log probability and the expected counts of sequences of
+    symbol numbers, each of them normalised by the probability of its
+    sequence and summed up. Like ``_baum_welch_step``, the output counts
+    are only returned for the symbols that occur in the sequences.
+    """
+    N, M = outputs.shape
+    logprob = 0
+    A_numer = _ninf_array((N, N))
+    B_numer = _ninf_array((N, M))
+    A_denom = _ninf_array(N)
+    B_denom = _ninf_array(N)
+    seen = np.zeros(M, bool)
+
+    for sequence in sequences:
+        (
+            lpk,
+            seq_A_numer,
+            seq_A_denom,
+            seq_symbols,
+            seq_B_numer,
+            seq_B_denom,
+        ) = _baum_welch_step(priors, transitions, outputs, sequence)
+
+        A_numer = np.logaddexp2(A_numer, seq_A_numer - lpk)
+        B_numer[:, seq_symbols] = np.logaddexp2(
+            B_numer[:, seq_symbols], seq_B_numer - lpk
+        )
+        A_denom = np.logaddexp2(A_denom, seq_A_denom - lpk)
+        B_denom = np.logaddexp2(B_denom, seq_B_denom - lpk)
+        seen[seq_symbols] = True
+        logprob += lpk
+
+    symbols = np.flatnonzero(seen)
+    return logprob, A_numer, A_denom, symbols, B_numer[:, symbols], B_denom
+
+
+def _parallel_baum_welch_sums(
+    sequences, priors, transitions, outputs, processes, chunksize
+):
+    """
+    Return the results of ``_baum_welch_sums`` for chunks of sequences,
+    computed in worker processes.
+    """
+    # Forked workers share the model arrays instead of copying them.
+    sums = functools.partial(
+        _baum_welch_sums, priors=priors, transitions=transitions, outputs=outputs
+    )
+    chunks = (
+        sequences[start : start + chunksize]
+        for start in range(0, len(sequences), chunksize)
+    )
+    return list(parallel_imap(sums, chunks, processes, chunksize=1))
+
+
 def _ninf_array(shape):
     res = np.empty(shape, np.float64)
     res.fill(-np.inf)
@@ -1139,6 +1303,12 @@ def logsumexp2(arr):
     return np.log2(np.sum(2 ** (arr - max_))) + max_
 
 
+def _logsumexp2_rows(arr):
+    """Apply ``logsumexp2`` to each row of a 2-dimensional array."""
+    max_ = arr.max(axis=1)
+    return np.log2(np.sum(2 ** (arr - max_[:, None]), axis=1)) + max_
+
+
 def _log_add(*values):
     """
     Adds the logged values, returning the logarithm of the addition.
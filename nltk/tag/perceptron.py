@@ -8,19 +8,24 @@
 #
 # This module is provided under the terms of the MIT License.
 
+import functools
 import json
 import logging
+import os
 import random
 from collections import defaultdict
+from itertools import islice
 
 from nltk import jsontags
 from nltk.data import find, load
+from nltk.internals import _aligned, read_binary_header, write_binary_header
 from nltk.tag.api import TaggerI
+from nltk.util import parallel_imap
 
 try:
     import numpy as np
 except ImportError:
-    pass
+    np = None
 
 TRAINED_TAGGER_PATH = "averaged_perceptron_tagger/"
 
@@ -42,6 +47,59 @@ TAGGER_JSONS = {
     },
 }
 
+# Saved taggers start with the header written by `write_binary_header`,
+# see `PerceptronTagger.save`. Version 1 stored the dense weight matrix,
+# version 2 stores its nonzero weights by row (in CSR form).
+_MAGIC = b"NLTK-APT"
+_FORMAT_VERSION = 2
+_WEIGHT_DTYPE = "<f8"
+# Weights that are multiples of 1/_WEIGHT_SCALE (as averaged weights are,
+# see `AveragedPerceptron.average_weights`) are stored exactly as integers.
+_WEIGHT_SCALE = 1000
+
+# The file name of a binary copy of a pretrained model, in its directory.
+_PRETRAINED_BINARY = "averaged_perceptron_tagger_{lang}.bin"
+
+
+class _ReadOnlyDict(dict):
+    """A read-only dict, for the pretrained models shared by all taggers."""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "Pretrained tagger models are shared by all taggers and cannot be "
+            "changed. Train the tagger, or assign it changed copies instead."
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (_ReadOnlyDict, (dict(self),))
+
+
+def _pretrained_dir(lang):
+    # Automatically find path to the tagger if location is not specified.
+    return find(f"taggers/averaged_perceptron_tagger_{lang}/")
+
+
+@functools.lru_cache
+def _load_pretrained(lang):
+    """Read the weights, tag dictionary and tags of a pretrained model.
+
+    They are shared by all taggers of the process, so they are read-only.
+    """
+    loc = _pretrained_dir(lang)
+    with open(loc + TAGGER_JSONS[lang]["weights"]) as fin:
+        weights = json.load(fin)
+    with open(loc + TAGGER_JSONS[lang]["tagdict"]) as fin:
+        tagdict = json.load(fin)
+    with open(loc + TAGGER_JSONS[lang]["classes"]) as fin:
+        classes = frozenset(json.load(fin))
+    weights = _ReadOnlyDict(
+        (feat, _ReadOnlyDict(labels)) for feat, labels in weights.items()
+    )
+    return weights, _ReadOnlyDict(tagdict), classes
+
 
 @jsontags.register_tag
 class AveragedPerceptron:
@@ -119,6 +177,13 @@ class AveragedPerceptron:
                     new_feat_weights[clas] = averaged
             self.weights[feat] = new_feat_weights
 
+    def compile(self):
+        """Return a `CompiledAveragedPerceptron` with the same predictions.
+
+        Requires NumPy.
+        """
+        return CompiledAveragedPerceptron(self.weights, self.classes)
+
     def save(self, path):
         """Save the model weights as json"""
         with open(path, "w") as fout:
@@ -137,6 +202,120 @@ class AveragedPerceptron:
         return cls(obj)
 
 
+# Scores closer than this (relative to their size) may be ordered differently
+# depending on the order in which weights were summed.
+_TIE_TOLERANCE = 1e-9
+
+
+class CompiledAveragedPerceptron:
+    """Read-only averaged perceptron for fast inference, requires NumPy.
+
+    Features and classes are mapped to integer ids and the weights are kept
+    in a dense matrix with one row per feature, so scoring a token takes a
+    single sum over the rows of its features. Classes are sorted, which lets
+    ties be broken the same way as `AveragedPerceptron.predict` does, and
+    rows are added in the same order as there, so predictions are identical.
+
+    Created with `AveragedPerceptron.compile`.
+    """
+
+    def __init__(self, weights, classes):
+        _require_numpy()
+        self.classes = sorted(classes)
+        class_ids = {label: i for i, label in enumerate(self.classes)}
+        self.feature_ids = {feat: i for i, feat in enumerate(weights)}
+        # The extra last row is all zeros and stands in for unknown features.
+        self.unknown_feature = len(self.feature_ids)
+        shape = (len(self.feature_ids) + 1, len(self.classes))
+        self.weight_matrix = np.zeros(shape)
+        for feat, i in self.feature_ids.items():
+            for label, weight in weights[feat].items():
+                if label in class_ids:
+                    self.weight_matrix[i, class_ids[label]] = weight
+
+    @classmethod
+    def _from_matrix(cls, features, classes, weight_matrix):
+        """Create a model from the attributes of another one."""
+        model = cls.__new__(cls)
+        model.classes = classes
+        model.feature_ids = {feat: i for i, feat in enumerate(features)}
+        model.unknown_feature = len(features)
+        model.weight_matrix = weight_matrix
+        return model
+
+    @property
+    def weights(self):
+        """The weights as a dict of dicts, as in `AveragedPerceptron`."""
+        return {
+            feat: {
+                self.classes[j]: self.weight_matrix[i, j].item()
+                for j in np.flatnonzero(self.weight_matrix[i])
+            }
+            for feat, i in self.feature_ids.items()
+        }
+
+    def predict_ids(self, feature_ids, return_conf=False):
+        """Return the best label for features given by their ids.
+
+        Features the model doesn't know should be given as
+        `self.unknown_feature`.
+        """
+        return self._predict_rows(self.weight_matrix[feature_ids], return_conf)
+
+    def best_labels(self, scores):
+        """Return the class with the highest score for each row of `scores`.
+
+        Gives None instead of a class if another class scores almost as high.
+        Rounding errors depend on the order in which feature weights were
+        summed, so such features need to be scored with `predict_ids` to get
+        the same result as `AveragedPerceptron.predict`.
+        """
+        # Of equal scores the alphabetically last class wins, as in `predict`.
+        best = scores.shape[1] - 1 - np.argmax(scores[:, ::-1], axis=1)
+        top = scores[np.arange(len(scores)), best]
+        tolerance = _TIE_TOLERANCE * (1 + np.abs(top))
+        close = np.count_nonzero(scores >= (top - tolerance)[:, None], axis=1)
+        classes = self.classes
+        return [
+            classes[label] if n_close == 1 else None
+            for label, n_close in zip(best.tolist(), close.tolist())
+        ]
+
+    def predict(self, features, return_conf=False):
+        """Dot-product the features and weights and return the best label.
+
+        Takes the same feature dicts as `AveragedPerceptron.predict`.
+        """
+        features = [(feat, value) for feat, value in features.items() if value != 0]
+        feature_ids = [
+            self.feature_ids.get(feat, self.unknown_feature) for feat, _ in features
+        ]
+        rows = self.weight_matrix[feature_ids]
+        if any(value != 1 for _, value in features):
+            rows *= np.array([value for _, value in features], dtype=float)[:, None]
+        return self._predict_rows(rows, return_conf)
+
+    def _predict_rows(self, rows, return_conf):
+        # Rows are summed one after the other, in the same order as the
+        # feature dicts are iterated in `AveragedPerceptron.predict`.
+        scores = rows.sum(axis=0)
+        # Of equal scores the alphabetically last class wins, as it does there.
+        best = len(self.classes) - 1 - int(np.argmax(scores[::-1]))
+        conf = None
+        if return_conf == True:
+            # A softmax over all classes, including those without weights
+            # for these features, which `AveragedPerceptron.predict` scores
+            # as 0 when it picks the best label.
+            exps = np.exp(scores)
+            conf = max(exps / np.sum(exps))
+        return self.classes[best], conf
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("You need numpy in order to use compiled perceptron models")
+
+
 @jsontags.register_tag
 class PerceptronTagger(TaggerI):
     """
@@ -165,6 +344,13 @@ class PerceptronTagger(TaggerI):
 
     >>> pretrain.tag("The red cat".split())
     [('The', 'DT'), ('red', 'JJ'), ('cat', 'NN')]
+
+    Compiling the model makes tagging several times faster, with the same
+    results. A compiled tagger can't be trained any further.
+
+    >>> compiled = PerceptronTagger().compile()
+    >>> compiled.tag("The red cat".split())
+    [('The', 'DT'), ('red', 'JJ'), ('cat', 'NN')]
     """
 
     json_tag = "nltk.tag.sequential.PerceptronTagger"
@@ -188,6 +374,9 @@ class PerceptronTagger(TaggerI):
         :params tokens: list of word
         :type tokens: list(str)
         """
+        if isinstance(self.model, CompiledAveragedPerceptron) and return_conf != True:
+            return self._tag_compiled_sentence(tokens, use_tagdict)
+
         prev, prev2 = self.START
         output = []
 
@@ -206,6 +395,182 @@ class PerceptronTagger(TaggerI):
 
         return output
 
+    def _tag_compiled_sentence(self, tokens, use_tagdict=True):
+        """Tag a single sentence with a `CompiledAveragedPerceptron` model.
+
+        Like `_tag_compiled`, but without the bookkeeping that pays off for
+        batches: the features that don't depend on previous tags are scored
+        for the whole sentence at once, and each token then only adds the
+        rows of its four tag features.
+        """
+        model = self.model
+        weight_matrix = model.weight_matrix
+        feature_ids, unknown = model.feature_ids, model.unknown_feature
+        tagdict = self.tagdict if use_tagdict == True else {}
+        classes = model.classes
+        output = []
+        if not tokens:
+            return output
+
+        context = self.START + [self.normalize(w) for w in tokens] + self.END
+        tagless_ids = [
+            [
+                feature_ids.get(feat, unknown)
+                for feat in self._tagless_feature_names(i, word, context)
+            ]
+            for i, word in enumerate(tokens)
+        ]
+        tagless_scores = weight_matrix[tagless_ids].sum(axis=1)
+        prev, prev2 = self.START
+        for i, word in enumerate(tokens):
+            tag = tagdict.get(word)
+            if not tag:
+                ids = [
+                    feature_ids.get(feat, unknown)
+                    for feat in self._tag_feature_names(i, context, prev, prev2)
+                ]
+                scores = tagless_scores[i] + weight_matrix[ids[0]]
+                for feat_id in ids[1:]:
+                    scores += weight_matrix[feat_id]
+                # As in `best_labels`, near ties are scored again.
+                scores = scores.tolist()
+                top = max(scores)
+                threshold = top - _TIE_TOLERANCE * (1 + abs(top))
+                close = [j for j, score in enumerate(scores) if score >= threshold]
+                if len(close) == 1:
+                    tag = classes[close[0]]
+                else:
+                    ordered = self._order_features(tagless_ids[i], ids)
+                    tag, _ = model.predict_ids(ordered)
+            output.append((word, tag))
+            prev2, prev = prev, tag
+        return output
+
+    def _tag_compiled(self, sentences, use_tagdict=True):
+        """Tag sentences with a `CompiledAveragedPerceptron` model.
+
+        Tagging is greedy, so every token depends on the tags before it, but
+        sentences don't depend on each other. So the features that don't
+        depend on previous tags are scored for all tokens at once, and then
+        the first tokens of all sentences are scored together, then the second
+        tokens, and so on.
+
+        This doesn't sum feature weights in the same order as
+        `AveragedPerceptron.predict`. Tokens whose best tags score almost the
+        same are scored again with `predict_ids`, which sums them in the
+        original order, so ties are broken the same way as without compiling.
+        """
+        model = self.model
+        weight_matrix = model.weight_matrix
+        feature_ids, unknown = model.feature_ids, model.unknown_feature
+        tagdict = self.tagdict if use_tagdict == True else {}
+        outputs = [[] for _ in sentences]
+        if not any(sentences):
+            return outputs
+
+        # Most features only depend on a single word, so their ids are looked
+        # up once for every distinct word of the batch.
+        words, word_ids = {}, []
+        norms, norm_ids = {}, []
+        contexts, starts, token_words, token_norms = [], [], [], [[] for _ in range(5)]
+        for tokens in sentences:
+            starts.append(len(token_words))
+            for word in tokens:
+                if word not in words:
+                    words[word] = len(word_ids)
+                    names = self._word_feature_names(word)
+                    word_ids.append([feature_ids.get(feat, unknown) for feat in names])
+                token_words.append(words[word])
+            context = self.START + [self.normalize(w) for w in tokens] + self.END
+            contexts.append(context)
+            for word in context:
+                if word not in norms:
+                    norms[word] = len(norm_ids)
+                    names = self._context_feature_names(word)
+                    norm_ids.append([feature_ids.get(feat, unknown) for feat in names])
+            context = [norms[word] for word in context]
+            # The context words at offsets 0, -1, -2, +1 and +2.
+            for offsets, start in zip(token_norms, (2, 1, 0, 3, 4)):
+                offsets.extend(context[start : start + len(tokens)])
+
+        word_ids, norm_ids = np.array(word_ids), np.array(norm_ids)
+        columns = [np.full(len(token_words), feature_ids.get("bias", unknown))]
+        columns += list(word_ids[token_words].T)
+        for offset, features in zip(token_norms, ([0], [1, 2], [3], [4, 5], [6])):
+            columns += list(norm_ids[offset][:, features].T)
+        tagless_scores = weight_matrix[columns[0]]
+        for column in columns[1:]:
+            tagless_scores = tagless_scores + weight_matrix[column]
+
+        # Sentences are visited longest first, so the ones that are done can
+        # be left out of each step.
+        order = sorted(range(len(sentences)), key=lambda n: -len(sentences[n]))
+        active = len(order)
+        prevs = [self.START[0]] * len(sentences)
+        prevs2 = [self.START[1]] * len(sentences)
+        tag_ids, tag_word_ids = {}, {}
+        for i in range(len(sentences[order[0]])):
+            while len(sentences[order[active - 1]]) <= i:
+                active -= 1
+            waiting, rows, step_ids = [], [], []
+            for n in order[:active]:
+                word = sentences[n][i]
+                tag = tagdict.get(word)
+                if tag:
+                    outputs[n].append((word, tag))
+                    prevs2[n], prevs[n] = prevs[n], tag
+                    continue
+                prev, prev2, norm = prevs[n], prevs2[n], contexts[n][i + 2]
+                ids = tag_ids.get((prev, prev2))
+                word_id = tag_word_ids.get((prev, norm))
+                if ids is None or word_id is None:
+                    names = self._tag_feature_names(i, contexts[n], prev, prev2)
+                    names = [feature_ids.get(feat, unknown) for feat in names]
+                    ids = tag_ids[prev, prev2] = names[:3]
+                    word_id = tag_word_ids[prev, norm] = names[3]
+                waiting.append(n)
+                rows.append(starts[n] + i)
+                step_ids.append(ids + [word_id])
+            if not waiting:
+                continue
+            scores = tagless_scores[rows] + weight_matrix[step_ids].sum(axis=1)
+            for n, row, ids, tag in zip(
+                waiting, rows, step_ids, model.best_labels(scores)
+            ):
+                if tag is None:
+                    tagless = [int(column[row]) for column in columns]
+                    tag, _ = model.predict_ids(self._order_features(tagless, ids))
+                outputs[n].append((sentences[n][i], tag))
+                prevs2[n], prevs[n] = prevs[n], tag
+        return outputs
+
+    def tag_sents(self, sentences, processes=1, chunksize=1000):
+        """
+        Apply ``self.tag()`` to each element of *sentences*.
+
+        With a compiled model, sentences are tagged ``chunksize`` at a time,
+        see `compile`. With more than one process, chunks of sentences are
+        tagged in worker processes, see `nltk.util.parallel_imap`.
+
+        :param sentences: list of sentences, each a list of words
+        :type sentences: list(list(str))
+        :param int processes: Number of worker processes used for tagging.
+        :param int chunksize: Number of sentences tagged at once.
+        :rtype: list(list(tuple(str, str)))
+        """
+        chunks = _chunks(sentences, chunksize)
+        if processes <= 1:
+            if not isinstance(self.model, CompiledAveragedPerceptron):
+                return super().tag_sents(sentences)
+            return [sent for chunk in chunks for sent in self._tag_compiled(chunk)]
+
+        tag_chunk = functools.partial(self.tag_sents, chunksize=chunksize)
+        return [
+            sent
+            for chunk in parallel_imap(tag_chunk, chunks, processes, chunksize=1)
+            for sent in chunk
+        ]
+
     def train(self, sentences, save_loc=None, nr_iter=5):
         """Train a model from sentences, and save it at ``save_loc``. ``nr_iter``
         controls the number of Perceptron training iterations.
@@ -222,6 +587,13 @@ class PerceptronTagger(TaggerI):
         # This saves the overheard of just iterating through ``sentences`` to
         # get the list by ``sentences = list(sentences)``.
 
+        # Pretrained models are shared between taggers, see `load_from_json`.
+        self.tagdict = dict(self.tagdict)
+        self.classes = set(self.classes)
+        self.model.weights = {
+            feat: dict(weights) for feat, weights in self.model.weights.items()
+        }
+
         self._sentences = list()  # to be populated by self._make_tagdict...
         self._make_tagdict(sentences)
         self.model.classes = self.classes
@@ -268,18 +640,188 @@ class PerceptronTagger(TaggerI):
         with open(loc + TAGGER_JSONS[lang]["classes"], "w") as fout:
             json.dump(self.classes, fout)
 
+    def compile(self):
+        """Switch to a compiled model for faster tagging.
+
+        The feature weights are copied into a NumPy matrix, see
+        `CompiledAveragedPerceptron`. Tagging gives the same results as
+        before, but the tagger can no longer be trained.
+
+        :return: this tagger
+        """
+        if not isinstance(self.model, CompiledAveragedPerceptron):
+            self.model.classes = self.classes
+            self.model = self.model.compile()
+        return self
+
     def load_from_json(self, lang="eng"):
-        # Automatically find path to the tagger if location is not specified.
-        loc = find(f"taggers/averaged_perceptron_tagger_{lang}/")
-        with open(loc + TAGGER_JSONS[lang]["weights"]) as fin:
-            self.model.weights = json.load(fin)
-        with open(loc + TAGGER_JSONS[lang]["tagdict"]) as fin:
-            self.tagdict = json.load(fin)
-        with open(loc + TAGGER_JSONS[lang]["classes"]) as fin:
-            self.classes = set(json.load(fin))
+        """Load the pretrained model for ``lang``.
 
+        The JSON files are only read the first time a language is loaded in
+        a process. Later taggers share the model with the first one. The
+        shared model is read-only; `train` copies it before changing it.
+        """
+        weights, self.tagdict, self.classes = _load_pretrained(lang)
+        self.model.weights = weights
         self.model.classes = self.classes
 
+    @classmethod
+    def save_pretrained(cls, lang="eng", path=None):
+        """Save a binary copy of the pretrained model for ``lang`` with
+        `save`, by default next to its JSON files, where `load_pretrained`
+        (and so `pos_tag`) finds it. Requires NumPy.
+
+            >>> PerceptronTagger.save_pretrained("eng") # doctest: +SKIP
+
+        :param str lang: The language of the pretrained model.
+        :param path: Name of the file to write.
+        :return: The name of the file written.
+        """
+        if path is None:
+            path = os.path.join(
+                _pretrained_dir(lang), _PRETRAINED_BINARY.format(lang=lang)
+            )
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            cls(lang=lang).save(tmp_path)
+            # Other processes only ever see a complete file.
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return path
+
+    @classmethod
+    def load_pretrained(cls, lang="eng"):
+        """Return a compiled tagger with the pretrained model for ``lang``,
+        loaded with `load` from the binary copy saved by `save_pretrained`.
+        This is much faster than reading the JSON files of the model.
+        Requires NumPy.
+
+        :param str lang: The language of the pretrained model.
+        :raises LookupError: if there is no binary copy of the model, or it
+            is older than the model's JSON files.
+        """
+        _require_numpy()
+        loc = _pretrained_dir(lang)
+        path = os.path.join(loc, _PRETRAINED_BINARY.format(lang=lang))
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError as e:
+            raise LookupError(f"No binary copy of the {lang} tagger: {path}") from e
+        for name in TAGGER_JSONS[lang].values():
+            source = os.path.join(loc, name)
+            if os.path.exists(source) and os.path.getmtime(source) > mtime:
+                raise LookupError(f"The binary copy {path} is out of date.")
+        return cls.load(path)
+
+    def save(self, path):
+        """Save the tagger to `path` in a compact binary format.
+
+        The nonzero feature weights are stored by feature, in CSR form, as
+        integers if they all have at most three decimals (as trained weights
+        do) and as doubles otherwise, with feature names, tags and the tag
+        dictionary in a JSON header. This is smaller than the JSON files the
+        pretrained models are distributed as, and loads much faster. Use
+        `load` to read the tagger back.
+
+        :param path: Name of the file to write.
+        """
+        model = self.model
+        if not isinstance(model, CompiledAveragedPerceptron):
+            model = CompiledAveragedPerceptron(model.weights, self.classes)
+        matrix = model.weight_matrix
+        rows, columns = np.nonzero(matrix)
+        values = matrix[rows, columns]
+        scaled = np.round(values * _WEIGHT_SCALE)
+        exact = np.all(scaled / _WEIGHT_SCALE == values) and (
+            len(scaled) == 0 or np.abs(scaled).max() < 2**31
+        )
+        arrays = {
+            "indptr": np.searchsorted(rows, np.arange(matrix.shape[0] + 1)),
+            "indices": columns,
+            "data": scaled if exact else values,
+        }
+        dtypes = {
+            "indptr": "<i4" if len(values) < 2**31 else "<i8",
+            "indices": "<i2" if matrix.shape[1] < 2**15 else "<i4",
+            "data": "<i4" if exact else _WEIGHT_DTYPE,
+        }
+        header = {
+            "classes": model.classes,
+            "tagdict": self.tagdict,
+            "features": list(model.feature_ids),
+            "shape": matrix.shape,
+            "scale": _WEIGHT_SCALE if exact else 1,
+            "arrays": [[name, dtypes[name], len(arrays[name])] for name in arrays],
+        }
+        with open(path, "wb") as outfile:
+            write_binary_header(outfile, _MAGIC, _FORMAT_VERSION, header)
+            for name, array in arrays.items():
+                outfile.write(bytes(_aligned(outfile.tell()) - outfile.tell()))
+                outfile.write(array.astype(dtypes[name]).tobytes())
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """Load a tagger saved with `save`. The tagger is compiled.
+
+        By default the weights are memory-mapped rather than read, before
+        they are unpacked into the weight matrix.
+
+        >>> import os, tempfile
+        >>> tagger = PerceptronTagger(load=False)
+        >>> tagger.train([[('today','NN'),('is','VBZ'),('good','JJ'),('day','NN')],
+        ... [('yes','NNS'),('it','PRP'),('beautiful','JJ')]])
+        >>> path = os.path.join(tempfile.mkdtemp(), "tagger.bin")
+        >>> tagger.save(path)
+        >>> PerceptronTagger.load(path).tag(['today','is','a','beautiful','day'])
+        [('today', 'NN'), ('is', 'PRP'), ('a', 'PRP'), ('beautiful', 'JJ'), ('day', 'NN')]
+
+        :param path: Name of the file to read.
+        :param bool use_mmap: Whether to memory-map the weights.
+        :raises ValueError: if the file is not a saved tagger or was saved
+            in an incompatible format.
+        """
+        _require_numpy()
+        with open(path, "rb") as infile:
+            version, header, data_start = read_binary_header(
+                infile, _MAGIC, _FORMAT_VERSION, "saved perceptron tagger"
+            )
+            shape = tuple(header["shape"])
+            if version == 1:
+                # The dense weight matrix.
+                arrays = [("matrix", _WEIGHT_DTYPE, shape[0] * shape[1])]
+            else:
+                arrays = header["arrays"]
+            offset = data_start
+            loaded = {}
+            for name, dtype, length in arrays:
+                offset = _aligned(offset)
+                if use_mmap and length:
+                    array = np.memmap(infile, dtype, "r", offset, (length,))
+                else:
+                    infile.seek(offset)
+                    array = np.fromfile(infile, dtype, length)
+                loaded[name] = array
+                offset += length * np.dtype(dtype).itemsize
+
+        if version == 1:
+            weight_matrix = loaded["matrix"].reshape(shape)
+        else:
+            weight_matrix = np.zeros(shape)
+            indptr = loaded["indptr"]
+            rows = np.repeat(np.arange(shape[0]), np.diff(indptr))
+            weight_matrix[rows, loaded["indices"]] = loaded["data"]
+            if header["scale"] != 1:
+                weight_matrix /= header["scale"]
+        tagger = cls(load=False)
+        tagger.model = CompiledAveragedPerceptron._from_matrix(
+            header["features"], header["classes"], weight_matrix
+        )
+        tagger.tagdict = header["tagdict"]
+        tagger.classes = set(header["classes"])
+        return tagger
+
     def encode_json_obj(self):
         return self.model.weights, self.tagdict, list(self.classes)
 
@@ -314,28 +856,68 @@ class PerceptronTagger(TaggerI):
         trained.
         """
 
-        def add(name, *args):
-            features[" ".join((name,) + tuple(args))] += 1
-
-        i += len(self.START)
         features = defaultdict(int)
-        # It's useful to have a constant feature, which acts sort of like a prior
-        add("bias")
-        add("i suffix", word[-3:])
-        add("i pref1", word[0] if word else "")
-        add("i-1 tag", prev)
-        add("i-2 tag", prev2)
-        add("i tag+i-2 tag", prev, prev2)
-        add("i word", context[i])
-        add("i-1 tag+i word", prev, context[i])
-        add("i-1 word", context[i - 1])
-        add("i-1 suffix", context[i - 1][-3:])
-        add("i-2 word", context[i - 2])
-        add("i+1 word", context[i + 1])
-        add("i+1 suffix", context[i + 1][-3:])
-        add("i+2 word", context[i + 2])
+        for feat in self._feature_names(i, word, context, prev, prev2):
+            features[feat] += 1
         return features
 
+    def _feature_names(self, i, word, context, prev, prev2):
+        """The names of the features of `_get_features`, in order."""
+        return self._order_features(
+            self._tagless_feature_names(i, word, context),
+            self._tag_feature_names(i, context, prev, prev2),
+        )
+
+    def _tagless_feature_names(self, i, word, context):
+        """Names of the features that don't depend on previous tags."""
+        i += len(self.START)
+        return [
+            # It's useful to have a constant feature, which acts sort of like a prior
+            "bias",
+            "i suffix " + word[-3:],
+            "i pref1 " + (word[0] if word else ""),
+            "i word " + context[i],
+            "i-1 word " + context[i - 1],
+            "i-1 suffix " + context[i - 1][-3:],
+            "i-2 word " + context[i - 2],
+            "i+1 word " + context[i + 1],
+            "i+1 suffix " + context[i + 1][-3:],
+            "i+2 word " + context[i + 2],
+        ]
+
+    def _word_feature_names(self, word):
+        """Names of the features of `_tagless_feature_names` that only depend
+        on the word itself."""
+        return ["i suffix " + word[-3:], "i pref1 " + (word[0] if word else "")]
+
+    def _context_feature_names(self, word):
+        """Names of the features of `_tagless_feature_names` for a normalized
+        word at offsets 0, -1, -1, -2, +1, +1 and +2 from the tagged word."""
+        return [
+            "i word " + word,
+            "i-1 word " + word,
+            "i-1 suffix " + word[-3:],
+            "i-2 word " + word,
+            "i+1 word " + word,
+            "i+1 suffix " + word[-3:],
+            "i+2 word " + word,
+        ]
+
+    def _tag_feature_names(self, i, context, prev, prev2):
+        """Names of the features that depend on the previous tags."""
+        i += len(self.START)
+        return [
+            "i-1 tag " + prev,
+            "i-2 tag " + prev2,
+            f"i tag+i-2 tag {prev} {prev2}",
+            f"i-1 tag+i word {prev} {context[i]}",
+        ]
+
+    @staticmethod
+    def _order_features(tagless, tag):
+        """Interleave the two kinds of features in their original order."""
+        return tagless[:3] + tag[:3] + tagless[3:4] + tag[3:] + tagless[4:]
+
     def _make_tagdict(self, sentences):
         """
         Make a tag dictionary for single-tag words.
@@ -358,6 +940,16 @@ class PerceptronTagger(TaggerI):
                 self.tagdict[word] = tag
 
 
+def _chunks(sentences, chunksize):
+    """Split sentences into lists of ``chunksize`` sentences."""
+    sentences = iter(sentences)
+    while True:
+        chunk = [list(sent) for sent in islice(sentences, chunksize)]
+        if not chunk:
+            return
+        yield chunk
+
+
 def _pc(n, d):
     return (n / d) * 100
 
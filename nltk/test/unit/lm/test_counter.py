@@ -10,7 +10,7 @@ import unittest
 import pytest
 
 from nltk import FreqDist
-from nltk.lm import NgramCounter
+from nltk.lm import NgramCounter, Vocabulary
 from nltk.util import everygrams
 
 
@@ -114,3 +114,84 @@ class TestNgramCounterTraining:
         self.case.assertCountEqual(unigrams, counter[1].keys())
         self.case.assertCountEqual(bigram_contexts, counter[2].keys())
         self.case.assertCountEqual(trigram_contexts, counter[3].keys())
+
+    def test_merge_same_as_update(self):
+        first, second = [("a", "b"), ("b", "c"), ("a",)], [("a", "b"), ("d", "e", "f")]
+        merged = NgramCounter([first])
+        merged.merge(NgramCounter([second]))
+        updated = NgramCounter([first, second])
+
+        assert merged.N() == updated.N() == 5
+        assert merged[["a"]]["b"] == 2
+        for order in (1, 2, 3):
+            assert merged[order] == updated[order]
+
+
+class TestFrozenNgramCounter:
+    @classmethod
+    def setup_class(self):
+        text = [list("abcd"), list("egdbe")]
+        self.counter = NgramCounter(everygrams(sent, max_len=3) for sent in text)
+        self.frozen = self.counter.freeze()
+        self.case = unittest.TestCase()
+
+    def test_N(self):
+        assert self.frozen.N() == self.counter.N() == 21
+
+    def test_len_does_not_change_with_lookup(self):
+        assert len(self.frozen) == 3
+        self.frozen[50]
+        assert len(self.frozen) == 3
+        assert 50 not in self.frozen
+
+    def test_same_contexts(self):
+        for order in (2, 3):
+            self.case.assertCountEqual(
+                self.counter[order].conditions(), self.frozen[order].conditions()
+            )
+            assert len(self.frozen[order]) == len(self.counter[order])
+
+    def test_same_counts(self):
+        assert dict(self.frozen.unigrams) == dict(self.counter.unigrams)
+        for order in (2, 3):
+            for context, dist in self.counter[order].items():
+                frozen_dist = self.frozen[order][context]
+                assert dict(frozen_dist) == dict(dist)
+                assert frozen_dist.N() == dist.N()
+
+    def test_unseen_lookups(self):
+        assert self.frozen["z"] == 0
+        assert self.frozen[["b"]]["z"] == 0
+        assert self.frozen[["z"]]["b"] == 0
+        assert not self.frozen[["z", "b"]]
+        assert ("z",) not in self.frozen[2]
+
+    def test_get(self):
+        for dist, frozen_dist in [
+            (self.counter.unigrams, self.frozen.unigrams),
+            (self.counter[["d"]], self.frozen[["d"]]),
+        ]:
+            for word in ["b", "e", "z"]:
+                assert frozen_dist.get(word) == dist.get(word)
+                assert frozen_dist.get(word, 0) == dist.get(word, 0)
+        assert self.frozen[2].get(("z",)) is None
+        assert dict(self.frozen[2].get(("d",))) == dict(self.counter[2].get(("d",)))
+
+    def test_freq(self):
+        assert self.frozen[["d"]].freq("b") == self.counter[["d"]].freq("b")
+        assert self.frozen[["z"]].freq("b") == 0
+
+    def test_vocabulary_ids_come_first(self):
+        frozen = self.counter.freeze(Vocabulary(["e", "a"]))
+        assert frozen._words[:3] == ["<UNK>", "a", "e"]
+        assert dict(frozen.unigrams) == dict(self.counter.unigrams)
+
+    def test_cannot_update(self):
+        with pytest.raises(TypeError):
+            self.frozen.update([[("a", "b")]])
+
+    def test_cannot_merge(self):
+        with pytest.raises(TypeError):
+            self.frozen.merge(NgramCounter([[("a", "b")]]))
+        with pytest.raises(TypeError):
+            NgramCounter().merge(self.frozen)
@@ -4,7 +4,9 @@
 # Author: Ilia Kurenkov <ilia.kurenkov@gmail.com>
 # URL: <https://www.nltk.org/>
 # For license information, see LICENSE.TXT
+import copy
 import math
+from functools import partial
 from math import fsum as sum
 from operator import itemgetter
 
@@ -20,7 +22,9 @@ from nltk.lm import (
     Vocabulary,
     WittenBellInterpolated,
 )
-from nltk.lm.preprocessing import padded_everygrams
+from nltk.lm.api import LanguageModel
+from nltk.lm.preprocessing import padded_everygram_pipeline, padded_everygrams
+from nltk.lm.smoothing import KneserNey, _scan_continuation_counts
 
 
 @pytest.fixture(scope="session")
@@ -505,6 +509,34 @@ def test_stupid_backoff_trigram_score(
     )
 
 
+###############################################################################
+#                        Kneser-Ney Continuation Counts                       #
+###############################################################################
+
+
+@pytest.mark.parametrize(
+    "word, context",
+    [("c", ()), ("z", ()), ("<UNK>", ()), ("c", ("b",)), ("d", ("a",)), ("a", ("z",))],
+)
+def test_kneserney_continuation_index_matches_scan(
+    kneserney_trigram_model, word, context
+):
+    estimator = kneserney_trigram_model.estimator
+    assert estimator._continuation_counts(word, context) == _scan_continuation_counts(
+        estimator.counts, word, context
+    )
+
+
+def test_kneserney_continuation_index_updated_on_fit(kneserney_trigram_model):
+    before = kneserney_trigram_model.score("c", ["b"])
+    kneserney_trigram_model.fit([list(padded_everygrams(3, ["a", "c", "b", "c"]))])
+    estimator = kneserney_trigram_model.estimator
+    assert estimator._continuation_counts("c", ("b",)) == _scan_continuation_counts(
+        estimator.counts, "c", ("b",)
+    )
+    assert kneserney_trigram_model.score("c", ["b"]) != before
+
+
 ###############################################################################
 #               Probability Distributions Should Sum up to Unity              #
 ###############################################################################
@@ -546,6 +578,156 @@ def test_sums_to_1(model_fixture, context, request):
     assert pytest.approx(scores_for_context, 1e-7) == 1.0
 
 
+@pytest.mark.parametrize(
+    "model_fixture",
+    [
+        "mle_trigram_model",
+        "wittenbell_trigram_model",
+        "kneserney_trigram_model",
+        "stupid_backoff_trigram_model",
+    ],
+)
+def test_score_many_same_as_score(model_fixture, request):
+    model = request.getfixturevalue(model_fixture)
+    ngrams = [("a",), ("b", "c"), ("a", "b", "c"), ("w", "b", "c"), ("b", "c")] * 2
+    expected = [model.score(ngram[-1], ngram[:-1]) for ngram in ngrams]
+    assert list(model.score_many(iter(ngrams))) == expected
+    assert list(model.score_many(ngrams, cache_size=2)) == expected
+    assert list(model.logscore_many(ngrams)) == [
+        model.logscore(ngram[-1], ngram[:-1]) for ngram in ngrams
+    ]
+
+
+@pytest.mark.parametrize(
+    "model_fixture",
+    [
+        "mle_trigram_model",
+        "lidstone_bigram_model",
+        "wittenbell_trigram_model",
+        "kneserney_trigram_model",
+        "stupid_backoff_trigram_model",
+    ],
+)
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_save_and_load(model_fixture, use_mmap, request, tmp_path):
+    model = request.getfixturevalue(model_fixture)
+    path = tmp_path / "model.lm"
+    model.save(path)
+    loaded = LanguageModel.load(path, use_mmap=use_mmap)
+    assert type(loaded) is type(model)
+    assert loaded.vocab == model.vocab
+    assert loaded.counts.N() == model.counts.N()
+    for context in [None, ("a",), ("b",), ("<s>",), ("z",), ("a", "b"), ("w", "c")]:
+        for word in model.vocab:
+            assert loaded.score(word, context) == model.score(word, context)
+
+
+def test_load_checks_model_class(mle_bigram_model, tmp_path):
+    path = tmp_path / "model.lm"
+    mle_bigram_model.save(path)
+    with pytest.raises(ValueError):
+        Lidstone.load(path)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "model.lm"
+    path.write_bytes(b"not a model" * 10)
+    with pytest.raises(ValueError):
+        LanguageModel.load(path)
+
+
+def test_fit_with_processes_same_as_serial(training_data):
+    serial, parallel = MLE(3), MLE(3)
+    serial.fit(*padded_everygram_pipeline(3, training_data))
+    parallel.fit(*padded_everygram_pipeline(3, training_data), processes=2, chunksize=1)
+    assert parallel.vocab == serial.vocab
+    assert parallel.counts.N() == serial.counts.N()
+    for order in (2, 3):
+        assert parallel.counts[order] == serial.counts[order]
+    assert parallel.counts.unigrams == serial.counts.unigrams
+
+
+def test_fit_with_preprocess_same_as_serial(training_data):
+    serial = MLE(3)
+    serial.fit(*padded_everygram_pipeline(3, training_data))
+    preprocess = partial(padded_everygrams, 3)
+    for processes in (1, 2):
+        lm = MLE(3, vocabulary=serial.vocab)
+        lm.fit(training_data, processes=processes, chunksize=1, preprocess=preprocess)
+        assert lm.counts.N() == serial.counts.N()
+        for order in (2, 3):
+            assert lm.counts[order] == serial.counts[order]
+
+
+def test_entropy_of_ngram_iterator(kneserney_trigram_model):
+    ngrams = [("<s>", "a", "b"), ("a", "b", "c"), ("b", "c", "d"), ("c", "d", "</s>")]
+    assert kneserney_trigram_model.entropy(iter(ngrams)) == pytest.approx(
+        kneserney_trigram_model.entropy(ngrams)
+    )
+
+
+@pytest.mark.parametrize(
+    "model_fixture",
+    [
+        "mle_trigram_model",
+        "lidstone_bigram_model",
+        "wittenbell_trigram_model",
+        "absolute_discounting_trigram_model",
+        "kneserney_trigram_model",
+        "stupid_backoff_trigram_model",
+    ],
+)
+def test_frozen_counts_give_same_scores(model_fixture, request):
+    model = request.getfixturevalue(model_fixture)
+    frozen_model = copy.copy(model)
+    frozen_model.counts = model.counts.freeze(model.vocab)
+    if hasattr(model, "estimator"):
+        frozen_model.estimator = copy.copy(model.estimator)
+        frozen_model.estimator.counts = frozen_model.counts
+        if isinstance(frozen_model.estimator, KneserNey):
+            frozen_model.estimator.reset_continuation_index()
+    for context in [None, ("a",), ("b",), ("<s>",), ("z",), ("a", "b"), ("w", "c")]:
+        for word in model.vocab:
+            assert frozen_model.score(word, context) == pytest.approx(
+                model.score(word, context), 1e-12
+            )
+
+
+@pytest.mark.parametrize(
+    "model_fixture",
+    [
+        "mle_trigram_model",
+        "lidstone_bigram_model",
+        "laplace_bigram_model",
+        "wittenbell_trigram_model",
+        "absolute_discounting_trigram_model",
+        "kneserney_trigram_model",
+        "stupid_backoff_trigram_model",
+    ],
+)
+def test_score_many_vectorized(model_fixture, request, tmp_path):
+    np = pytest.importorskip("numpy")
+    model = request.getfixturevalue(model_fixture)
+    path = tmp_path / "model.lm"
+    model.save(path)
+    loaded = LanguageModel.load(path)
+    words = sorted(model.vocab) + ["z"]
+    ngrams = [(w,) for w in words]
+    ngrams += [(c, w) for c in ["a", "b", "<s>", "z"] for w in words]
+    ngrams += [
+        (c1, c2, w) for c1, c2 in [("a", "b"), ("w", "c"), ("z", "a")] for w in words
+    ]
+    expected = [loaded.score(ngram[-1], ngram[:-1]) for ngram in ngrams]
+    assert list(loaded.score_many(ngrams, chunksize=7)) == expected
+    assert list(loaded.logscore_many(iter(ngrams))) == [
+        loaded.logscore(ngram[-1], ngram[:-1]) for ngram in ngrams
+    ]
+    masked = [loaded.vocab.lookup(ngram) for ngram in ngrams[-len(words) :]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vectorized = loaded._unmasked_score_many(masked)
+    assert (vectorized is None) == (model_fixture == "stupid_backoff_trigram_model")
+
+
 ###############################################################################
 #                               Generating Text                               #
 ###############################################################################
@@ -0,0 +1,50 @@
+import pytest
+
+from nltk.grammar import CFG
+from nltk.parse.chart import (
+    BottomUpChartParser,
+    ChartParser,
+    LeftCornerChartParser,
+    TopDownChartParser,
+)
+
+GRAMMARS = {
+    "ambiguous": (
+        """
+        S -> NP VP
+        NP -> Det N | NP PP | 'I'
+        VP -> V NP | VP PP
+        PP -> P NP
+        Det -> 'the' | 'a'
+        N -> 'man' | 'park' | 'telescope'
+        V -> 'saw'
+        P -> 'in' | 'with'
+        """,
+        "I saw the man in the park with a telescope",
+    ),
+    "cyclic": ("S -> S | S S | 'a'", "a a a"),
+    "empty": ("S -> S A | 'a'\nA -> | 'a'", "a a"),
+    "cyclic and empty": ("S -> S | S A | 'a'\nA -> | 'a'", "a a"),
+}
+
+PARSERS = [
+    ChartParser,
+    TopDownChartParser,
+    BottomUpChartParser,
+    LeftCornerChartParser,
+]
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+@pytest.mark.parametrize("name", GRAMMARS)
+def test_forest_trees_match_chart_parses(parser, name):
+    grammar, sent = GRAMMARS[name]
+    grammar = CFG.fromstring(grammar)
+    if parser is LeftCornerChartParser and not grammar.is_nonempty():
+        pytest.skip("LeftCornerChartParser needs a grammar without empty rules")
+    chart = parser(grammar).chart_parse(sent.split())
+    parses = list(chart.parses(grammar.start()))
+    forest = chart.forest(grammar.start())
+    assert forest.count() == len(parses) > 0
+    assert list(forest) == parses
+    assert list(parser(grammar).parse(sent.split())) == parses
@@ -0,0 +1,125 @@
+import pytest
+
+from nltk.grammar import PCFG, Nonterminal
+from nltk.parse.cky import CKYParser
+from nltk.parse.pchart import InsideChartParser
+from nltk.parse.viterbi import ViterbiParser
+
+np = pytest.importorskip("numpy")
+
+GRAMMAR = PCFG.fromstring(
+    """
+    S -> NP VP [0.9] | S Conj S [0.1]
+    NP -> Det N [0.4] | NP PP [0.2] | 'I' [0.2] | Det Adj N PP [0.1] | N [0.1]
+    Det -> 'the' [0.7] | 'a' [0.3]
+    Adj -> 'old' [1.0]
+    N -> 'man' [0.4] | 'park' [0.3] | 'dog' [0.3]
+    VP -> V NP [0.5] | VP PP [0.3] | V [0.1] | 'slept' 'soundly' [0.1]
+    V -> 'saw' [0.7] | 'walked' [0.3]
+    PP -> P NP [1.0]
+    P -> 'in' [0.6] | 'with' [0.4]
+    Conj -> 'and' [1.0]
+    """
+)
+
+SENTENCES = [
+    "I saw the man in the park with a dog",
+    "I saw the old man in the park and the dog walked",
+    "I walked",
+    "the dog slept soundly",
+]
+
+
+def all_parses(tokens):
+    return sorted(
+        InsideChartParser(GRAMMAR).parse(tokens), key=lambda tree: -tree.prob()
+    )
+
+
+def labelled_spans(tree, start=0):
+    spans = {(start, start + len(tree.leaves()), Nonterminal(tree.label()))}
+    for child in tree:
+        if not isinstance(child, str):
+            spans |= labelled_spans(child, start)
+            start += len(child.leaves())
+        else:
+            start += 1
+    return spans
+
+
+@pytest.mark.parametrize("sentence", SENTENCES)
+def test_viterbi(sentence):
+    tokens = sentence.split()
+    expected = next(ViterbiParser(GRAMMAR).parse(tokens))
+    tree = next(CKYParser(GRAMMAR).parse(tokens))
+    assert str(tree) == str(expected)
+    assert tree.prob() == pytest.approx(expected.prob())
+    for subtree in tree.subtrees():
+        assert subtree.prob() > 0
+
+
+@pytest.mark.parametrize("sentence", SENTENCES)
+def test_kbest(sentence):
+    tokens = sentence.split()
+    expected = all_parses(tokens)
+    trees = CKYParser(GRAMMAR).kbest(tokens, 10)
+    assert len(trees) == min(10, len(expected))
+    assert [t.prob() for t in trees] == pytest.approx(
+        [t.prob() for t in expected[: len(trees)]]
+    )
+    assert len({str(t) for t in trees}) == len(trees)
+    assert {str(t) for t in trees} <= {str(t) for t in expected}
+
+
+@pytest.mark.parametrize("sentence", SENTENCES)
+def test_inside_outside(sentence):
+    tokens = sentence.split()
+    parses = all_parses(tokens)
+    total = sum(t.prob() for t in parses)
+    logprob, marginals = CKYParser(GRAMMAR).inside_outside(tokens)
+    assert 2**logprob == pytest.approx(total)
+
+    expected = {}
+    for tree in parses:
+        for span in labelled_spans(tree):
+            expected[span] = expected.get(span, 0) + tree.prob() / total
+    assert set(marginals) == set(expected)
+    for span, posterior in expected.items():
+        assert marginals[span] == pytest.approx(posterior)
+
+
+def test_unary_cycle():
+    grammar = PCFG.fromstring(
+        """
+        S -> A [0.6] | S S [0.4]
+        A -> S [0.3] | 'a' [0.7]
+        """
+    )
+    parser = CKYParser(grammar)
+    for n in range(1, 4):
+        tokens = ["a"] * n
+        expected = next(ViterbiParser(grammar).parse(tokens))
+        tree = next(parser.parse(tokens))
+        assert str(tree) == str(expected)
+        assert tree.prob() == pytest.approx(expected.prob())
+        probs = [t.prob() for t in parser.kbest(tokens, 5)]
+        assert probs == sorted(probs, reverse=True)
+
+
+def test_no_parse():
+    parser = CKYParser(GRAMMAR)
+    assert parser.kbest("the man".split(), 3) == []
+    logprob, marginals = parser.inside_outside("the man".split())
+    assert logprob == -float("inf")
+    assert marginals == {}
+    with pytest.raises(ValueError):
+        parser.kbest("I saw a cat".split(), 1)
+
+
+def test_no_binary_rules():
+    parser = CKYParser(PCFG.fromstring("S -> A [1.0]\nA -> 'a' [1.0]"))
+    assert [str(t) for t in parser.kbest(["a"], 2)] == ["(S (A a)) (p=1)"]
+    assert parser.kbest(["a", "a"], 2) == []
+    assert parser.inside_outside(["a", "a"]) == (-float("inf"), {})
+    logprob, _ = parser.inside_outside(["a"])
+    assert type(logprob) is float and logprob == 0.0
@@ -2,11 +2,20 @@
 Corpus View Regression Tests
 """
 
+import copy
+import os
+import pickle
+import random
+import tempfile
+import threading
 import unittest
 
 import nltk.data
+from nltk import WhitespaceTokenizer
+from nltk.corpus.reader.plaintext import PlaintextCorpusReader
 from nltk.corpus.reader.util import (
     StreamBackedCorpusView,
+    concat,
     read_line_block,
     read_whitespace_block,
 )
@@ -46,3 +55,113 @@ class TestCorpusViews(unittest.TestCase):
 
             v = StreamBackedCorpusView(f, read_line_block)
             self.assertEqual(len(v), len(self.linetok.tokenize(file_data)))
+
+    def test_concurrent_reads(self):
+        # Check that threads sharing a corpus view read the correct values.
+        lines = [f"line {i} " + "x" * (i % 37) for i in range(5000)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "lines.txt")
+            with open(path, "w") as fp:
+                fp.write("\n".join(lines) + "\n")
+
+            for cache_size in (1, 8):
+                v = StreamBackedCorpusView(path, read_line_block, cache_size=cache_size)
+                errors = []
+
+                def read(seed):
+                    rng = random.Random(seed)
+                    try:
+                        for _ in range(200):
+                            i = rng.randrange(len(lines))
+                            j = min(i + rng.randrange(50), len(lines))
+                            if v[i] != lines[i] or list(v[i:j]) != lines[i:j]:
+                                errors.append(i)
+                    except Exception as e:
+                        errors.append(e)
+
+                threads = [threading.Thread(target=read, args=(n,)) for n in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                v.close()
+                self.assertEqual(errors, [])
+                self.assertEqual(len(v), len(lines))
+
+    def test_pickle_and_copy(self):
+        lines = [f"line {i}" for i in range(100)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "lines.txt")
+            with open(path, "w") as fp:
+                fp.write("\n".join(lines) + "\n")
+            v = StreamBackedCorpusView(path, read_line_block, cache_size=4)
+            self.assertEqual(v[50], lines[50])
+            views = [v, concat([v, v])]
+            for view in views:
+                for copied in (pickle.loads(pickle.dumps(view)), copy.deepcopy(view)):
+                    self.assertEqual(list(copied), list(view))
+                    copied.close()
+            v.close()
+
+    def test_index_file(self):
+        # Check that a saved index is reused, and rebuilt when the file changes.
+        lines = [f"line {i}" for i in range(500)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "lines.txt")
+            index = os.path.join(tmpdir, "lines.idx")
+            with open(path, "w") as fp:
+                fp.write("\n".join(lines) + "\n")
+
+            v = StreamBackedCorpusView(path, read_line_block, index_file=index)
+            self.assertEqual(len(v), len(lines))
+            self.assertTrue(os.path.isfile(index))
+
+            v = StreamBackedCorpusView(path, read_line_block, index_file=index)
+            self.assertEqual(v._len, len(lines))
+            self.assertEqual(len(v._toknum), len(lines) // 20 + 1)
+            self.assertEqual(v[437], lines[437])
+            self.assertEqual(len(v + v), 2 * len(lines))
+
+            # An index for another block reader is not used.
+            v = StreamBackedCorpusView(path, read_whitespace_block, index_file=index)
+            self.assertIsNone(v._len)
+            self.assertEqual(len(v), 2 * len(lines))
+
+            with open(path, "a") as fp:
+                fp.write("one more line\n")
+            v = StreamBackedCorpusView(path, read_line_block, index_file=index)
+            self.assertIsNone(v._len)
+            self.assertEqual(v[-1], "one more line")
+            self.assertEqual(len(v), len(lines) + 1)
+
+    def test_reader_index_dir(self):
+        # Check that a reader with an index directory indexes its views.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "a.txt"), "w") as fp:
+                fp.write("One two.\n\nThree four five.\n")
+            index_dir = os.path.join(tmpdir, "index")
+            reader = PlaintextCorpusReader(tmpdir, r"a\.txt", index_dir=index_dir)
+            self.assertEqual(len(reader.words()), 7)
+            self.assertEqual(len(os.listdir(index_dir)), 1)
+
+            reader = PlaintextCorpusReader(tmpdir, r"a\.txt", index_dir=index_dir)
+            words = reader.words("a.txt")
+            self.assertEqual(words._len, 7)
+            self.assertEqual(
+                list(words), ["One", "two", ".", "Three", "four", "five", "."]
+            )
+            self.assertIsNone(
+                PlaintextCorpusReader(tmpdir, "a.txt").index_file("a.txt", "words")
+            )
+
+            # A reader with another tokenizer does not use that index.
+            reader = PlaintextCorpusReader(
+                tmpdir,
+                r"a\.txt",
+                word_tokenizer=WhitespaceTokenizer(),
+                index_dir=index_dir,
+            )
+            words = reader.words("a.txt")
+            self.assertIsNone(words._len)
+            self.assertEqual(list(words), ["One", "two.", "Three", "four", "five."])
+            self.assertEqual(len(os.listdir(index_dir)), 2)
@@ -0,0 +1,119 @@
+import pytest
+
+from nltk.grammar import FeatureGrammar
+from nltk.parse import featurechart
+from nltk.parse.earleychart import FeatureEarleyChartParser
+from nltk.parse.featurechart import (
+    FeatureBottomUpChartParser,
+    FeatureBottomUpLeftCornerChartParser,
+    FeatureChartParser,
+    FeatureTopDownChartParser,
+    InstantiateVarsChart,
+)
+
+GRAMMAR = FeatureGrammar.fromstring(
+    r"""
+    % start S
+    S[SEM=<?vp(?np)>] -> NP[NUM=?n, SEM=?np] VP[NUM=?n, SEM=?vp]
+    NP[NUM=?n, SEM=?s] -> Det[NUM=?n] N[NUM=?n, SEM=?s]
+    NP[NUM=?n, SEM=?s] -> NP[NUM=?n, SEM=?s] PP
+    NP[NUM=?n, SEM=?s] -> PropN[NUM=?n, SEM=?s]
+    VP[NUM=?n, SEM=?v] -> TV[NUM=?n, SEM=?v] NP
+    VP[NUM=?n, SEM=?v] -> VP[NUM=?n, SEM=?v] PP
+    VP[NUM=?n, SEM=?v] -> IV[NUM=?n, SEM=?v]
+    PP[AGR=[N=?m]] -> P NP[NUM=?m]
+    Det[NUM=sg] -> 'a' | 'every'
+    Det[NUM=pl] -> 'all'
+    Det -> 'the'
+    N[NUM=sg, SEM=<\x.dog(x)>] -> 'dog'
+    N[NUM=pl, SEM=<\x.dog(x)>] -> 'dogs'
+    N[NUM=sg, SEM=<\x.park(x)>] -> 'park'
+    PropN[NUM=sg, SEM=<kim>] -> 'Kim'
+    TV[NUM=sg, SEM=<\y x.see(x,y)>] -> 'sees'
+    TV[NUM=pl, SEM=<\y x.see(x,y)>] -> 'see'
+    IV[NUM=sg, SEM=<\x.walk(x)>] -> 'walks'
+    IV[NUM=pl, SEM=<\x.walk(x)>] -> 'walk'
+    P -> 'in' | 'with'
+    """
+)
+
+SLASH_GRAMMAR = FeatureGrammar.fromstring(
+    """
+    % start S
+    S[-INV] -> NP VP
+    S[-INV]/?x -> NP VP/?x
+    S[-INV] -> NP S/NP
+    S[+INV]/?x -> V[+AUX] NP VP/?x
+    SBar -> Comp S[-INV]
+    SBar/?x -> Comp S[-INV]/?x
+    VP -> V[SUBCAT=trans, -AUX] NP
+    VP/?x -> V[SUBCAT=trans, -AUX] NP/?x
+    VP -> V[SUBCAT=clause, -AUX] SBar
+    VP/?x -> V[SUBCAT=clause, -AUX] SBar/?x
+    V[SUBCAT=trans, -AUX] -> 'see' | 'like'
+    V[SUBCAT=clause, -AUX] -> 'say' | 'claim'
+    V[+AUX] -> 'do' | 'can'
+    NP[-WH] -> 'you' | 'cats'
+    NP[+WH] -> 'who'
+    NP/NP ->
+    Comp -> 'that'
+    """
+)
+
+PARSERS = [
+    FeatureChartParser,
+    FeatureTopDownChartParser,
+    FeatureBottomUpChartParser,
+    FeatureBottomUpLeftCornerChartParser,
+    FeatureEarleyChartParser,
+]
+
+SENTENCES = [
+    (GRAMMAR, "Kim sees the dog in a park with all dogs", 5),
+    (GRAMMAR, "all dogs walk in the park", 1),
+    (GRAMMAR, "all dogs walks", 0),
+    (SLASH_GRAMMAR, "who do you claim that you like", 1),
+    (GRAMMAR, "every dog sees Kim", 1),
+    (SLASH_GRAMMAR, "you say that cats like you", 1),
+]
+
+
+def parse(parser, grammar, sent):
+    return sorted(str(tree) for tree in parser(grammar).parse(sent.split()))
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_memoized_unification(parser, monkeypatch):
+    # Parse the sentences in turn, so that the rules reuse their
+    # unifications across sentences and switch between grammars.
+    trees = [parse(parser, grammar, sent) for grammar, sent, _ in SENTENCES]
+    assert [len(t) for t in trees] == [n for _, _, n in SENTENCES]
+    # Without any reuse, every unification is redone.
+    monkeypatch.setattr(featurechart, "_MEMO_SIZE", -1)
+    assert trees == [parse(parser, grammar, sent) for grammar, sent, _ in SENTENCES]
+
+
+def test_instantiate_vars_chart():
+    grammar = FeatureGrammar.fromstring(
+        r"""
+        % start S
+        S[SEM=<?vp(?subj)>] -> NP[SEM=?subj] VP[SEM=?vp]
+        NP[SEM=<@x>] -> 'Kim'
+        VP[SEM=<\x.walk(x)>] -> 'walks'
+        """
+    )
+    cp = FeatureChartParser(grammar, chart_class=InstantiateVarsChart)
+    first = list(cp.parse(["Kim", "walks"]))
+    second = list(cp.parse(["Kim", "walks"]))
+    assert len(first) == len(second) == 1
+    # Each parse instantiates '@x' with a fresh variable.
+    assert first[0][0].label()["SEM"] != second[0][0].label()["SEM"]
+
+
+def test_memo_is_bounded(monkeypatch):
+    monkeypatch.setattr(featurechart, "_MEMO_SIZE", 5)
+    cp = FeatureChartParser(GRAMMAR)
+    for _, sent, _ in SENTENCES[:3]:
+        list(cp.parse(sent.split()))
+    for rule in cp._strategy:
+        assert len(getattr(rule, "_memo", ())) <= 6
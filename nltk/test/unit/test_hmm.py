@@ -78,5 +78,46 @@ def test_backward_probability():
     assert_array_almost_equal(wikipedia_results, bp, 4)
 
 
+def test_tag_sents():
+    model, states, symbols = hmm._market_hmm_example()
+    sequences = [
+        ["up", "up"],
+        ["up", "down", "up"],
+        [],
+        ["down"] * 5,
+        ["unchanged"] * 5 + ["up"],
+    ]
+    tagged = model.tag_sents(sequences)
+    for sequence, tags in zip(sequences, tagged):
+        if sequence:
+            assert tags == model.tag(sequence)
+            path = model.best_path_simple(sequence)
+            assert tags == list(zip(sequence, path))
+    assert tagged[2] == []
+
+
+def test_train_unsupervised_processes():
+    import io
+    from contextlib import redirect_stdout
+
+    from numpy.testing import assert_array_almost_equal
+
+    model, states, symbols, seq = _wikipedia_example_hmm()
+    sequences = [seq, seq[:3], seq[2:]] * 4
+    trained = []
+    for processes in [1, 2]:
+        model = _wikipedia_example_hmm()[0]
+        trainer = hmm.HiddenMarkovModelTrainer(states, symbols)
+        with redirect_stdout(io.StringIO()):
+            model = trainer.train_unsupervised(
+                sequences, model=model, max_iterations=3, processes=processes
+            )
+        trained.append(
+            [[model._transitions[s].logprob(t) for t in states] for s in states]
+            + [[model._outputs[s].logprob(o) for o in symbols] for s in states]
+        )
+    assert_array_almost_equal(trained[0], trained[1])
+
+
 def setup_module(module):
     pytest.importorskip("numpy")
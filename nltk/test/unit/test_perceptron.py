@@ -0,0 +1,224 @@
+import json
+import random
+
+import pytest
+
+import nltk.data
+from nltk.tag import perceptron
+from nltk.tag.perceptron import (
+    AveragedPerceptron,
+    CompiledAveragedPerceptron,
+    PerceptronTagger,
+)
+
+np = pytest.importorskip("numpy")
+
+TAGS = ["DT", "JJ", "NN", "NNS", "VBZ", "IN", "PRP", "RB"]
+
+
+def _training_sents(n=200, seed=0):
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(60)] + ["1984", "42", "well-known", ""]
+    return [
+        [(rng.choice(words), rng.choice(TAGS)) for _ in range(rng.randint(1, 12))]
+        for _ in range(n)
+    ]
+
+
+@pytest.fixture(scope="module")
+def taggers():
+    random.seed(0)
+    tagger = PerceptronTagger(load=False)
+    tagger.train(_training_sents(), nr_iter=3)
+    compiled = PerceptronTagger(load=False)
+    compiled.model.weights = tagger.model.weights
+    compiled.tagdict = tagger.tagdict
+    compiled.classes = tagger.classes
+    return tagger, compiled.compile()
+
+
+def test_compile_returns_tagger(taggers):
+    _, compiled = taggers
+    assert isinstance(compiled.model, CompiledAveragedPerceptron)
+    assert compiled.compile() is compiled
+
+
+def test_compiled_tag_matches(taggers):
+    tagger, compiled = taggers
+    sents = [[word for word, _ in sent] for sent in _training_sents(seed=1)]
+    sents += [["unseen", "words", "w3"], []]
+    for sent in sents:
+        assert compiled.tag(sent) == tagger.tag(sent)
+        assert compiled.tag(sent, use_tagdict=False) == tagger.tag(
+            sent, use_tagdict=False
+        )
+        with_conf = compiled.tag(sent, return_conf=True)
+        expected = tagger.tag(sent, return_conf=True)
+        assert [tag for _, tag, _ in with_conf] == [tag for _, tag, _ in expected]
+        assert [conf for _, _, conf in with_conf] == pytest.approx(
+            [conf for _, _, conf in expected]
+        )
+    assert compiled.tag_sents(sents, chunksize=7) == tagger.tag_sents(sents)
+
+
+def test_compiled_predict_matches(taggers):
+    tagger, compiled = taggers
+    features = {"bias": 1, "i word w1": 2, "i-1 tag NN": 1, "unknown": 1, "x": 0}
+    assert compiled.model.predict(features) == tagger.model.predict(features)
+    label, conf = compiled.model.predict(features, return_conf=True)
+    expected_label, expected_conf = tagger.model.predict(features, return_conf=True)
+    assert label == expected_label
+    assert conf == pytest.approx(expected_conf)
+
+
+def test_compiled_conf_class_without_weights():
+    model = AveragedPerceptron({"bias": {"A": 1.0}, "x": {"C": -1.0}})
+    model.classes = {"A", "B", "C"}
+    compiled = model.compile()
+    for features in ({"bias": 1}, {"bias": 1, "x": 1}, {"y": 1}):
+        label, conf = compiled.predict(features, return_conf=True)
+        expected_label, expected_conf = model.predict(features, return_conf=True)
+        assert label == expected_label
+        assert conf == pytest.approx(expected_conf)
+
+
+def test_compiled_requires_numpy(monkeypatch):
+    model = AveragedPerceptron({"bias": {"A": 1.0}})
+    model.classes = {"A"}
+    monkeypatch.setattr(perceptron, "np", None)
+    with pytest.raises(ImportError):
+        model.compile()
+
+
+def test_compiled_ties():
+    tagger = PerceptronTagger(load=False)
+    tagger.classes = {"A", "B", "C"}
+    tagger.model.classes = tagger.classes
+    tagger.model.weights = {
+        "bias": {"A": 0.1, "B": 0.3},
+        "i word x": {"A": 0.2},
+        "i-1 tag -START-": {"C": 0.3},
+    }
+    expected = tagger.tag_sents([["x"], ["y"], ["x", "x"]])
+    compiled = tagger.compile()
+    assert compiled.tag_sents([["x"], ["y"], ["x", "x"]]) == expected
+    assert [compiled.tag(sent) for sent in (["x"], ["y"], ["x", "x"])] == expected
+    assert compiled.model.best_labels(np.array([[1.0, 2.0, 2.0], [3.0, 0, 0]])) == [
+        None,
+        "A",
+    ]
+
+
+def test_compiled_weights(taggers):
+    tagger, compiled = taggers
+    weights = {
+        feat: {label: weight for label, weight in labels.items() if weight}
+        for feat, labels in tagger.model.weights.items()
+    }
+    assert compiled.model.weights == weights
+
+
+def test_tag_sents_processes(taggers):
+    tagger, compiled = taggers
+    sents = [[word for word, _ in sent] for sent in _training_sents(seed=2)]
+    expected = tagger.tag_sents(sents)
+    assert tagger.tag_sents(iter(sents), processes=2, chunksize=30) == expected
+    assert compiled.tag_sents(sents, processes=2, chunksize=30) == expected
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_save_load(taggers, tmp_path, use_mmap):
+    tagger, compiled = taggers
+    sents = [[word for word, _ in sent] for sent in _training_sents(seed=3)]
+    path = str(tmp_path / "tagger.bin")
+    tagger.save(path)
+    loaded = PerceptronTagger.load(path, use_mmap=use_mmap)
+    assert isinstance(loaded.model, CompiledAveragedPerceptron)
+    assert loaded.tagdict == tagger.tagdict
+    assert loaded.classes == tagger.classes
+    assert loaded.tag_sents(sents) == tagger.tag_sents(sents)
+    compiled.save(path)
+    assert PerceptronTagger.load(path, use_mmap=use_mmap).tag_sents(sents) == (
+        tagger.tag_sents(sents)
+    )
+
+
+def test_load_invalid_file(tmp_path):
+    path = tmp_path / "tagger.bin"
+    path.write_bytes(b"not a tagger" * 10)
+    with pytest.raises(ValueError):
+        PerceptronTagger.load(str(path))
+
+
+def test_train_copies_shared_model(taggers):
+    tagger, _ = taggers
+    weights, tagdict, classes = (
+        tagger.model.weights,
+        tagger.tagdict,
+        tagger.classes,
+    )
+    retrained = PerceptronTagger(load=False)
+    retrained.model.weights, retrained.tagdict, retrained.classes = (
+        weights,
+        tagdict,
+        classes,
+    )
+    before = (
+        {feat: dict(labels) for feat, labels in weights.items()},
+        dict(tagdict),
+        set(classes),
+    )
+    retrained.train([[("w1", "XX"), ("zz", "XX")]] * 5, nr_iter=1)
+    assert (weights, tagdict, classes) == before
+    assert "XX" in retrained.classes
+
+
+@pytest.fixture
+def pretrained(taggers, tmp_path, monkeypatch):
+    # Install the trained tagger as the pretrained English model.
+    tagger, _ = taggers
+    loc = tmp_path / "taggers" / "averaged_perceptron_tagger_eng"
+    loc.mkdir(parents=True)
+    files = perceptron.TAGGER_JSONS["eng"]
+    (loc / files["weights"]).write_text(json.dumps(tagger.model.weights))
+    (loc / files["tagdict"]).write_text(json.dumps(tagger.tagdict))
+    (loc / files["classes"]).write_text(json.dumps(sorted(tagger.classes)))
+    monkeypatch.setattr(nltk.data, "path", [str(tmp_path)])
+    perceptron._load_pretrained.cache_clear()
+    yield tagger, loc
+    perceptron._load_pretrained.cache_clear()
+
+
+def test_pretrained_model_is_read_only(pretrained):
+    tagger = PerceptronTagger()
+    with pytest.raises(TypeError):
+        tagger.tagdict["w1"] = "XX"
+    with pytest.raises(TypeError):
+        tagger.model.weights["bias"]["XX"] = 1.0
+    with pytest.raises(AttributeError):
+        tagger.classes.add("XX")
+    assert PerceptronTagger().tagdict is tagger.tagdict
+
+
+def test_load_pretrained(pretrained):
+    tagger, loc = pretrained
+    sents = [[w for w, _ in sent] for sent in _training_sents(20, seed=1)]
+    expected = tagger.tag_sents(sents)
+    # Nothing is written until the binary copy is saved explicitly.
+    with pytest.raises(LookupError):
+        PerceptronTagger.load_pretrained()
+    assert not list(loc.glob("*.bin"))
+    path = PerceptronTagger.save_pretrained()
+    (copy,) = loc.glob("*.bin")
+    assert str(copy) == path
+    assert (
+        copy.stat().st_size
+        < (loc / perceptron.TAGGER_JSONS["eng"]["weights"]).stat().st_size
+    )
+    with pytest.MonkeyPatch.context() as m:
+        # The JSON files are not read again.
+        m.setattr(perceptron, "_load_pretrained", None)
+        loaded = PerceptronTagger.load_pretrained()
+    assert isinstance(loaded.model, CompiledAveragedPerceptron)
+    assert loaded.tag_sents(sents) == expected
+    assert loaded.model.weights == tagger.model.weights
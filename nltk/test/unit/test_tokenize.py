@@ -3,12 +3,15 @@ Unit tests for nltk.tokenize.
 See also nltk/test/tokenize.doctest
 """
 
+from itertools import count, islice
 from typing import List, Tuple
 
 import pytest
 
+from nltk.corpus import treebank_raw
 from nltk.tokenize import (
     LegalitySyllableTokenizer,
+    NLTKWordTokenizer,
     StanfordSegmenter,
     SyllableTokenizer,
     TreebankWordTokenizer,
@@ -16,6 +19,7 @@ from nltk.tokenize import (
     punkt,
     sent_tokenize,
     word_tokenize,
+    word_tokenize_many,
 )
 from nltk.tokenize.simple import CharTokenizer
 
@@ -715,6 +719,43 @@ class TestTokenize:
         result = list(tokenizer.span_tokenize(test3))
         assert result == expected
 
+    @pytest.mark.parametrize(
+        "tokenizer", [NLTKWordTokenizer(), TreebankWordTokenizer()]
+    )
+    def test_word_tokenizer_rule_skipping(self, tokenizer):
+        """
+        Test that skipping the regexes that cannot match gives the same tokens
+        as applying every regex in turn, over the lines of the treebank corpus.
+        """
+
+        def apply_every_rule(text, convert_parentheses):
+            rules = tokenizer.STARTING_QUOTES + tokenizer.PUNCTUATION
+            rules = rules + [tokenizer.PARENS_BRACKETS]
+            if convert_parentheses:
+                rules = rules + tokenizer.CONVERT_PARENTHESES
+            rules = rules + [tokenizer.DOUBLE_DASHES]
+            for regexp, substitution in rules:
+                text = regexp.sub(substitution, text)
+            text = " " + text + " "
+            for regexp, substitution in tokenizer.ENDING_QUOTES:
+                text = regexp.sub(substitution, text)
+            for regexp in tokenizer.CONTRACTIONS2 + tokenizer.CONTRACTIONS3:
+                text = regexp.sub(r" \1 \2 ", text)
+            return text.split()
+
+        lines = treebank_raw.raw().splitlines()
+        lines += [
+            "\"Cannot,\" he said, \"gimme  'Tis (more'n) that...'' --",
+            "Wanna go?\tI'll\n",
+            "End with a comma,\n",
+            "\u201cQuoted.\u201d  ",
+        ]
+        for line in lines:
+            for convert_parentheses in (False, True):
+                assert tokenizer.tokenize(line, convert_parentheses) == (
+                    apply_every_rule(line, convert_parentheses)
+                )
+
     def test_word_tokenize(self):
         """
         Test word_tokenize function
@@ -843,6 +884,51 @@ class TestTokenize:
         # The sentence should be split into two sections,
         # with one split and hence one decision.
 
+    def test_punkt_reused_decisions(self):
+        params = punkt.PunktParameters()
+        params.abbrev_types = {"mr", "dr"}
+        params.sent_starters = {"he"}
+        params.collocations = {("##number##", "he")}
+        tokenizer = punkt.PunktSentenceTokenizer(params)
+        text = (
+            "Mr. Smith met Dr. Who. He left! 3. He said no... "
+            "(Really.) Yes?! J. Bach. x.) done.\n\nNew para. " * 20
+        )
+        # Annotate every context anew for reference.
+        reference = punkt.PunktSentenceTokenizer(params)
+        reference._context_contains_sentbreak = (
+            lambda context, decisions: reference.text_contains_sentbreak(context)
+        )
+        assert list(tokenizer.span_tokenize(text)) == list(
+            reference.span_tokenize(text)
+        )
+        tokenizer._MAX_CACHED_DECISIONS = 2
+        assert tokenizer.tokenize(text) == reference.tokenize(text)
+
+    def test_punkt_overridden_sentbreak_detection(self):
+        class NoBreaksTokenizer(punkt.PunktSentenceTokenizer):
+            def text_contains_sentbreak(self, text):
+                return False
+
+        class NoAnnotationTokenizer(punkt.PunktSentenceTokenizer):
+            def _annotate_tokens(self, tokens):
+                for tok in tokens:
+                    tok.sentbreak = False
+                    yield tok
+
+        text = "One sentence. Another one. And a third."
+        assert len(punkt.PunktSentenceTokenizer().tokenize(text)) == 3
+        assert NoBreaksTokenizer().tokenize(text) == [text]
+        assert NoAnnotationTokenizer().tokenize(text) == [text]
+
+    def test_punkt_last_whitespace_index(self):
+        tokenizer = punkt.PunktSentenceTokenizer()
+        assert tokenizer._get_last_whitespace_index("a b\tc") == 3
+        assert tokenizer._get_last_whitespace_index("abc") == 0
+        assert tokenizer._get_last_whitespace_index(" abc") == 0
+        assert tokenizer._get_last_whitespace_index("a b c d", 1, 4) == 2
+        assert tokenizer._get_last_whitespace_index("a b c d", 2, 3) == 0
+
     @pytest.mark.parametrize(
         "sentences, expected",
         [
@@ -872,6 +958,22 @@ class TestTokenize:
     def test_sent_tokenize(self, sentences: str, expected: List[str]):
         assert sent_tokenize(sentences) == expected
 
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_tokenize_many(self, processes):
+        tokenizer = TreebankWordTokenizer()
+        texts = [f"Text {i} isn't (really) long, is it?" for i in range(50)]
+        expected = [tokenizer.tokenize(text) for text in texts]
+        tokenized = tokenizer.tokenize_many(iter(texts), processes, chunksize=7)
+        assert list(tokenized) == expected
+        tokenized = word_tokenize_many(texts, preserve_line=True, processes=processes)
+        assert list(tokenized) == expected
+
+        # Documents are read lazily from the stream.
+        texts = (f"Text {i}." for i in count())
+        tokenized = tokenizer.tokenize_many(texts, processes, chunksize=3)
+        assert list(islice(tokenized, 10))[-1] == ["Text", "9", "."]
+        tokenized.close()
+
     def test_string_tokenizer(self) -> None:
         sentence = "Hello there"
         tokenizer = CharTokenizer()
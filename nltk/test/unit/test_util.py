@@ -1,6 +1,9 @@
+import threading
+import warnings
+
 import pytest
 
-from nltk.util import everygrams
+from nltk.util import _fork_context, everygrams, parallel_imap, parallelize_preprocess
 
 
 @pytest.fixture
@@ -80,3 +83,32 @@ def test_everygrams_pad_left(everygram_input):
     ]
     output = list(everygrams(everygram_input, max_len=3, pad_left=True))
     assert output == expected_output
+
+
+@pytest.mark.parametrize("processes", [0, 1, 2])
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+def test_parallel_imap(processes, chunksize):
+    items = (str(i) for i in range(50))
+    output = parallel_imap(len, items, processes=processes, chunksize=chunksize)
+    assert list(output) == [len(str(i)) for i in range(50)]
+
+
+def test_parallel_imap_threaded_parent():
+    # Workers are not forked while other threads run.
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        assert _fork_context() is None
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            assert list(parallel_imap(len, ["a", "bb"], processes=2)) == [1, 2]
+    finally:
+        stop.set()
+        thread.join()
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_parallelize_preprocess(processes):
+    output = parallelize_preprocess(len, ["a", "bb", "ccc"], processes)
+    assert list(output) == [1, 2, 3]
@@ -3,10 +3,16 @@ Unit tests for nltk.corpus.wordnet
 See also nltk/test/wordnet.doctest
 """
 
+import os
+import tempfile
 import unittest
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 from nltk.corpus import wordnet as wn
 from nltk.corpus import wordnet_ic as wnic
+from nltk.corpus.reader.wordnet import WordNetCorpusReader
 
 wn.ensure_loaded()
 S = wn.synset
@@ -220,6 +226,164 @@ class WordnNetDemo(unittest.TestCase):
             S("dog.n.01").lin_similarity(S("cat.n.01"), semcor_ic), 0.8863, places=3
         )
 
+    def test_similarity_matrix(self):
+        synsets = [S("dog.n.01"), S("cat.n.01"), S("car.n.01"), S("fireman.n.01")]
+        for metric in ("path", "lch", "wup"):
+            expected = [
+                [getattr(s1, f"{metric}_similarity")(s2) for s2 in synsets]
+                for s1 in synsets
+            ]
+            self.assertEqual(wn.similarity_matrix(synsets, metric), expected)
+        expected = [[s1.wup_similarity(s2) for s2 in synsets[:2]] for s1 in synsets]
+        self.assertEqual(
+            wn.similarity_matrix(synsets, "wup", others=synsets[:2], processes=2),
+            expected,
+        )
+        self.assertEqual(
+            wn.similarity_matrix(synsets, "wup", others=synsets[:2], processes=0),
+            expected,
+        )
+        brown_ic = wnic.ic("ic-brown.dat")
+        self.assertEqual(
+            wn.similarity_matrix(synsets, "res", ic=brown_ic),
+            [[s1.res_similarity(s2, brown_ic) for s2 in synsets] for s1 in synsets],
+        )
+        for metric in ("jcn", "lin"):
+            self.assertEqual(
+                wn.similarity_matrix(synsets, metric, ic=brown_ic),
+                [
+                    [
+                        getattr(s1, f"{metric}_similarity")(s2, brown_ic)
+                        for s2 in synsets
+                    ]
+                    for s1 in synsets
+                ],
+            )
+        self.assertRaises(ValueError, wn.similarity_matrix, synsets, "nope")
+
+    def test_hypernym_graph(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        graph = wn.hypernym_graph("n")
+        self.assertIs(wn.hypernym_graph("n"), graph)
+        for synset in (S("dog.n.01"), S("entity.n.01"), S("fireman.n.01")):
+            node = graph.node(synset)
+            self.assertEqual(graph.synset(node), synset)
+            self.assertEqual(graph.max_depth[node], synset.max_depth())
+            self.assertEqual(graph.min_depth[node], synset.min_depth())
+            ancestors = {graph.synset(n) for n in graph.ancestors(node)}
+            hypernyms = lambda s: s.hypernyms() + s.instance_hypernyms()
+            self.assertEqual(ancestors, set(synset.closure(hypernyms)) | {synset})
+
+    def test_ic_from_hypernym_graph(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy is not installed")
+
+        class Corpus:
+            def words(self):
+                return (
+                    "The dog saw a cat and two dogs near the car of a fireman".split()
+                )
+
+        graph_ic = wn.ic(Corpus())
+        with mock.patch("nltk.corpus.reader.wordnet.np", None):
+            synset_ic = wn.ic(Corpus())
+        self.assertEqual(graph_ic.keys(), synset_ic.keys())
+        for pos in graph_ic:
+            self.assertEqual(dict(graph_ic[pos]), dict(synset_ic[pos]))
+        synsets = [S("dog.n.01"), S("cat.n.01"), S("car.n.01"), S("fireman.n.01")]
+        for metric in ("res", "jcn", "lin"):
+            self.assertEqual(
+                wn.similarity_matrix(synsets, metric, ic=graph_ic),
+                [
+                    [
+                        getattr(s1, f"{metric}_similarity")(s2, synset_ic)
+                        for s2 in synsets
+                    ]
+                    for s1 in synsets
+                ],
+            )
+
+    def test_similarity_cache(self):
+        dog, cat = S("dog.n.01"), S("cat.n.01")
+        expected = (
+            dog.wup_similarity(cat),
+            dog.lowest_common_hypernyms(cat),
+            dog.hypernym_paths(),
+        )
+        try:
+            wn.set_similarity_cache_size(3)
+            wn.clear_similarity_cache()
+            self.assertEqual(dog.wup_similarity(cat), expected[0])
+            self.assertEqual(dog.lowest_common_hypernyms(cat), expected[1])
+            self.assertEqual(dog.hypernym_paths(), expected[2])
+            self.assertEqual(len(wn._similarity_cache), 3)
+            # Returned lists are copies of the cached values.
+            dog.hypernym_paths()[0].append(cat)
+            self.assertEqual(dog.hypernym_paths(), expected[2])
+            wn.set_similarity_cache_size(0)
+            self.assertEqual(len(wn._similarity_cache), 0)
+            self.assertEqual(dog.wup_similarity(cat), expected[0])
+        finally:
+            wn.set_similarity_cache_size(wn.SIMILARITY_CACHE_SIZE)
+
+    def test_concurrent_lookups(self):
+        names = sorted(wn.all_lemma_names())[::50]
+        expected = {
+            name: [(s, s.definition(), s.hypernyms()) for s in wn.synsets(name)]
+            for name in names
+        }
+        # A fresh reader, so that the threads race to load the synsets.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            reader = WordNetCorpusReader(wn.root, None)
+
+        def lookup(name):
+            synsets = reader.synsets(name)
+            for synset in synsets:
+                self.assertIs(reader.synset(synset.name()), synset)
+            return name, [(s, s.definition(), s.hypernyms()) for s in synsets]
+
+        with ThreadPoolExecutor(8) as executor:
+            for name, found in executor.map(lookup, names * 4):
+                self.assertEqual(found, expected[name])
+
+    def test_index_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir, warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            built = WordNetCorpusReader(wn.root, None, index_cache=cache_dir)
+            self.assertTrue(os.path.isfile(os.path.join(cache_dir, "nltk-index.cache")))
+            cached = WordNetCorpusReader(wn.root, None, index_cache=cache_dir)
+            for reader in built, cached:
+                self.assertEqual(reader._lexnames, wn._lexnames)
+                self.assertEqual(reader._exception_map, wn._exception_map)
+                self.assertEqual(reader._lemma_pos_offset_map, wn._lemma_pos_offset_map)
+            self.assertEqual(cached.synsets("geese"), wn.synsets("geese"))
+
+            # An unreadable cache is rebuilt.
+            with open(os.path.join(cache_dir, "nltk-index.cache"), "wb") as fp:
+                fp.write(b"garbage")
+            rebuilt = WordNetCorpusReader(wn.root, None, index_cache=cache_dir)
+            self.assertEqual(rebuilt._lemma_pos_offset_map, wn._lemma_pos_offset_map)
+            self.assertIsNotNone(
+                rebuilt._read_index_cache("index", rebuilt._INDEX_FILES)
+            )
+
+    def test_index_cache_setting(self):
+        with tempfile.TemporaryDirectory() as cache_dir, warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cache_file = os.path.join(cache_dir, "nltk-index.cache")
+            with mock.patch.object(WordNetCorpusReader, "INDEX_CACHE", cache_dir):
+                WordNetCorpusReader(wn.root, None, index_cache=False)
+                self.assertFalse(os.path.exists(cache_file))
+                reader = WordNetCorpusReader(wn.root, None)
+            self.assertTrue(os.path.isfile(cache_file))
+            self.assertEqual(reader.synsets("geese"), wn.synsets("geese"))
+
     def test_omw_lemma_no_trailing_underscore(self):
         expected = sorted(
             [
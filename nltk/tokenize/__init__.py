@@ -91,6 +91,7 @@ from nltk.tokenize.texttiling import TextTilingTokenizer
 from nltk.tokenize.toktok import ToktokTokenizer
 from nltk.tokenize.treebank import TreebankWordDetokenizer, TreebankWordTokenizer
 from nltk.tokenize.util import regexp_span_tokenize, string_span_tokenize
+from nltk.util import parallel_imap
 
 
 @functools.lru_cache
@@ -120,6 +121,24 @@ def sent_tokenize(text, language="english"):
     return tokenizer.tokenize(text)
 
 
+def sent_tokenize_many(texts, language="english", processes=1, chunksize=100):
+    """
+    Lazily yield a sentence-tokenized copy of each text in *texts*, in
+    order, as :func:`sent_tokenize` does.
+
+    With more than one process, chunks of texts are tokenized in worker
+    processes, see :meth:`.TokenizerI.tokenize_many`.  The Punkt model is
+    loaded before the workers start, so they can share it.
+
+    :param texts: an iterable of texts, such as a stream of documents
+    :param language: the model name in the Punkt corpus
+    :param processes: number of worker processes used for tokenizing
+    :param chunksize: number of texts sent to a worker at once
+    """
+    tokenizer = _get_punkt_tokenizer(language)
+    return parallel_imap(tokenizer.tokenize, texts, processes, chunksize)
+
+
 # Standard word tokenizer.
 _treebank_word_tokenizer = NLTKWordTokenizer()
 
@@ -143,3 +162,30 @@ def word_tokenize(text, language="english", preserve_line=False):
     return [
         token for sent in sentences for token in _treebank_word_tokenizer.tokenize(sent)
     ]
+
+
+def word_tokenize_many(
+    texts, language="english", preserve_line=False, processes=1, chunksize=100
+):
+    """
+    Lazily yield a tokenized copy of each text in *texts*, in order, as
+    :func:`word_tokenize` does.
+
+    With more than one process, chunks of texts are tokenized in worker
+    processes, see :meth:`.TokenizerI.tokenize_many`.  The Punkt model is
+    loaded before the workers start, so they can share it.
+
+    :param texts: an iterable of texts, such as a stream of documents
+    :param language: the model name in the Punkt corpus
+    :type language: str
+    :param preserve_line: A flag to decide whether to sentence tokenize the texts or not.
+    :type preserve_line: bool
+    :param processes: number of worker processes used for tokenizing
+    :param chunksize: number of texts sent to a worker at once
+    """
+    if not preserve_line:
+        _get_punkt_tokenizer(language)
+    function = functools.partial(
+        word_tokenize, language=language, preserve_line=preserve_line
+    )
+    return parallel_imap(function, texts, processes, chunksize)
@@ -11,10 +11,11 @@ Tokenizer Interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Iterator, List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 from nltk.internals import overridden
 from nltk.tokenize.util import string_span_tokenize
+from nltk.util import parallel_imap
 
 
 class TokenizerI(ABC):
@@ -65,6 +66,23 @@ class TokenizerI(ABC):
         for s in strings:
             yield list(self.span_tokenize(s))
 
+    def tokenize_many(
+        self, strings: Iterable[str], processes: int = 1, chunksize: int = 100
+    ) -> Iterator[List[str]]:
+        """
+        Apply ``self.tokenize()`` to each element of ``strings``, lazily
+        and in order.
+
+        With more than one process, chunks of ``chunksize`` strings are
+        tokenized in worker processes, see :func:`nltk.util.parallel_imap`.
+
+        :param strings: an iterable of strings, such as a stream of documents
+        :param processes: number of worker processes used for tokenizing
+        :param chunksize: number of strings sent to a worker at once
+        :yield: List[str]
+        """
+        return parallel_imap(self.tokenize, strings, processes, chunksize)
+
 
 class StringTokenizer(TokenizerI):
     """A tokenizer that divides a string into substrings by splitting
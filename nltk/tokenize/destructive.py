@@ -9,7 +9,8 @@
 
 import re
 import warnings
-from typing import Iterator, List, Tuple
+from itertools import repeat
+from typing import Callable, Dict, Iterable, Iterator, List, Pattern, Tuple
 
 from nltk.tokenize.api import TokenizerI
 from nltk.tokenize.util import align_tokens
@@ -34,6 +35,149 @@ class MacIntyreContractions:
     CONTRACTIONS4 = [r"(?i)\b(whad)(dd)(ya)\b", r"(?i)\b(wha)(t)(cha)\b"]
 
 
+def _contains_any(*needles: str) -> Callable[[str], int]:
+    """
+    Return a rule start for rules whose matches contain one of ``needles``.
+    """
+
+    def start(text: str) -> int:
+        for needle in needles:
+            if needle in text:
+                return 0
+        return -1
+
+    return start
+
+
+def _ends_with_any(*suffixes: str) -> Callable[[str], int]:
+    """
+    Return a rule start for rules that match one of ``suffixes`` in front of
+    ``$``, which also matches in front of a final newline.
+    """
+
+    def start(text: str) -> int:
+        stripped = text[:-1] if text.endswith("\n") else text
+        if stripped.endswith(suffixes):
+            return len(stripped) - 1
+        return -1
+
+    return start
+
+
+def _ends_with_period(closers: str) -> Callable[[str], int]:
+    """
+    Return a rule start for the final period rules, which match a period that
+    is preceded by a character other than a period, and followed only by
+    ``closers`` and whitespace.
+    """
+
+    def start(text: str) -> int:
+        stripped = text.rstrip().rstrip(closers)
+        if stripped.endswith("."):
+            # Every character after this period is in ``closers`` or is
+            # whitespace, so the period of a match can not lie further left.
+            return max(len(stripped) - 2, 0)
+        return -1
+
+    return start
+
+
+def _contains_word(word: str) -> Callable[[str], int]:
+    """
+    Return a rule start for a case-insensitive contraction rule matching
+    ``word``.
+    """
+    # Besides the case variants of ASCII letters, the (?i) flag lets "i" match
+    # U+0130 and U+0131, and "s" match U+017F.
+    unusual = ("\u0130", "\u0131", "\u017f")
+
+    def start(text: str) -> int:
+        if word in text.lower():
+            return 0
+        if not text.isascii() and any(char in text for char in unusual):
+            return 0
+        return -1
+
+    return start
+
+
+# Maps the regexes of the word tokenizers to a function that cheaply finds the
+# index in a text where the first match of the regex can start, or returns -1
+# if the regex cannot match at all, e.g. because the text lacks a character
+# that every match contains.  Most rules only apply to a few sentences, so
+# testing for them with ``str`` methods is many times faster than letting the
+# regex engine scan the text for a match.  The text before the returned index
+# is not scanned, so it may only be positive for regexes that do not look
+# behind their match.  Rules missing from this table, e.g. those added by
+# subclasses, are always applied to the full text.
+_RULE_STARTS: Dict[Pattern, Callable[[str], int]] = {
+    re.compile(pattern): start
+    for pattern, start in [
+        # Starting quotes.
+        ("([«“‘„]|[`]+)", _contains_any("«", "“", "‘", "„", "`")),
+        (r"^\"", lambda text: 0 if text.startswith('"') else -1),
+        (r"(``)", _contains_any("``")),
+        (r"([ \(\[{<])(\"|\'{2})", _contains_any('"', "''")),
+        (r"(?i)(\')(?!re|ve|ll|m|t|s|d|n)(\w)\b", _contains_any("'")),
+        # Punctuation.
+        (
+            r'([^\.])(\.)([\]\)}>"\'' "»”’ " r"]*)\s*$",
+            _ends_with_period("])}>\"'»”’ "),
+        ),
+        (r"([:,])([^\d])", _contains_any(":", ",")),
+        (r"([:,])$", _ends_with_any(":", ",")),
+        (r"\.{2,}", _contains_any("..")),
+        (r"\.\.\.", _contains_any("...")),
+        (r"[;@#$%&]", _contains_any(";", "@", "#", "$", "%", "&")),
+        (r'([^\.])(\.)([\]\)}>"\']*)\s*$', _ends_with_period("])}>\"'")),
+        (r"[?!]", _contains_any("?", "!")),
+        (r"([^'])' ", _contains_any("' ")),
+        (r"[*]", _contains_any("*")),
+        # Parentheses and brackets.
+        (r"[\]\[\(\)\{\}\<\>]", _contains_any(*"[](){}<>")),
+        (r"\(", _contains_any("(")),
+        (r"\)", _contains_any(")")),
+        (r"\[", _contains_any("[")),
+        (r"\]", _contains_any("]")),
+        (r"\{", _contains_any("{")),
+        (r"\}", _contains_any("}")),
+        (r"--", _contains_any("--")),
+        # Ending quotes.
+        ("([»”’])", _contains_any("»", "”", "’")),
+        (r"''", _contains_any("''")),
+        (r'"', _contains_any('"')),
+        (r"([^' ])('[sS]|'[mM]|'[dD]|') ", _contains_any("'")),
+        (r"([^' ])('ll|'LL|'re|'RE|'ve|'VE|n't|N'T) ", _contains_any("'")),
+        # Contractions.
+        (r"(?i)\b(can)(?#X)(not)\b", _contains_word("cannot")),
+        (r"(?i)\b(d)(?#X)('ye)\b", _contains_word("d'ye")),
+        (r"(?i)\b(gim)(?#X)(me)\b", _contains_word("gimme")),
+        (r"(?i)\b(gon)(?#X)(na)\b", _contains_word("gonna")),
+        (r"(?i)\b(got)(?#X)(ta)\b", _contains_word("gotta")),
+        (r"(?i)\b(lem)(?#X)(me)\b", _contains_word("lemme")),
+        (r"(?i)\b(more)(?#X)('n)\b", _contains_word("more'n")),
+        (r"(?i)\b(wan)(?#X)(na)(?=\s)", _contains_word("wanna")),
+        (r"(?i) ('t)(?#X)(is)\b", _contains_word(" 'tis")),
+        (r"(?i) ('t)(?#X)(was)\b", _contains_word(" 'twas")),
+    ]
+}
+
+
+def _apply_rules(rules: Iterable[Tuple[Pattern, str]], text: str) -> str:
+    """
+    Apply the ``(regexp, substitution)`` pairs in ``rules`` to ``text`` in
+    order, skipping the rules that ``_RULE_STARTS`` shows cannot match.
+    """
+    for regexp, substitution in rules:
+        find_start = _RULE_STARTS.get(regexp)
+        start = 0 if find_start is None else find_start(text)
+        if start == 0:
+            text = regexp.sub(substitution, text)
+        elif start > 0:
+            text = text[:start] + regexp.sub(substitution, text[start:])
+    return text
+
+
 class NLTKWordTokenizer(TokenizerI):
     """
     The NLTK tokenizer that has improved upon the TreebankWordTokenizer.
@@ -154,34 +298,25 @@ class NLTKWordTokenizer(TokenizerI):
                 stacklevel=2,
             )
 
-        for regexp, substitution in self.STARTING_QUOTES:
-            text = regexp.sub(substitution, text)
-
-        for regexp, substitution in self.PUNCTUATION:
-            text = regexp.sub(substitution, text)
+        text = _apply_rules(self.STARTING_QUOTES, text)
+        text = _apply_rules(self.PUNCTUATION, text)
 
         # Handles parentheses.
-        regexp, substitution = self.PARENS_BRACKETS
-        text = regexp.sub(substitution, text)
+        text = _apply_rules([self.PARENS_BRACKETS], text)
         # Optionally convert parentheses
         if convert_parentheses:
-            for regexp, substitution in self.CONVERT_PARENTHESES:
-                text = regexp.sub(substitution, text)
+            text = _apply_rules(self.CONVERT_PARENTHESES, text)
 
         # Handles double dash.
-        regexp, substitution = self.DOUBLE_DASHES
-        text = regexp.sub(substitution, text)
+        text = _apply_rules([self.DOUBLE_DASHES], text)
 
         # add extra space to make things easier
         text = " " + text + " "
 
-        for regexp, substitution in self.ENDING_QUOTES:
-            text = regexp.sub(substitution, text)
+        text = _apply_rules(self.ENDING_QUOTES, text)
 
-        for regexp in self.CONTRACTIONS2:
-            text = regexp.sub(r" \1 \2 ", text)
-        for regexp in self.CONTRACTIONS3:
-            text = regexp.sub(r" \1 \2 ", text)
+        text = _apply_rules(zip(self.CONTRACTIONS2, repeat(r" \1 \2 ")), text)
+        text = _apply_rules(zip(self.CONTRACTIONS3, repeat(r" \1 \2 ")), text)
 
         # We are not using CONTRACTIONS4 since
         # they are also commented out in the SED scripts
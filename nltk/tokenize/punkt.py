@@ -1339,16 +1339,26 @@ class PunktSentenceTokenizer(PunktBaseClass, TokenizerI):
         """
         return [text[s:e] for s, e in self.span_tokenize(text, realign_boundaries)]
 
-    def _get_last_whitespace_index(self, text: str) -> int:
+    _re_last_whitespace = re.compile(
+        r".*[%s]" % re.escape(string.whitespace), re.DOTALL
+    )
+    """Matches up to and including the last whitespace character."""
+
+    def _get_last_whitespace_index(
+        self, text: str, pos: int = 0, endpos: Optional[int] = None
+    ) -> int:
         """
         Given a text, find the index of the *last* occurrence of *any*
         whitespace character, i.e. " ", "\n", "\t", "\r", etc.
         If none is found, return 0.
+
+        If ``pos`` or ``endpos`` are given, only ``text[pos:endpos]`` is
+        searched, and the index is relative to ``pos``.
         """
-        for i in range(len(text) - 1, -1, -1):
-            if text[i] in string.whitespace:
-                return i
-        return 0
+        if endpos is None:
+            endpos = len(text)
+        match = self._re_last_whitespace.match(text, pos, endpos)
+        return match.end() - 1 - pos if match else 0
 
     def _match_potential_end_contexts(self, text: str) -> Iterator[Tuple[Match, str]]:
         """
@@ -1393,8 +1403,9 @@ class PunktSentenceTokenizer(PunktBaseClass, TokenizerI):
         previous_match = None
         for match in self._lang_vars.period_context_re().finditer(text):
             # Get the slice of the previous word
-            before_text = text[previous_slice.stop : match.start()]
-            index_after_last_space = self._get_last_whitespace_index(before_text)
+            index_after_last_space = self._get_last_whitespace_index(
+                text, previous_slice.stop, match.start()
+            )
             if index_after_last_space:
                 # + 1 to exclude the space itself
                 index_after_last_space += previous_slice.stop + 1
@@ -1426,8 +1437,20 @@ class PunktSentenceTokenizer(PunktBaseClass, TokenizerI):
 
     def _slices_from_text(self, text: str) -> Iterator[slice]:
         last_break = 0
+        decisions = {}
+        # The cached decisions skip the methods that subclasses may override
+        # to change how contexts are annotated, so they are only used when
+        # none of them is overridden.
+        cached = not any(
+            getattr(type(self), name) is not getattr(PunktSentenceTokenizer, name)
+            for name in self._ANNOTATION_METHODS
+        )
         for match, context in self._match_potential_end_contexts(text):
-            if self.text_contains_sentbreak(context):
+            if (
+                self._context_contains_sentbreak(context, decisions)
+                if cached
+                else self.text_contains_sentbreak(context)
+            ):
                 yield slice(last_break, match.end())
                 if match.group("next_tok"):
                     # next sentence starts after whitespace
@@ -1482,6 +1505,59 @@ class PunktSentenceTokenizer(PunktBaseClass, TokenizerI):
                 found = True
         return False
 
+    def _context_contains_sentbreak(
+        self, text: str, decisions: Dict[Tuple[str, str], bool]
+    ) -> bool:
+        """
+        Returns ``text_contains_sentbreak(text)``, reusing the decisions
+        for contexts and for pairs of adjacent words cached in ``decisions``.
+
+        The second pass only changes the annotation of the first token of
+        each pair, based on the first pass annotations of both tokens, and
+        these depend on nothing but the words themselves. So whether a word
+        is a sentence break before the word that follows it can be decided
+        once for each distinct pair of words in a text, instead of once for
+        every context the pair occurs in.
+        """
+        found = decisions.get(text)
+        if found is not None:
+            return found
+        if len(decisions) >= self._MAX_CACHED_DECISIONS:
+            decisions.clear()
+        words = [
+            word
+            for line in text.split("\n")
+            for word in self._lang_vars.word_tokenize(line)
+        ]
+        found = False
+        for pair in zip(words, words[1:]):
+            sentbreak = decisions.get(pair)
+            if sentbreak is None:
+                aug_tok1, aug_tok2 = self._Token(pair[0]), self._Token(pair[1])
+                self._first_pass_annotation(aug_tok1)
+                self._first_pass_annotation(aug_tok2)
+                self._second_pass_annotation(aug_tok1, aug_tok2)
+                sentbreak = decisions[pair] = bool(aug_tok1.sentbreak)
+            if sentbreak:
+                found = True
+                break
+        decisions[text] = found
+        return found
+
+    _MAX_CACHED_DECISIONS = 100000
+    """The maximum number of decisions for contexts and pairs of words
+    that ``_slices_from_text`` keeps for a text."""
+
+    _ANNOTATION_METHODS = (
+        "text_contains_sentbreak",
+        "_tokenize_words",
+        "_annotate_tokens",
+        "_annotate_first_pass",
+        "_annotate_second_pass",
+    )
+    """The methods ``text_contains_sentbreak`` uses that
+    ``_context_contains_sentbreak`` does not."""
+
     def sentences_from_text_legacy(self, text: str) -> Iterator[str]:
         """
         Given a text, generates the sentences in that text. Annotates all
@@ -1824,3 +1900,49 @@ def demo(text, tok_cls=PunktSentenceTokenizer, train_cls=PunktTrainer):
     sbd = tok_cls(trainer.get_params())
     for sentence in sbd.sentences_from_text(text):
         print(cleanup(sentence))
+
+
+def benchmark(size=1000000, seed=0):
+    """
+    Benchmark sentence splitting of synthetic megabyte-sized prose, logs,
+    tables and lists of URLs, comparing decisions reused across contexts
+    against tokenizing and annotating every context anew.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    vocabularies = {
+        "prose": "The cat sat on the mat . Mr. Smith , J. Bach and Dr. Who ! "
+        'It cost 3.5 dollars ( or 4 ) ... She said "no." He left ?',
+        "logs": "[INFO] [WARN] 2024-01-01T10:00:00.123 GET /a/b.html?x=1 200. "
+        "failed! (retry) done.\n v1.2.3!) ok.",
+        "tables": "| | 1.0 2.5. a. - ... x!| !| \n",
+        "urls": "http://a.b.com/x.y?q=1! www.nltk.org. foo@bar.com. see it. "
+        "file.tar.gz!)",
+    }
+    params = PunktParameters()
+    params.abbrev_types = {"mr", "dr", "e.g", "etc"}
+    params.sent_starters = {"he", "she", "it"}
+    tokenizer = PunktSentenceTokenizer(params)
+    for name, vocabulary in vocabularies.items():
+        words = vocabulary.split(" ")
+        text = " ".join(rng.choice(words) for _ in range(size // 2))[:size]
+
+        t = time.time()
+        spans = list(tokenizer.span_tokenize(text))
+        reused_time = time.time() - t
+
+        # Swap in the annotation of every context to compare against.
+        tokenizer._context_contains_sentbreak = (
+            lambda context, decisions: tokenizer.text_contains_sentbreak(context)
+        )
+        t = time.time()
+        reference = list(tokenizer.span_tokenize(text))
+        annotated_time = time.time() - t
+        del tokenizer._context_contains_sentbreak
+
+        print(f"{name}: {len(text)} characters, {len(spans)} sentences")
+        print(f"  reused decisions:    {reused_time:.3f}s")
+        print(f"  annotating contexts: {annotated_time:.3f}s")
+        print("  same sentences:", spans == reference)
@@ -19,10 +19,11 @@ and available at http://www.cis.upenn.edu/~treebank/tokenizer.sed.
 
 import re
 import warnings
+from itertools import repeat
 from typing import Iterator, List, Tuple
 
 from nltk.tokenize.api import TokenizerI
-from nltk.tokenize.destructive import MacIntyreContractions
+from nltk.tokenize.destructive import MacIntyreContractions, _apply_rules
 from nltk.tokenize.util import align_tokens
 
 
@@ -133,34 +134,25 @@ class TreebankWordTokenizer(TokenizerI):
                 stacklevel=2,
             )
 
-        for regexp, substitution in self.STARTING_QUOTES:
-            text = regexp.sub(substitution, text)
-
-        for regexp, substitution in self.PUNCTUATION:
-            text = regexp.sub(substitution, text)
+        text = _apply_rules(self.STARTING_QUOTES, text)
+        text = _apply_rules(self.PUNCTUATION, text)
 
         # Handles parentheses.
-        regexp, substitution = self.PARENS_BRACKETS
-        text = regexp.sub(substitution, text)
+        text = _apply_rules([self.PARENS_BRACKETS], text)
         # Optionally convert parentheses
         if convert_parentheses:
-            for regexp, substitution in self.CONVERT_PARENTHESES:
-                text = regexp.sub(substitution, text)
+            text = _apply_rules(self.CONVERT_PARENTHESES, text)
 
         # Handles double dash.
-        regexp, substitution = self.DOUBLE_DASHES
-        text = regexp.sub(substitution, text)
+        text = _apply_rules([self.DOUBLE_DASHES], text)
 
         # add extra space to make things easier
         text = " " + text + " "
 
-        for regexp, substitution in self.ENDING_QUOTES:
-            text = regexp.sub(substitution, text)
+        text = _apply_rules(self.ENDING_QUOTES, text)
 
-        for regexp in self.CONTRACTIONS2:
-            text = regexp.sub(r" \1 \2 ", text)
-        for regexp in self.CONTRACTIONS3:
-            text = regexp.sub(r" \1 \2 ", text)
+        text = _apply_rules(zip(self.CONTRACTIONS2, repeat(r" \1 \2 ")), text)
+        text = _apply_rules(zip(self.CONTRACTIONS3, repeat(r" \1 \2 ")), text)
 
         # We are not using CONTRACTIONS4 since
         # they are also commented out in the SED scripts
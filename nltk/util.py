@@ -7,13 +7,17 @@
 # For license information, see LICENSE.TXT
 import inspect
 import locale
+import multiprocessing
 import os
 import pydoc
 import re
+import sys
 import textwrap
+import threading
 import unicodedata
 import warnings
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from itertools import chain, combinations, islice, tee
 from pprint import pprint
 from urllib.request import (
@@ -1297,10 +1301,84 @@ def pairwise(iterable):
 
 
 def parallelize_preprocess(func, iterator, processes, progress_bar=False):
-    from joblib import Parallel, delayed
+    """
+    Apply ``func`` to each item of ``iterator`` with `parallel_imap`,
+    optionally showing a ``tqdm`` progress bar.  Kept for the command-line
+    interface and existing callers; new code should use `parallel_imap`.
+    """
     from tqdm import tqdm
 
     iterator = tqdm(iterator) if progress_bar else iterator
+    return parallel_imap(func, iterator, processes)
+
+
+def parallel_imap(function, iterable, processes=1, chunksize=100):
+    """
+    Lazily yield ``function(item)`` for each item of ``iterable``, in order.
+
+    With more than one process, chunks of ``chunksize`` items are handed to
+    worker processes.  On Linux, when this process runs no other threads,
+    workers are forked, so they share ``function`` -- and the models or
+    other data it refers to -- with this process instead of each getting a
+    copy.  Elsewhere (forking is unsafe on macOS, and in threaded processes)
+    the platform's default start method is used; ``function`` must then be
+    picklable, and is sent to each worker once.  Only
+    ``2 * processes`` chunks are pending at any time, so ``iterable`` can
+    be a long stream.
+
+        >>> from nltk.util import parallel_imap
+        >>> list(parallel_imap(len, ["a", "bb", "ccc"], processes=2, chunksize=2))
+        [1, 2, 3]
+
+    :param function: the function to apply to each item
+    :param iterable: the items, such as a stream of documents
+    :param processes: the number of worker processes; with one process
+        (or fewer) ``function`` is applied in this process
+    :param chunksize: the number of items sent to a worker at once
+    :rtype: iter
+    """
     if processes <= 1:
-        return map(func, iterator)
-    return Parallel(n_jobs=processes)(delayed(func)(line) for line in iterator)
+        yield from map(function, iterable)
+        return
+
+    with ProcessPoolExecutor(
+        processes,
+        mp_context=_fork_context(),
+        initializer=_init_parallel_worker,
+        initargs=(function,),
+    ) as executor:
+        pending = deque()
+        iterable = iter(iterable)
+        while True:
+            chunk = list(islice(iterable, chunksize))
+            if not chunk:
+                break
+            pending.append(executor.submit(_apply_to_chunk, chunk))
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _fork_context():
+    """
+    Return the "fork" multiprocessing context if `parallel_imap` can safely
+    fork workers, or None to use the platform's default start method.
+    """
+    if sys.platform.startswith("linux") and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    return None
+
+
+# The function applied by `parallel_imap` in each worker process.
+_worker_function = None
+
+
+def _init_parallel_worker(function):
+    global _worker_function
+    _worker_function = function
+
+
+def _apply_to_chunk(items):
+    """Apply the worker's function to a chunk of items."""
+    return [_worker_function(item) for item in items]